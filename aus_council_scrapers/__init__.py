@@ -1 +1,12 @@
-from aus_council_scrapers.scrapers import *
+def __getattr__(name):
+    # Importing the package used to import every scraper, which built every
+    # scraper. They load on demand now (see `ScraperRegistry`), but scraper
+    # classes stay reachable here for code that looked them up this way.
+    # Anything else falls through, so `from aus_council_scrapers import
+    # clock` still finds the submodule without loading any scraper.
+    if name.endswith("Scraper"):
+        import aus_council_scrapers.scrapers as scrapers
+
+        if hasattr(scrapers, name):
+            return getattr(scrapers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
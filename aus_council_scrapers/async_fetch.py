@@ -0,0 +1,213 @@
+"""An asyncio fetcher, so a whole run can share one event loop.
+
+`DefaultFetcher` blocks a thread for every request and for every throttle
+sleep between requests to the same host. Across a full run that is most of
+the wall time: six worker threads, each parked in `requests.Session.get` or
+in `time.sleep`, while hundreds of requests to *other* hosts wait for a
+thread to come free.
+
+`AsyncFetcher` keeps the same contract — per-host spacing, retries with
+exponential backoff honouring `Retry-After`, `BlockedByWAF` on 403 — but
+waits on awaitable timers, so an in-flight request costs a coroutine rather
+than a thread. Only `afetch_with_requests` is native; the blocking methods
+delegate to a `DefaultFetcher`, and both draw on the same per-host budget,
+so a scraper that mixes the two paths is still spaced correctly. Plain GETs
+go through the same conditional-request cache as well (see `http_cache`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from aus_council_scrapers.base import (
+    BlockedByWAF,
+    DefaultFetcher,
+    Fetcher,
+    _retry_delay,
+)
+from aus_council_scrapers.http_cache import HttpCache, default_cache
+from aus_council_scrapers.metrics import FetchMetrics, default_metrics
+from aus_council_scrapers.ratelimit import HostScheduler, host_of, shared_scheduler
+
+# The requests keyword arguments scrapers pass, and their aiohttp names.
+_PASSTHROUGH_KWARGS = frozenset({"params", "data", "json", "headers"})
+
+
+def _aiohttp_kwargs(kwargs: dict) -> dict:
+    translated = {}
+    for name, value in kwargs.items():
+        if name in _PASSTHROUGH_KWARGS:
+            translated[name] = value
+        elif name == "timeout":
+            translated["timeout"] = aiohttp.ClientTimeout(total=value)
+        else:
+            raise TypeError(f"AsyncFetcher does not support the {name!r} argument")
+    return translated
+
+
+def _as_requests_response(url: str, status: int, reason, headers, body: bytes):
+    """Wrap a body in a `requests.Response` so it decodes exactly as live.
+
+    requests picks the text encoding from the headers, falling back to
+    detecting it from the bytes. Reusing that logic rather than aiohttp's
+    keeps the two engines returning identical strings, which is what lets a
+    cassette recorded by one replay against the other.
+    """
+    response = requests.models.Response()
+    response.status_code = status
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response._content = body
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+class AsyncFetcher(Fetcher):
+    """Live fetcher for the async engine, throttled per host.
+
+    Pass `session` to share one connection pool across every fetcher in a
+    run; otherwise one is opened on first use and closed by `aclose()`.
+    Requests are recorded in `metrics` under `council`, and plain GETs
+    cached in `cache` (or `default_cache()`), as by `DefaultFetcher`.
+    """
+
+    concurrency = DefaultFetcher.concurrency
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        fetch_delay: Optional[float] = None,
+        metrics: Optional[FetchMetrics] = None,
+        council: Optional[str] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        scheduler = (
+            shared_scheduler() if fetch_delay is None else HostScheduler(fetch_delay)
+        )
+        self.council = council
+        self.__metrics = metrics if metrics is not None else default_metrics()
+        self.__fetch_delay = scheduler.interval
+        self.__scheduler = scheduler
+        self.__cache = cache
+        self.__sync = DefaultFetcher(
+            scheduler=scheduler, cache=cache, metrics=self.__metrics, council=council
+        )
+        self.__session = session
+        self.__owns_session = session is None
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def scheduler(self) -> HostScheduler:
+        return self.__scheduler
+
+    @staticmethod
+    def open_session() -> aiohttp.ClientSession:
+        """A session sending the same headers as `DefaultFetcher`."""
+        return aiohttp.ClientSession(headers=DefaultFetcher.DEFAULTHEADERS)
+
+    async def afetch_with_requests(self, url, method="GET", **kwargs):
+        cache = self.__cache if self.__cache is not None else default_cache()
+        if cache is None or method.upper() != "GET":
+            return (await self.__request(url, method, **kwargs)).text
+
+        # As in DefaultFetcher, but the cache's disk reads and writes are
+        # done off the loop.
+        key = cache.key(url, kwargs)
+        entry = await asyncio.to_thread(cache.lookup, key)
+        if entry is not None and cache.is_fresh(entry):
+            cache.record(hit=True)
+            return entry.body
+
+        if entry is not None:
+            headers = {**(kwargs.get("headers") or {}), **entry.validators()}
+            kwargs = {**kwargs, "headers": headers}
+
+        response = await self.__request(url, method, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.record(hit=True)
+            await asyncio.to_thread(cache.refresh, key, entry, response.headers)
+            return entry.body
+
+        cache.record(hit=False)
+        await asyncio.to_thread(cache.store, key, url, response.text, response.headers)
+        return response.text
+
+    async def __request(self, url, method, **kwargs) -> requests.Response:
+        if self.__session is None:
+            self.__session = self.open_session()
+
+        request_kwargs = _aiohttp_kwargs(kwargs)
+        host = host_of(url)
+        last_error = None
+        for attempt in range(DefaultFetcher.MAX_RETRIES):
+            wait = self.__scheduler.reserve(url)
+            self.__metrics.throttled(host, self.council, wait)
+            await asyncio.sleep(wait)
+            started = time.monotonic()
+            try:
+                async with self.__session.request(
+                    method.upper(), url, **request_kwargs
+                ) as raw:
+                    body = await raw.read()
+                    response = _as_requests_response(
+                        str(raw.url), raw.status, raw.reason, raw.headers, body
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                elapsed = time.monotonic() - started
+                self.__metrics.request(host, self.council, "error", elapsed)
+                raise
+            self.__metrics.request(
+                host, self.council, raw.status, time.monotonic() - started, len(body)
+            )
+
+            if response.status_code not in DefaultFetcher.RETRY_STATUSES:
+                response.raise_for_status()
+                return response
+
+            last_error = requests.HTTPError(
+                f"{response.status_code} for {url}", response=response
+            )
+            if response.status_code == 403:
+                # As in DefaultFetcher: a WAF block is not transient, and not
+                # something to engineer around.
+                last_error = BlockedByWAF(url)
+                break
+            if attempt < DefaultFetcher.MAX_RETRIES - 1:
+                delay = _retry_delay(
+                    response.headers.get("Retry-After"), self.__fetch_delay, attempt
+                )
+                self.__logger.warning(
+                    f"{response.status_code} from {url} — backing off {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{DefaultFetcher.MAX_RETRIES})"
+                )
+                self.__metrics.retry(host, self.council, delay)
+                await asyncio.sleep(delay)
+
+        raise last_error
+
+    def fetch_with_requests(self, url, method="GET", **kwargs):
+        return self.__sync.fetch_with_requests(url, method, **kwargs)
+
+    def get_selenium_driver(self):
+        return self.__sync.get_selenium_driver()
+
+    def fetch_with_selenium(self, url, wait_time=10, wait_condition=None):
+        return self.__sync.fetch_with_selenium(url, wait_time, wait_condition)
+
+    async def aclose(self) -> None:
+        if self.__owns_session and self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+        self.close()
+
+    def close(self) -> None:
+        self.__sync.close()
@@ -1,31 +1,42 @@
+import asyncio
 import datetime
+import importlib
 import json
 import logging
 import os
-import random
 import re
+import sys
 import time
 import urllib.parse
 from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
-import pytz
 import requests
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from bs4 import BeautifulSoup, SoupStrainer
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 
-from aus_council_scrapers import clock
+from aus_council_scrapers import clock, dates
 from aus_council_scrapers.constants import (
     COUNCIL_HOUSING_REGEX,
     DATE_REGEX,
     EARLIEST_YEAR,
     TIME_REGEX,
-    TIMEZONES_BY_STATE,
 )
+from aus_council_scrapers.driver_pool import DriverLease, DriverPool, shared_driver_pool
+from aus_council_scrapers.http_cache import HttpCache, default_cache
+from aus_council_scrapers.metrics import FetchMetrics, default_metrics
+from aus_council_scrapers.ratelimit import (
+    DEFAULT_FETCH_DELAY,
+    HostScheduler,
+    default_fetch_delay,
+    host_of,
+    shared_scheduler,
+)
+from aus_council_scrapers.soup import make_soup
 
 
 USER_AGENT_ISSUE = (
@@ -55,11 +66,20 @@ class BlockedByWAF(requests.HTTPError):
 
 
 def register_scraper(cls):
-    SCRAPER_REGISTRY[cls.__name__] = cls()
+    SCRAPER_REGISTRY.register(cls)
     return cls
 
 
-@dataclass
+def _interned(value):
+    """One shared copy of a string many meetings repeat.
+
+    Also turns a BeautifulSoup `NavigableString`, which keeps its whole
+    parse tree alive, into a plain `str`.
+    """
+    return sys.intern(str(value)) if isinstance(value, str) else value
+
+
+@dataclass(slots=True, eq=False)
 class ScraperReturn:
     """Designates what a scraper should return.\n
     If a given item in the scraper is None, it will be skipped.\n
@@ -92,13 +112,21 @@ class ScraperReturn:
     _cleaned_time: Optional[datetime.time] = None
     _cleaned_date: Optional[datetime.date] = None
 
+    def __post_init__(self):
+        # A full-history run holds tens of thousands of these, and a
+        # council's meetings mostly share their name, time, place and page.
+        self.name = _interned(self.name)
+        self.time = _interned(self.time)
+        self.location = _interned(self.location)
+        self.webpage_url = _interned(self.webpage_url)
+
     @property
     def cleaned_time(self) -> Optional[datetime.time]:
         try:
             if not self.time:
                 return None
             if not self._cleaned_time:
-                self._cleaned_time = parse_date(self.time, fuzzy=True).time()
+                self._cleaned_time = dates.parse_time(self.time)
             return self._cleaned_time
         except Exception as e:
             return None
@@ -108,11 +136,10 @@ class ScraperReturn:
         if not self.date:
             raise ValueError("Date is required")
 
-        try:
-            if not self._cleaned_date:
-                self._cleaned_date = parse_date(self.date, fuzzy=True).date()
-        except Exception as e:
-            raise ValueError(f"Could not parse date {self.date}")
+        if not self._cleaned_date:
+            self._cleaned_date = dates.parse_date(self.date)
+            if self._cleaned_date is None:
+                raise ValueError(f"Could not parse date {self.date}")
 
         return self._cleaned_date
 
@@ -166,9 +193,7 @@ class ScraperReturn:
             self.location = default_location
 
     def is_date_in_past(self, state: str) -> bool:
-        timezone = pytz.timezone(TIMEZONES_BY_STATE[state.upper()])
-        today = datetime.datetime.now(timezone).date()
-        return self.cleaned_date < today
+        return self.cleaned_date < dates.today_in(state)
 
     def __str__(self):
         return json.dumps(self.to_dict(), indent=2)
@@ -185,7 +210,26 @@ class ScraperReturn:
         """
         if not isinstance(other, ScraperReturn):
             return NotImplemented
-        return self.to_dict() == other.to_dict()
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        # Like any key, a result must not be changed while a set holds it.
+        return hash(self._fields())
+
+    def _fields(self) -> tuple:
+        """The fields `to_dict` writes, in a fixed order."""
+        return (
+            self.name,
+            self.date,
+            self.time,
+            self.location,
+            self.webpage_url,
+            self.download_url,
+            self.agenda_url,
+            self.minutes_url,
+            self.agenda_html_url,
+            self.minutes_html_url,
+        )
 
     def to_dict(self):
         return {
@@ -226,6 +270,11 @@ class ScraperReturn:
 
 
 class Fetcher(ABC):
+    # How many of one scraper's requests `BaseScraper.fetch_many` may have in
+    # flight at once. One keeps them strictly in call order, which is what
+    # recording and playback rely on.
+    concurrency: int = 1
+
     @abstractmethod
     def get_selenium_driver(self):
         raise NotImplementedError()
@@ -234,6 +283,15 @@ class Fetcher(ABC):
     def fetch_with_requests(self, url, method="GET", **kwargs) -> str:
         raise NotImplementedError()
 
+    async def afetch_with_requests(self, url, method="GET", **kwargs) -> str:
+        """Awaitable `fetch_with_requests`, for scrapers ported to `ascraper`.
+
+        Fetchers with a native asyncio path override this. The default runs
+        the blocking fetch on a worker thread, so every fetcher — including
+        the record and playback ones — can serve a ported scraper.
+        """
+        return await asyncio.to_thread(self.fetch_with_requests, url, method, **kwargs)
+
     @abstractmethod
     def fetch_with_selenium(self, url, wait_time=10, wait_condition=None):
         raise NotImplementedError()
@@ -251,6 +309,16 @@ class Fetcher(ABC):
         pass
 
 
+def _retry_delay(retry_after: Optional[str], fetch_delay: float, attempt: int) -> float:
+    """How long to back off before retrying, honouring `Retry-After`."""
+    if retry_after:
+        try:
+            return min(float(retry_after), 120.0)
+        except ValueError:
+            pass
+    return min(fetch_delay * (2**attempt), 60.0)
+
+
 class DefaultFetcher(Fetcher):
     """Live fetcher, throttled per host.
 
@@ -262,50 +330,76 @@ class DefaultFetcher(Fetcher):
     backoff honouring `Retry-After`.
 
     The delay is keyed by host, so scraping different councils concurrently
-    is unaffected.
+    is unaffected. Fetchers built without an explicit `fetch_delay` share
+    one process-wide budget per host (see `ratelimit`), so councils on the
+    same platform host are spaced against each other as well.
+
+    Plain GETs go through the on-disk conditional-request cache when one is
+    configured (see `http_cache`); a page that has not changed costs a 304
+    instead of its whole body.
+
+    Every request, page load, throttle wait and backoff is recorded in
+    `metrics` (see `metrics`) under `council`, the scraper it fetches for.
     """
 
-    DEFAULT_FETCH_DELAY = 2.0
+    DEFAULT_FETCH_DELAY = DEFAULT_FETCH_DELAY
+    # Requests still wait their turn in the host's budget; overlapping them
+    # only hides each response's latency behind the next one's wait.
+    concurrency = 4
     MAX_RETRIES = 4
     RETRY_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
 
-    def __init__(self, fetch_delay: Optional[float] = None):
+    def __init__(
+        self,
+        fetch_delay: Optional[float] = None,
+        scheduler: Optional[HostScheduler] = None,
+        cache: Optional[HttpCache] = None,
+        driver_pool: Optional[DriverPool] = None,
+        metrics: Optional[FetchMetrics] = None,
+        council: Optional[str] = None,
+    ):
+        self.council = council
+        self.__metrics = metrics if metrics is not None else default_metrics()
         self.__session = requests.Session()
+        self.__cache = cache
         self.__set_headers(self.DEFAULTHEADERS)
-        self.__driver = None
-        self.__last_request_at: dict[str, float] = {}
+        self.__driver_pool = driver_pool
+        self.__lease: Optional[DriverLease] = None
         self.__logger = logging.getLogger(self.__class__.__name__)
 
-        if fetch_delay is None:
-            fetch_delay = float(
-                os.environ.get("FETCH_DELAY", self.DEFAULT_FETCH_DELAY)
+        # Without an explicit delay, share the process-wide per-host budget
+        # so scrapers on one host are spaced against each other too.
+        if scheduler is None:
+            scheduler = (
+                shared_scheduler()
+                if fetch_delay is None
+                else HostScheduler(fetch_delay)
             )
-        self.__fetch_delay = fetch_delay
+        self.__fetch_delay = scheduler.interval
+        self.__scheduler = scheduler
 
-    def __throttle(self, url: str) -> None:
-        """Space out consecutive requests to the same host."""
-        if self.__fetch_delay <= 0:
-            return
+    @classmethod
+    def default_fetch_delay(cls) -> float:
+        return default_fetch_delay()
 
-        host = urllib.parse.urlparse(url).netloc
-        last = self.__last_request_at.get(host)
-        if last is not None:
-            # Jitter so a long run of requests is not perfectly periodic.
-            wait = self.__fetch_delay * random.uniform(0.75, 1.25) - (
-                time.monotonic() - last
-            )
-            if wait > 0:
-                time.sleep(wait)
-        self.__last_request_at[host] = time.monotonic()
+    @property
+    def scheduler(self) -> HostScheduler:
+        return self.__scheduler
+
+    @property
+    def metrics(self) -> FetchMetrics:
+        return self.__metrics
+
+    def __throttle(self, url: str) -> None:
+        """Wait for this host's next slot in the shared budget."""
+        wait = self.__scheduler.reserve(url)
+        if wait > 0:
+            self.__metrics.throttled(host_of(url), self.council, wait)
+            time.sleep(wait)
 
     def __backoff(self, response, attempt: int) -> float:
         retry_after = response.headers.get("Retry-After") if response else None
-        if retry_after:
-            try:
-                return min(float(retry_after), 120.0)
-            except ValueError:
-                pass
-        return min(self.__fetch_delay * (2**attempt), 60.0)
+        return _retry_delay(retry_after, self.__fetch_delay, attempt)
 
     DEFAULTHEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.62 Safari/537.3",
@@ -327,38 +421,73 @@ class DefaultFetcher(Fetcher):
         self.__session.headers.clear()
         self.__session.headers.update(headers)
 
-    def __setup_selenium_driver(self):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        # Suppress automation signals that bot-detection (e.g. Akamai) checks for
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        self.__driver = webdriver.Chrome(options=chrome_options)
-        self.__driver.execute_cdp_cmd(
-            "Page.addScriptToEvaluateOnNewDocument",
-            {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            },
-        )
-
     def get_selenium_driver(self):
-        if not self.__driver:
-            self.__setup_selenium_driver()
-        return self.__driver
+        """The driver leased to this fetcher, leasing one on first use.
+
+        The lease is held until `close()`, so a scraper that drives the page
+        across several calls keeps one browser and its cookies throughout.
+        """
+        if self.__lease is None:
+            pool = self.__driver_pool or shared_driver_pool()
+            self.__lease = pool.acquire()
+        return self.__lease.driver
+
+    def __release_driver(self) -> None:
+        lease, self.__lease = self.__lease, None
+        if lease is not None:
+            (self.__driver_pool or shared_driver_pool()).release(lease)
 
     def fetch_with_requests(self, url, method="GET", **kwargs):
+        cache = self.__cache if self.__cache is not None else default_cache()
+        if cache is None or method.upper() != "GET":
+            return self.__request(url, method, **kwargs).text
+
+        key = cache.key(url, kwargs)
+        entry = cache.lookup(key)
+        if entry is not None and cache.is_fresh(entry):
+            cache.record(hit=True)
+            return entry.body
+
+        if entry is not None:
+            headers = {**(kwargs.get("headers") or {}), **entry.validators()}
+            kwargs = {**kwargs, "headers": headers}
+
+        response = self.__request(url, method, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.record(hit=True)
+            cache.refresh(key, entry, response.headers)
+            return entry.body
+
+        cache.record(hit=False)
+        cache.store(key, url, response.text, response.headers)
+        return response.text
+
+    def __request(self, url, method, **kwargs) -> requests.Response:
+        host = host_of(url)
         last_error = None
         for attempt in range(self.MAX_RETRIES):
             self.__throttle(url)
-            if method.upper() == "POST":
-                response = self.__session.post(url, **kwargs)
-            else:
-                response = self.__session.get(url, **kwargs)
+            started = time.monotonic()
+            try:
+                if method.upper() == "POST":
+                    response = self.__session.post(url, **kwargs)
+                else:
+                    response = self.__session.get(url, **kwargs)
+            except requests.RequestException:
+                elapsed = time.monotonic() - started
+                self.__metrics.request(host, self.council, "error", elapsed)
+                raise
+            self.__metrics.request(
+                host,
+                self.council,
+                response.status_code,
+                time.monotonic() - started,
+                len(response.content),
+            )
 
             if response.status_code not in self.RETRY_STATUSES:
                 response.raise_for_status()
-                return response.text
+                return response
 
             last_error = requests.HTTPError(
                 f"{response.status_code} for {url}", response=response
@@ -376,22 +505,44 @@ class DefaultFetcher(Fetcher):
                     f"{response.status_code} from {url} — backing off {delay:.1f}s "
                     f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
                 )
+                self.__metrics.retry(host, self.council, delay)
                 time.sleep(delay)
 
         raise last_error
 
     def fetch_with_selenium(self, url, wait_time=10, wait_condition=None):
-        if not self.__driver:
-            self.__setup_selenium_driver()
+        driver = self.get_selenium_driver()
         self.__throttle(url)
-        self.__driver.get(url)
-        if wait_condition:
-            WebDriverWait(self.__driver, wait_time).until(wait_condition)
-        return self.__driver.page_source
+        self.__lease.pages += 1
+        started = time.monotonic()
+        try:
+            driver.get(url)
+            if wait_condition:
+                WebDriverWait(driver, wait_time).until(wait_condition)
+            page = driver.page_source
+            self.__metrics.selenium_page(
+                host_of(url), self.council, time.monotonic() - started
+            )
+            return page
+        except TimeoutException:
+            # The page was slow, not the browser broken.
+            self.__metrics.selenium_page(
+                host_of(url), self.council, time.monotonic() - started, ok=False
+            )
+            raise
+        except WebDriverException:
+            self.__metrics.selenium_page(
+                host_of(url), self.council, time.monotonic() - started, ok=False
+            )
+            # A dead or wedged Chrome: hand it back to be replaced rather
+            # than fail every later page on it.
+            self.__lease.broken = True
+            self.__release_driver()
+            raise
 
     def close(self) -> None:
-        if self.__driver:
-            self.__driver.quit()
+        """Return the Selenium driver, if one was leased, to the pool."""
+        self.__release_driver()
 
 
 class BaseScraper(ABC):
@@ -411,12 +562,13 @@ class BaseScraper(ABC):
 
     Methods:
         `fetcher.set_headers(headers)`: Sets the headers for the session.
-        `fetcher.setup_selenium_driver()`: Sets up a Selenium WebDriver instance.
-        `fetcher.get_selenium_driver()`: Returns the Selenium WebDriver instance, setting it up if necessary.
+        `fetcher.get_selenium_driver()`: Returns the Selenium WebDriver leased to the fetcher, leasing one from the shared pool if necessary.
         `fetcher.fetch_with_requests(url, method="GET", **kwargs)`: Fetches a URL with the requests module.
         `fetcher.fetch_with_selenium(url, wait_time=10, wait_condition=None)`: Fetches a URL with Selenium, optionally waiting for a condition.
-        `scraper()`: Abstract method for scraping the council's website. Must be implemented by subclasses.
-        `close()`: Closes the Selenium WebDriver instance if it exists.
+        `scraper()`: Every meeting listed on the council's website. Subclasses implement this or `iter_meetings()`.
+        `iter_meetings()`: The same meetings newest first, as they are found, so a caller can stop early.
+        `soup(markup, only=None)`: Parses a page, optionally building only the elements matching `only`.
+        `fetcher.close()`: Returns the leased Selenium WebDriver to the pool, if there is one.
     """
 
     def __init__(
@@ -435,15 +587,183 @@ class BaseScraper(ABC):
         self.time_regex: re.Pattern = TIME_REGEX
         self.date_regex: re.Pattern = DATE_REGEX
         self.keyword_regexes: list[re.Pattern] = COUNCIL_HOUSING_REGEX
-        self.fetcher = DefaultFetcher()
+        self.fetcher = DefaultFetcher(council=council_name)
+        # A `history.CouncilHistory`, set by `main`: which periods of the
+        # listing are closed and need not be fetched again.
+        self.history = None
 
         self.default_name: str = f"{self.council_name.capitalize()} Council Meeting"
         self.default_time: Optional[str] = None
         self.default_location: Optional[str] = None
 
-    @abstractmethod
     def scraper(self) -> list[ScraperReturn]:
-        raise NotImplementedError("Scrape method must be implemented by the subclass.")
+        if type(self).iter_meetings is BaseScraper.iter_meetings:
+            raise NotImplementedError(
+                "Scrape method must be implemented by the subclass."
+            )
+        return list(self.iter_meetings())
+
+    def iter_meetings(self) -> Iterator[ScraperReturn]:
+        """Meetings newest first, yielded as pages are parsed.
+
+        Legacy mode wants only the newest meeting, so a scraper that can
+        read its listing newest first should override this and fetch each
+        page only when the caller asks for more; `scraper()` then lists
+        everything through it. The default sorts `scraper()`, which still
+        fetches every page.
+        """
+        if type(self).scraper is BaseScraper.scraper:
+            raise NotImplementedError(
+                "Scrape method must be implemented by the subclass."
+            )
+        yield from newest_first(self.scraper())
+
+    async def ascraper(self) -> list[ScraperReturn]:
+        """Asyncio counterpart of `scraper()`, used by ``--engine async``.
+
+        A scraper is ported by overriding this and fetching through
+        `self.fetcher.afetch_with_requests`. The default runs `scraper()` on a
+        worker thread, so unported scrapers keep working unchanged.
+        """
+        return await asyncio.to_thread(self.scraper)
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        parse: Optional[Callable[[str, str], Any]] = None,
+        return_exceptions: bool = False,
+    ) -> list:
+        """Fetch several pages concurrently, returning them in input order.
+
+        Year pages and event pages used to be fetched one after another, so a
+        scraper took (pages × FETCH_DELAY) plus every response's latency. Up
+        to `fetcher.concurrency` requests are now in flight at once; each
+        still waits for its host's turn in the shared rate budget, so the
+        council sees no more traffic than before, but latency overlaps the
+        waits.
+
+        `parse(url, body)`, when given, runs on this thread as each page
+        lands, and its return value takes the page's place. With
+        `return_exceptions`, a failed fetch or parse leaves its exception in
+        that slot instead of abandoning the rest.
+        """
+        urls = list(urls)
+        results: list = [None] * len(urls)
+
+        def land(index: int, fetch: Callable[[], str]) -> None:
+            try:
+                body = fetch()
+                results[index] = parse(urls[index], body) if parse else body
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+
+        workers = min(self.fetcher.concurrency, len(urls))
+        if workers <= 1:
+            for index, url in enumerate(urls):
+                land(index, lambda: self.fetcher.fetch_with_requests(url))
+            return results
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.fetcher.fetch_with_requests, url): index
+                for index, url in enumerate(urls)
+            }
+            try:
+                for future in as_completed(futures):
+                    land(futures[future], future.result)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return results
+
+    async def afetch_many(
+        self,
+        urls: Iterable[str],
+        parse: Optional[Callable[[str, str], Any]] = None,
+        return_exceptions: bool = False,
+    ) -> list:
+        """Awaitable `fetch_many`, for scrapers ported to `ascraper`."""
+        urls = list(urls)
+        in_flight = asyncio.Semaphore(max(1, self.fetcher.concurrency))
+
+        async def one(url: str):
+            try:
+                async with in_flight:
+                    body = await self.fetcher.afetch_with_requests(url)
+                return parse(url, body) if parse else body
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        # gather() would also hand back BaseExceptions such as a cassette
+        # miss; catching Exception in `one` lets those propagate.
+        return list(await asyncio.gather(*(one(url) for url in urls)))
+
+    def closed_period(self, period: str) -> Optional[list[ScraperReturn]]:
+        """The stored meetings of a closed period of the listing, or None.
+
+        A period is whatever the listing is split into: a year, a page.
+        Scrapers ask before fetching one and, when this returns meetings,
+        use them instead. Always None without a `history`.
+        """
+        if self.history is None:
+            return None
+        return self.history.closed(period)
+
+    def record_period(
+        self, period: str, meetings: list[ScraperReturn], ends: datetime.date
+    ) -> None:
+        """Tell the `history` what a fetched period held and when it ended."""
+        if self.history is not None:
+            self.history.record(period, meetings, ends)
+
+    def soup(
+        self,
+        markup: Union[str, bytes],
+        only: Union[str, SoupStrainer, None] = None,
+    ) -> BeautifulSoup:
+        """Parse a fetched page, with lxml when it is installed (see `soup`).
+
+        `only` builds just the elements a scraper reads - "table#grdMenu",
+        "div.meeting-row", or any SoupStrainer - which saves the time and
+        memory of building the rest of the page. Everything the scraper
+        finds must then be inside them.
+        """
+        return make_soup(markup, only)
+
+    @property
+    def host(self) -> str:
+        """The host most of this scraper's requests go to.
+
+        `main` uses it to avoid running two scrapers against one host at
+        once. Override when the meetings live off the council's own site.
+        """
+        return host_of(self.base_url)
+
+    @property
+    def supports_async(self) -> bool:
+        """True when this scraper has its own `ascraper`."""
+        return type(self).ascraper is not BaseScraper.ascraper
+
+
+def newest_first(results: Iterable[ScraperReturn]) -> list[ScraperReturn]:
+    """`results` sorted by meeting date, newest first, keeping ties in order.
+
+    Meetings whose date cannot be parsed go last.
+    """
+
+    def meeting_date(result: ScraperReturn) -> datetime.date:
+        try:
+            return result.cleaned_date
+        except ValueError:
+            return datetime.date.min
+
+    return sorted(results, key=meeting_date, reverse=True)
 
 
 _DOCUMENT_FIELDS = ("agenda_url", "minutes_url", "agenda_html_url", "minutes_html_url")
@@ -498,169 +818,232 @@ class InfoCouncilScraper(BaseScraper):
         self.infocouncil_url = infocouncil_url
         super().__init__(council, state, base_url)
 
+    @property
+    def host(self) -> str:
+        return host_of(self.infocouncil_url)
+
     def scraper(self) -> list[ScraperReturn]:
         """
         Scrape InfoCouncil meeting data.
         Attempts to fetch meetings from multiple years by trying year query parameters.
         """
+        years = list(self._years_to_try())
+        stored = self._closed_years(years)
+        year_of = {self._year_url(y): y for y in years if y not in stored}
+        pages = self.fetch_many(
+            year_of,
+            parse=lambda url, page: self._read_year_page(page, year_of[url]),
+            return_exceptions=True,
+        )
+        return self._finish(self._collect_years(years, stored, year_of, pages))
+
+    async def ascraper(self) -> list[ScraperReturn]:
+        years = list(self._years_to_try())
+        stored = self._closed_years(years)
+        year_of = {self._year_url(y): y for y in years if y not in stored}
+        pages = await self.afetch_many(
+            year_of,
+            parse=lambda url, page: self._read_year_page(page, year_of[url]),
+            return_exceptions=True,
+        )
+        return self._finish(self._collect_years(years, stored, year_of, pages))
+
+    def iter_meetings(self) -> Iterator[ScraperReturn]:
+        """Newest year first, fetching each year's page only when needed.
+
+        `scraper()` still fetches every year at once, which is quicker when
+        the whole history is wanted.
+        """
+        if type(self).scraper is not InfoCouncilScraper.scraper:
+            # The subclass reworks the listing (extra archive pages, date
+            # fixes); only its own `scraper()` gets that right.
+            yield from newest_first(self.scraper())
+            return
+        for year in sorted(self._years_to_try(), reverse=True):
+            meetings = self.closed_period(str(year))
+            if meetings is None:
+                try:
+                    page = self.fetcher.fetch_with_requests(self._year_url(year))
+                    meetings = self._read_year_page(page, year)
+                except Exception as e:
+                    self.logger.debug(f"Failed to fetch meetings for year {year}: {e}")
+                    continue
+            yield from newest_first(_merge_split_meetings(meetings))
+
+    def _closed_years(self, years) -> dict[int, list[ScraperReturn]]:
+        stored = {}
+        for year in years:
+            meetings = self.closed_period(str(year))
+            if meetings is not None:
+                stored[year] = meetings
+        return stored
+
+    def _read_year_page(self, page: str, year: int) -> list[ScraperReturn]:
+        meetings = self._parse_year_page(page, year)
+        self.record_period(str(year), meetings, datetime.date(year, 12, 31))
+        return meetings
+
+    def _collect_years(self, years, stored, year_of, pages) -> list[ScraperReturn]:
+        fetched = dict(zip(year_of.values(), pages))
         results = []
+        for year in years:
+            page = stored[year] if year in stored else fetched[year]
+            if isinstance(page, Exception):
+                # Log but continue with the other years
+                self.logger.debug(f"Failed to fetch meetings for year {year}: {page}")
+                continue
+            results.extend(page)
+        return results
 
+    def _years_to_try(self):
         # Try from EARLIEST_YEAR to current year + 2 (meetings published up to 2 years in advance)
         # InfoCouncil sites may support ?year=YYYY parameter
         current_year = clock.current_year()
         years_filter = getattr(self, "years_filter", None)
         if years_filter:
-            years_to_try = sorted(years_filter)
-        else:
-            years_to_try = range(EARLIEST_YEAR, current_year + 3)
+            return sorted(years_filter)
+        return range(EARLIEST_YEAR, current_year + 3)
+
+    def _year_url(self, year: int) -> str:
+        return f"{self.infocouncil_url}?year={year}"
+
+    def _parse_year_page(self, output: str, year: int) -> list[ScraperReturn]:
+        # Only the listing is read, so only the listing is built: the grid,
+        # or the meeting rows of the redesigned template when a page has no
+        # grid at all.
+        only = "table#grdMenu" if "grdMenu" in output else "div.meeting-row"
+        soup = self.soup(output, only=only)
+        meeting_table = soup.find("table", id="grdMenu", recursive=True)
+
+        if meeting_table is None:
+            # InfoCouncil is rolling out a redesigned template that drops
+            # table#grdMenu for a div layout. Fall back to that before
+            # giving up on the year.
+            if only != "div.meeting-row":
+                soup = self.soup(output, only="div.meeting-row")
+            return self._scrape_responsive_rows(soup, year)
 
-        for year in years_to_try:
-            year_url = f"{self.infocouncil_url}?year={year}"
-            try:
-                output = self.fetcher.fetch_with_requests(year_url)
-                soup = BeautifulSoup(output, "html.parser")
-                meeting_table = soup.find("table", id="grdMenu", recursive=True)
-
-                if meeting_table is None:
-                    # InfoCouncil is rolling out a redesigned template that drops
-                    # table#grdMenu for a div layout. Fall back to that before
-                    # giving up on the year.
-                    results.extend(self._scrape_responsive_rows(soup, year))
-                    continue
+        results = []
 
-                # Get all meeting rows
-                meeting_rows = meeting_table.find("tbody").find_all("tr")
-
-                # Process each meeting row
-                for current_meeting in meeting_rows:
-                    # Look for agenda PDF link.
-                    #
-                    # Search inside the agenda cell, not the whole row. Minutes
-                    # links carry the same bpsGridPDFLink class, so searching
-                    # the row meant a meeting with minutes but no agenda stored
-                    # its minutes PDF as the agenda — inventing an agenda that
-                    # does not exist. That affected 76 meetings across ten
-                    # councils.
-                    agenda_cell = current_meeting.find("td", class_="bpsGridAgenda")
-                    agenda_link = (
-                        agenda_cell.find("a", class_="bpsGridPDFLink")
-                        if agenda_cell
-                        else None
-                    )
-                    agenda_url = None
-                    if agenda_link and "href" in agenda_link.attrs:
-                        agenda_url = urllib.parse.urljoin(
-                            self.infocouncil_url, agenda_link["href"]
-                        )
-
-                    # Look for agenda HTML link
-                    agenda_html_url = None
-                    agenda_html_link = None
-                    if agenda_cell:
-                        agenda_html_link = agenda_cell.find(
-                            "a", class_="bpsGridHTMLLink"
-                        )
-                    if agenda_html_link and "href" in agenda_html_link.attrs:
-                        agenda_html_url = urllib.parse.urljoin(
-                            self.infocouncil_url, agenda_html_link["href"]
-                        )
-
-                    # Look for minutes PDF link - often has a different class or text
-                    minutes_url = None
-                    minutes_link = current_meeting.find(
-                        "a", class_="bpsGridMinutesLink", recursive=True
-                    )
-                    if not minutes_link:
-                        # Try finding in the minutes column specifically
-                        minutes_cell = current_meeting.find(
-                            "td", class_="bpsGridMinutes"
-                        )
-                        if minutes_cell:
-                            # Look for PDF link first
-                            pdf_link = minutes_cell.find("a", class_="bpsGridPDFLink")
-                            if pdf_link and "href" in pdf_link.attrs:
-                                minutes_link = pdf_link
-                            else:
-                                # Fall back to any link with "minutes" in the text
-                                for link in minutes_cell.find_all("a"):
-                                    if (
-                                        "minutes" in link.get_text().lower()
-                                        and "href" in link.attrs
-                                    ):
-                                        minutes_link = link
-                                        break
-
-                    if minutes_link and "href" in minutes_link.attrs:
-                        minutes_url = urllib.parse.urljoin(
-                            self.infocouncil_url, minutes_link["href"]
-                        )
-
-                    # Look for minutes HTML link
-                    minutes_html_url = None
-                    minutes_cell = current_meeting.find("td", class_="bpsGridMinutes")
-                    if minutes_cell:
-                        minutes_html_link = minutes_cell.find(
-                            "a", class_="bpsGridHTMLLink"
-                        )
-                        if minutes_html_link and "href" in minutes_html_link.attrs:
-                            minutes_html_url = urllib.parse.urljoin(
-                                self.infocouncil_url, minutes_html_link["href"]
-                            )
-
-                    date_text = current_meeting.find(
-                        "td", class_="bpsGridDate"
-                    ).get_text(separator=" ")
-                    time_search = self.time_regex.search(date_text)
-                    time = time_search.group() if time_search else None
-
-                    date_search = self.date_regex.search(date_text)
-                    date = date_search.group() if date_search else None
-
-                    # Skip rows where the date doesn't belong to the queried year.
-                    # Some sites ignore ?year= and always return the current year's
-                    # data, which would otherwise cause duplicates across year queries.
-                    if date:
-                        try:
-                            if parse_date(date, fuzzy=True).year != year:
-                                continue
-                        except Exception:
-                            pass
-
-                    location = current_meeting.find("td", class_="bpsGridCommittee")
-                    location_text = None
-                    location_spans = [
-                        location_span for location_span in location.find_all("span")
-                    ]
-                    for span_el in reversed(location_spans):
-                        maybe_address = span_el.get_text(separator=" ", strip=True)
-                        if maybe_address and maybe_address != "":
-                            location_text = maybe_address
-                            break
-
-                    name = location.text if location else None
-
-                    if not agenda_url and not minutes_url:
-                        continue
-
-                    scraper_return = ScraperReturn(
-                        name=name,
-                        date=date,
-                        time=time,
-                        webpage_url=self.infocouncil_url,
-                        agenda_url=agenda_url,
-                        minutes_url=minutes_url,
-                        agenda_html_url=agenda_html_url,
-                        minutes_html_url=minutes_html_url,
-                        download_url=agenda_url,  # For backward compatibility
-                        location=location_text,
+        # Get all meeting rows
+        meeting_rows = meeting_table.find("tbody").find_all("tr")
+
+        # Process each meeting row
+        for current_meeting in meeting_rows:
+            # Look for agenda PDF link.
+            #
+            # Search inside the agenda cell, not the whole row. Minutes
+            # links carry the same bpsGridPDFLink class, so searching
+            # the row meant a meeting with minutes but no agenda stored
+            # its minutes PDF as the agenda — inventing an agenda that
+            # does not exist. That affected 76 meetings across ten
+            # councils.
+            agenda_cell = current_meeting.find("td", class_="bpsGridAgenda")
+            agenda_link = (
+                agenda_cell.find("a", class_="bpsGridPDFLink") if agenda_cell else None
+            )
+            agenda_url = None
+            if agenda_link and "href" in agenda_link.attrs:
+                agenda_url = urllib.parse.urljoin(
+                    self.infocouncil_url, agenda_link["href"]
+                )
+
+            # Look for agenda HTML link
+            agenda_html_url = None
+            agenda_html_link = None
+            if agenda_cell:
+                agenda_html_link = agenda_cell.find("a", class_="bpsGridHTMLLink")
+            if agenda_html_link and "href" in agenda_html_link.attrs:
+                agenda_html_url = urllib.parse.urljoin(
+                    self.infocouncil_url, agenda_html_link["href"]
+                )
+
+            # Look for minutes PDF link - often has a different class or text
+            minutes_url = None
+            minutes_link = current_meeting.find(
+                "a", class_="bpsGridMinutesLink", recursive=True
+            )
+            if not minutes_link:
+                # Try finding in the minutes column specifically
+                minutes_cell = current_meeting.find("td", class_="bpsGridMinutes")
+                if minutes_cell:
+                    # Look for PDF link first
+                    pdf_link = minutes_cell.find("a", class_="bpsGridPDFLink")
+                    if pdf_link and "href" in pdf_link.attrs:
+                        minutes_link = pdf_link
+                    else:
+                        # Fall back to any link with "minutes" in the text
+                        for link in minutes_cell.find_all("a"):
+                            if (
+                                "minutes" in link.get_text().lower()
+                                and "href" in link.attrs
+                            ):
+                                minutes_link = link
+                                break
+
+            if minutes_link and "href" in minutes_link.attrs:
+                minutes_url = urllib.parse.urljoin(
+                    self.infocouncil_url, minutes_link["href"]
+                )
+
+            # Look for minutes HTML link
+            minutes_html_url = None
+            minutes_cell = current_meeting.find("td", class_="bpsGridMinutes")
+            if minutes_cell:
+                minutes_html_link = minutes_cell.find("a", class_="bpsGridHTMLLink")
+                if minutes_html_link and "href" in minutes_html_link.attrs:
+                    minutes_html_url = urllib.parse.urljoin(
+                        self.infocouncil_url, minutes_html_link["href"]
                     )
-                    results.append(scraper_return)
 
-            except Exception as e:
-                # Log but continue trying other years
-                self.logger.debug(f"Failed to fetch meetings for year {year}: {e}")
+            date_text = current_meeting.find("td", class_="bpsGridDate").get_text(
+                separator=" "
+            )
+            time_search = self.time_regex.search(date_text)
+            time = time_search.group() if time_search else None
+
+            date_search = self.date_regex.search(date_text)
+            date = date_search.group() if date_search else None
+
+            # Skip rows where the date doesn't belong to the queried year.
+            # Some sites ignore ?year= and always return the current year's
+            # data, which would otherwise cause duplicates across year queries.
+            if date and dates.year_of(date) not in (None, year):
+                continue
+
+            location = current_meeting.find("td", class_="bpsGridCommittee")
+            location_text = None
+            location_spans = [
+                location_span for location_span in location.find_all("span")
+            ]
+            for span_el in reversed(location_spans):
+                maybe_address = span_el.get_text(separator=" ", strip=True)
+                if maybe_address and maybe_address != "":
+                    location_text = maybe_address
+                    break
+
+            name = location.text if location else None
+
+            if not agenda_url and not minutes_url:
                 continue
 
+            scraper_return = ScraperReturn(
+                name=name,
+                date=date,
+                time=time,
+                webpage_url=self.infocouncil_url,
+                agenda_url=agenda_url,
+                minutes_url=minutes_url,
+                agenda_html_url=agenda_html_url,
+                minutes_html_url=minutes_html_url,
+                download_url=agenda_url,  # For backward compatibility
+                location=location_text,
+            )
+            results.append(scraper_return)
+
+        return results
+
+    def _finish(self, results: list[ScraperReturn]) -> list[ScraperReturn]:
         # The legacy grid splits some meetings across two rows in the same way
         # the redesigned template does — one carrying the agenda, another the
         # minutes. That was invisible until agenda links stopped being read
@@ -697,12 +1080,8 @@ class InfoCouncilScraper(BaseScraper):
 
             # Some sites ignore ?year= and always return the latest listing,
             # which would otherwise duplicate meetings across year queries.
-            if date:
-                try:
-                    if parse_date(date, fuzzy=True).year != year:
-                        continue
-                except Exception:
-                    pass
+            if date and dates.year_of(date) not in (None, year):
+                continue
 
             time_search = self.time_regex.search(f"{date_text} {time_text}".strip())
             time = time_search.group() if time_search else None
@@ -770,4 +1149,100 @@ class InfoCouncilScraper(BaseScraper):
         return papers
 
 
-SCRAPER_REGISTRY: dict[str, BaseScraper] = {}
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "scrapers", "manifest.json")
+
+
+class ScraperRegistry(MutableMapping):
+    """Every registered scraper, keyed by class name, built on first use.
+
+    `register_scraper` used to instantiate each scraper as its module was
+    imported, and the package imported every module, so running a single
+    council still built around forty sessions, fetchers and loggers.
+
+    Now registering only records the class; the instance is made when it is
+    looked up. `select()` goes further and answers `--council`/`--state`
+    from `scrapers/manifest.json` (regenerate it with
+    `python scripts/generate_manifest.py`), importing only the modules it
+    picks. Anything that walks the whole registry — iterating, `len()` —
+    imports every scraper first, exactly as before.
+    """
+
+    def __init__(self, manifest_path: str = MANIFEST_PATH):
+        self.__manifest_path = manifest_path
+        self.__manifest: Optional[list[dict]] = None
+        self.__classes: dict[str, type] = {}
+        self.__instances: dict[str, BaseScraper] = {}
+
+    def register(self, cls: type) -> None:
+        self.__classes[cls.__name__] = cls
+        self.__instances.pop(cls.__name__, None)
+
+    def manifest(self) -> list[dict]:
+        """Manifest entries (slug, state, module, class, host), in run order."""
+        if self.__manifest is None:
+            try:
+                with open(self.__manifest_path, encoding="utf-8") as f:
+                    self.__manifest = json.load(f)
+            except FileNotFoundError:
+                self.__manifest = []
+        return self.__manifest
+
+    def load_all(self) -> None:
+        importlib.import_module("aus_council_scrapers.scrapers").load_all()
+
+    def select(
+        self, council: Optional[str] = None, state: Optional[str] = None
+    ) -> list[BaseScraper]:
+        """Scrapers matching a council slug and/or state, case-insensitively."""
+
+        def wanted(slug: str, scraper_state: str) -> bool:
+            if state and state.lower() != scraper_state.lower():
+                return False
+            return not council or council.lower() == slug.lower()
+
+        entries = self.manifest()
+        if not entries:
+            return [s for s in self.values() if wanted(s.council_name, s.state)]
+
+        selected = []
+        for entry in entries:
+            if wanted(entry["slug"], entry["state"]):
+                importlib.import_module(entry["module"])
+                selected.append(self[entry["class"]])
+        return selected
+
+    def __getitem__(self, name: str) -> BaseScraper:
+        if name not in self.__instances:
+            if name not in self.__classes:
+                module = next(
+                    (e["module"] for e in self.manifest() if e["class"] == name),
+                    None,
+                )
+                if module is None:
+                    raise KeyError(name)
+                importlib.import_module(module)
+            self.__instances[name] = self.__classes[name]()
+        return self.__instances[name]
+
+    def __setitem__(self, name: str, scraper: BaseScraper) -> None:
+        self.__classes[name] = type(scraper)
+        self.__instances[name] = scraper
+
+    def __delitem__(self, name: str) -> None:
+        del self.__classes[name]
+        self.__instances.pop(name, None)
+
+    def __iter__(self):
+        self.load_all()
+        # Manifest order first, so the order does not depend on which
+        # modules happened to be imported before the rest.
+        order = {e["class"]: i for i, e in enumerate(self.manifest())}
+        names = list(self.__classes)
+        return iter(sorted(names, key=lambda n: order.get(n, len(order))))
+
+    def __len__(self) -> int:
+        self.load_all()
+        return len(self.__classes)
+
+
+SCRAPER_REGISTRY = ScraperRegistry()
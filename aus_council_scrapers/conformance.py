@@ -26,9 +26,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 
-from dateutil.parser import parse as parse_date
-
 from aus_council_scrapers import clock
+from aus_council_scrapers.dates import year_of
 
 # A scraper is "complete" when it reaches all of these.
 #
@@ -68,11 +67,7 @@ class Assessment:
         return f"{self.years[0]}-{self.years[-1]}" if self.years else "-"
 
 
-def year_of(date_str) -> int | None:
-    try:
-        return parse_date(str(date_str), fuzzy=True).year
-    except Exception:
-        return None
+_ABSOLUTE_URL = re.compile(r"^https?://")
 
 
 def assess(slug: str, meetings: list[dict]) -> Assessment:
@@ -82,46 +77,55 @@ def assess(slug: str, meetings: list[dict]) -> Assessment:
         result.invariants.append("returns no meetings")
         return result
 
+    # One pass over the meetings, parsing each date once.
+    this_year = clock.current_year()
+    unparseable = undated = relative = 0
+    years: set[int] = set()
+    any_past = past_minutes = False
+    by_identity: dict[tuple, list[dict]] = {}
+    for m in meetings:
+        date = m.get("date")
+        year = year_of(date)
+        if year is None:
+            unparseable += 1
+        else:
+            years.add(year)
+        if not date:
+            undated += 1
+        by_identity.setdefault((m.get("name"), date), []).append(m)
+        for f in _URL_FIELDS:
+            url = m.get(f)
+            if url and not _ABSOLUTE_URL.match(url):
+                relative += 1
+        if m.get("agenda_url") or m.get("download_url"):
+            result.agenda += 1
+        if m.get("minutes_url"):
+            result.minutes += 1
+        if year and year < this_year:
+            any_past = True
+            past_minutes = past_minutes or bool(m.get("minutes_url"))
+
     # --- invariants -------------------------------------------------------
-    unparseable = [m for m in meetings if year_of(m.get("date")) is None]
     if unparseable:
-        result.invariants.append(f"{len(unparseable)} unparseable date(s)")
+        result.invariants.append(f"{unparseable} unparseable date(s)")
 
-    undated = [m for m in meetings if not m.get("date")]
     if undated:
-        result.invariants.append(f"{len(undated)} meeting(s) with no date")
+        result.invariants.append(f"{undated} meeting(s) with no date")
 
     # Two meetings sharing a name and date are not automatically a bug: a
     # council can hold two special meetings on one night, and a supplementary
     # agenda is a real second document. Only rows identical in every field
     # are the scraper emitting the same meeting twice.
-    by_identity: dict[tuple, list[dict]] = {}
-    for m in meetings:
-        by_identity.setdefault((m.get("name"), m.get("date")), []).append(m)
-
     same_slot = {k: v for k, v in by_identity.items() if len(v) > 1}
     exact_duplicates = [k for k, v in same_slot.items() if all(r == v[0] for r in v)]
     if exact_duplicates:
         result.invariants.append(f"{len(exact_duplicates)} meeting(s) emitted twice")
 
-    relative = [
-        url
-        for m in meetings
-        for url in (m.get(f) for f in _URL_FIELDS)
-        if url and not re.match(r"^https?://", url)
-    ]
     if relative:
-        result.invariants.append(f"{len(relative)} relative URL(s)")
+        result.invariants.append(f"{relative} relative URL(s)")
 
     # --- coverage ---------------------------------------------------------
-    result.years = sorted({y for m in meetings if (y := year_of(m.get("date")))})
-    result.agenda = sum(
-        1 for m in meetings if m.get("agenda_url") or m.get("download_url")
-    )
-    result.minutes = sum(1 for m in meetings if m.get("minutes_url"))
-
-    this_year = clock.current_year()
-    past = [m for m in meetings if (y := year_of(m.get("date"))) and y < this_year]
+    result.years = sorted(years)
 
     # One meeting arriving as an agenda-only row plus a minutes-only row is a
     # modelling failure rather than a duplicate: it defeats the point of
@@ -141,7 +145,7 @@ def assess(slug: str, meetings: list[dict]) -> Assessment:
         result.coverage.append(f"only {len(meetings)} meeting(s)")
     if len(result.years) < TARGET_MIN_YEARS:
         result.coverage.append(f"only {len(result.years)} year(s)")
-    if past and not any(m.get("minutes_url") for m in past):
+    if any_past and not past_minutes:
         result.coverage.append("no minutes on any past meeting")
     if result.agenda == 0:
         result.coverage.append("no agendas")
@@ -0,0 +1,147 @@
+"""CPU-bound stages, run in worker processes so they stop sharing the GIL.
+
+Scrapers run on threads (or the event loop), which overlaps their network
+waits, but everything they do with what arrives holds the GIL. In legacy
+mode the heaviest of that is the PDF stage: MuPDF text extraction and
+keyword counting over agendas of several hundred pages. A run on a
+many-core machine sat at one core while several councils were each
+parsing an agenda.
+
+`CpuPool` hands those stages to a `ProcessPoolExecutor`. A scraper's thread
+still downloads the PDF, then waits on the worker process without holding
+the GIL. Inputs and outputs are plain bytes, paths, strings and dicts. With
+`workers=0`, the default, each call runs in the calling thread exactly as
+before. The process pool only pays for itself when several documents are
+in flight at once.
+
+HTML parsing stays on the scraper threads. Each scraper interleaves
+fetching and parsing, and reads the soup it builds to decide what to fetch
+next. A parsed tree costs more to pickle across than it saves.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
+
+from aus_council_scrapers.keywords import KeywordCounts
+from aus_council_scrapers.utils import PdfDownload, extract_keywords, page_texts
+
+T = TypeVar("T")
+
+
+def pdf_keywords(
+    download: PdfDownload, regexes: list
+) -> tuple[str, KeywordCounts, int]:
+    """A downloaded PDF's text, keyword counts and word count.
+
+    Module-level so a worker process can run it. A spooled download is
+    reopened there from its path; one held in memory is copied across.
+    """
+    with download.open() as doc:
+        text = "".join(page_texts(doc))
+    counts, wordcount = extract_keywords(regexes, text)
+    return text, counts, wordcount
+
+
+def pdf_keyword_counts(
+    download: PdfDownload, regexes: list
+) -> tuple[KeywordCounts, int]:
+    """`pdf_keywords` without the text, counted page by page.
+
+    For callers with nowhere to keep the text: it is never joined.
+    """
+    with download.open() as doc:
+        return extract_keywords(regexes, page_texts(doc))
+
+
+class CpuPool:
+    """Runs CPU-bound functions in `workers` processes, or inline if 0.
+
+    Safe to call from any number of threads; each call blocks only its
+    caller. Processes are started on first use, with the "spawn" method.
+    Forking a process that is running threads and Chrome drivers would copy
+    locks some other thread holds.
+    """
+
+    def __init__(self, workers: int = 0):
+        self.workers = workers
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__lock = threading.Lock()
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self.__executor
+
+    def run(self, fn: Callable[..., T], *args) -> T:
+        """`fn(*args)`, in a worker process when there are any.
+
+        `fn` and its arguments must be picklable.
+        """
+        if self.workers <= 0:
+            return fn(*args)
+        executor = self.__get_executor()
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            # A worker died, taking the pool with it (MuPDF can crash on a
+            # malformed file). Fail this call and start afresh on the next.
+            logging.error("A CPU worker process died; restarting the pool")
+            with self.__lock:
+                if self.__executor is executor:
+                    self.__executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def pdf_keywords(
+        self, download: PdfDownload, regexes: list
+    ) -> tuple[str, KeywordCounts, int]:
+        return self.run(pdf_keywords, download, regexes)
+
+    def pdf_keyword_counts(
+        self, download: PdfDownload, regexes: list
+    ) -> tuple[KeywordCounts, int]:
+        return self.run(pdf_keyword_counts, download, regexes)
+
+    def keywords(self, regexes: list, text: str) -> tuple[KeywordCounts, int]:
+        """`extract_keywords`, for text already extracted."""
+        return self.run(extract_keywords, regexes, text)
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def default_cpu_workers() -> int:
+    """`CPU_WORKERS`, or 0 to run CPU-bound stages on the calling thread."""
+    value = os.environ.get("CPU_WORKERS", "").strip()
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value) if value else 0
+
+
+_shared: Optional[CpuPool] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cpu_pool() -> CpuPool:
+    """The process-wide pool, sized by `CPU_WORKERS` when first used."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = CpuPool(default_cpu_workers())
+            atexit.register(_shared.shutdown)
+        return _shared
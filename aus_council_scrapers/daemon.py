@@ -0,0 +1,391 @@
+"""A long-running scheduler that polls each council on its own cadence.
+
+Cron ran `main.py` every hour for every council, but most councils meet
+monthly and publish an agenda only in the week or so before a meeting. So
+nearly every request found nothing new, and an agenda published just after
+a run waited the full hour anyway.
+
+The daemon stays up, so scrapers, the Selenium pool, the HTTP cache and the
+per-host throttle stay warm between rounds. It schedules each council
+separately, from the meetings legacy mode has stored in `agendas.db`:
+
+- the next meeting is the earliest stored meeting that is upcoming (or at
+  most `GRACE` overdue) and has no agenda yet;
+- failing that, it is predicted from the median gap between the council's
+  recent meetings, counted on from the last one;
+- within `LEAD` of that meeting, the council is polled every
+  `NEAR_INTERVAL`;
+- otherwise it waits `FAR_INTERVAL`, but never past the opening of the next
+  meeting's window;
+- a council with too little history is polled every `DEFAULT_INTERVAL`;
+- a failing council backs off exponentially from `RETRY_INTERVAL`.
+
+When each council is next due, and why, is kept in `.cache/schedule.sqlite`
+(moved with `SCHEDULE_PATH`). A restart carries on from where it stopped
+instead of polling everything at once.
+
+Run it in place of the cron job (SIGTERM or SIGINT stop it after the
+current round):
+
+    poetry run python aus_council_scrapers/daemon.py --workers 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import logging
+import os
+import signal
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+import aus_council_scrapers.database as db
+from aus_council_scrapers import clock
+from aus_council_scrapers.base import SCRAPER_REGISTRY, BaseScraper
+from aus_council_scrapers.cpu import shared_cpu_pool
+from aus_council_scrapers.discord_bot import close_shared_notifier
+from aus_council_scrapers.driver_pool import shared_driver_pool
+from aus_council_scrapers.history import default_history
+from aus_council_scrapers.logging_config import setup_logging
+from aus_council_scrapers.mailer import close_shared_mailer, send_shared_digest
+from aus_council_scrapers.main import dispatch_by_host, run_scraper
+
+DEFAULT_PATH = ".cache/schedule.sqlite"
+
+# How far ahead of a meeting its agenda may appear, and how long after the
+# expected date one is still worth waiting for.
+LEAD = datetime.timedelta(days=10)
+GRACE = datetime.timedelta(days=3)
+NEAR_INTERVAL = datetime.timedelta(hours=2)
+FAR_INTERVAL = datetime.timedelta(hours=24)
+DEFAULT_INTERVAL = datetime.timedelta(hours=6)
+RETRY_INTERVAL = datetime.timedelta(hours=1)
+# Meetings used to estimate a council's rhythm.
+RECENT_MEETINGS = 12
+# Longest the daemon sleeps before looking at the schedule again.
+MAX_SLEEP = datetime.timedelta(minutes=15)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedule (
+    council TEXT PRIMARY KEY,
+    next_run TEXT NOT NULL,
+    last_run TEXT,
+    last_ok INTEGER,
+    failures INTEGER NOT NULL DEFAULT 0,
+    reason TEXT
+);
+"""
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def predict_next_meeting(
+    dates: Iterable[datetime.date],
+    published: Iterable[datetime.date],
+    today: datetime.date,
+) -> Optional[datetime.date]:
+    """When the council's next agenda is due, from its stored meetings.
+
+    `dates` are the council's known meeting dates; `published` the ones
+    whose agenda has been stored. None when there is too little history.
+    """
+    known = sorted(set(dates))
+    published = set(published)
+    waiting = [d for d in known if d >= today - GRACE and d not in published]
+    if waiting:
+        return waiting[0]
+
+    recent = known[-RECENT_MEETINGS:]
+    gaps = sorted((b - a).days for a, b in zip(recent, recent[1:]))
+    if not gaps or gaps[len(gaps) // 2] <= 0:
+        return None
+    gap = datetime.timedelta(days=gaps[len(gaps) // 2])
+    predicted = known[-1] + gap
+    while predicted < today - GRACE:
+        predicted += gap
+    return predicted
+
+
+def next_poll(
+    dates: Iterable[datetime.date],
+    published: Iterable[datetime.date],
+    today: datetime.date,
+    failures: int = 0,
+) -> tuple[datetime.timedelta, str]:
+    """How long until the council is polled again, and why."""
+    if failures:
+        backoff = min(RETRY_INTERVAL * 2 ** (failures - 1), FAR_INTERVAL)
+        return backoff, f"backing off after {failures} failure(s)"
+
+    meeting = predict_next_meeting(dates, published, today)
+    if meeting is None:
+        return DEFAULT_INTERVAL, "too little meeting history"
+    window_opens = meeting - LEAD
+    if window_opens <= today:
+        return NEAR_INTERVAL, f"agenda due for the meeting on {meeting}"
+    wait = min(FAR_INTERVAL, datetime.timedelta(days=(window_opens - today).days))
+    return max(wait, NEAR_INTERVAL), f"next meeting expected {meeting}"
+
+
+def stored_meetings(
+    council: str,
+) -> tuple[list[datetime.date], list[datetime.date]]:
+    """The council's recent meeting dates in `agendas.db`, and those of them
+    stored with an agenda."""
+    database = db.get_database()
+    try:
+        # What the council's run just queued for the writer counts too.
+        database.flush()
+    except sqlite3.Error as e:
+        logging.error(f"A result was not saved: {e}")
+    rows = database.read(
+        """SELECT meeting_date, MAX(agenda_url IS NOT NULL OR download_url IS NOT NULL)
+           FROM agendas
+           WHERE council = ? AND meeting_date IS NOT NULL
+           GROUP BY meeting_date
+           ORDER BY meeting_date DESC
+           LIMIT ?""",
+        (council, RECENT_MEETINGS),
+    )
+    dates, published = [], []
+    for value, has_agenda in rows:
+        try:
+            date = datetime.date.fromisoformat(value[:10])
+        except ValueError:
+            continue
+        dates.append(date)
+        if has_agenda:
+            published.append(date)
+    return dates, published
+
+
+@dataclass
+class Entry:
+    council: str
+    next_run: datetime.datetime
+    failures: int = 0
+    reason: Optional[str] = None
+
+
+class ScheduleStore:
+    """When each council is next due, in one SQLite file.
+
+    Safe to share between threads: one connection, used under a lock.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__conn: Optional[sqlite3.Connection] = None
+
+    def __db(self) -> sqlite3.Connection:
+        if self.__conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.__conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.__conn.executescript(_SCHEMA)
+        return self.__conn
+
+    def get(self, council: str) -> Optional[Entry]:
+        with self.__lock:
+            row = (
+                self.__db()
+                .execute(
+                    "SELECT next_run, failures, reason FROM schedule"
+                    " WHERE council = ?",
+                    (council,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return Entry(council, datetime.datetime.fromisoformat(row[0]), row[1], row[2])
+
+    def record(
+        self,
+        council: str,
+        ok: bool,
+        next_run: datetime.datetime,
+        failures: int,
+        reason: str,
+        ran_at: datetime.datetime,
+    ) -> None:
+        with self.__lock, self.__db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO schedule VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    council,
+                    next_run.isoformat(timespec="seconds"),
+                    ran_at.isoformat(timespec="seconds"),
+                    ok,
+                    failures,
+                    reason,
+                ),
+            )
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__conn is not None:
+                self.__conn.close()
+                self.__conn = None
+
+
+class Daemon:
+    """Runs whichever councils are due, then sleeps until the next one is."""
+
+    def __init__(
+        self,
+        scrapers: list[BaseScraper],
+        store: ScheduleStore,
+        workers: int = 6,
+        now: Callable[[], datetime.datetime] = _now,
+        meetings: Callable[[str], tuple[list, list]] = stored_meetings,
+        **run_options,
+    ):
+        self.scrapers = scrapers
+        self.store = store
+        self.workers = workers
+        self.run_options = run_options
+        self.stopping = threading.Event()
+        self.__now = now
+        self.__meetings = meetings
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def due(self) -> list[BaseScraper]:
+        now = self.__now()
+        due = []
+        for scraper in self.scrapers:
+            entry = self.store.get(scraper.council_name)
+            if entry is None or entry.next_run <= now:
+                due.append(scraper)
+        return due
+
+    def next_wakeup(self) -> datetime.datetime:
+        now = self.__now()
+        wakeup = now + MAX_SLEEP
+        for scraper in self.scrapers:
+            entry = self.store.get(scraper.council_name)
+            if entry is None:
+                return now
+            wakeup = min(wakeup, entry.next_run)
+        return wakeup
+
+    def run_once(self) -> int:
+        """Run every council that is due; returns how many ran."""
+        due = self.due()
+        if not due:
+            return 0
+        self.__logger.info(f"Running {len(due)} due council(s)")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for scraper, fut in dispatch_by_host(
+                executor, due, self.workers, run_scraper, **self.run_options
+            ):
+                try:
+                    out = fut.result()
+                except Exception as e:
+                    self.__logger.exception(f"Worker future failed unexpectedly: {e}")
+                    out = {"ok": False}
+                # Legacy mode returns None when there was nothing new.
+                self.__schedule(scraper, out is None or bool(out.get("ok")))
+        # With --email-digest, one email per round.
+        send_shared_digest()
+        return len(due)
+
+    def __schedule(self, scraper: BaseScraper, ok: bool) -> None:
+        council = scraper.council_name
+        previous = self.store.get(council)
+        failures = 0 if ok else (previous.failures if previous else 0) + 1
+        dates, published = self.__meetings(council)
+        interval, reason = next_poll(dates, published, clock.today(), failures)
+        ran_at = self.__now()
+        self.store.record(council, ok, ran_at + interval, failures, reason, ran_at)
+        self.__logger.info(f"{council}: next poll in {interval} ({reason})")
+
+    def serve(self) -> None:
+        """Run rounds until `stopping` is set."""
+        while not self.stopping.is_set():
+            self.run_once()
+            delay = (self.next_wakeup() - self.__now()).total_seconds()
+            if delay > 0:
+                self.stopping.wait(delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--council", help="Schedule only this council")
+    parser.add_argument("--state", help="Schedule only this state")
+    parser.add_argument("--workers", help="Number of workers", default=6, type=int)
+    parser.add_argument(
+        "--skip-keywords", help="Skip keyword extraction", action="store_true"
+    )
+    parser.add_argument(
+        "--skip-pdf", help="Skip PDF download/keyword extraction", action="store_true"
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Run the councils that are due now, then exit.",
+    )
+    parser.add_argument(
+        "--email-digest",
+        action="store_true",
+        help="Email the new meetings once per round instead of one by one.",
+    )
+    parser.add_argument("--log-level", help="Set the log level", default="INFO")
+    args = parser.parse_args()
+
+    setup_logging(level=args.log_level.upper())
+    if args.email_digest:
+        os.environ["EMAIL_DIGEST"] = "1"
+    db.init()
+    db.seen_index()
+
+    scrapers = SCRAPER_REGISTRY.select(council=args.council, state=args.state)
+    history = default_history()
+    if history is not None:
+        for scraper in scrapers:
+            scraper.history = history.for_council(scraper.council_name)
+
+    store = ScheduleStore(os.environ.get("SCHEDULE_PATH", DEFAULT_PATH))
+    daemon = Daemon(
+        scrapers,
+        store,
+        workers=args.workers,
+        skip_keywords=args.skip_keywords,
+        skip_pdf=args.skip_pdf,
+    )
+
+    def stop(signum, frame):
+        logging.info("Stopping after the current round")
+        daemon.stopping.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logging.info(f"YIMBY SCRAPER daemon started with {len(scrapers)} councils")
+    try:
+        if args.once:
+            daemon.run_once()
+        else:
+            daemon.serve()
+    finally:
+        store.close()
+        if history is not None:
+            history.close()
+        shared_cpu_pool().shutdown()
+        shared_driver_pool().shutdown()
+        close_shared_notifier()
+        close_shared_mailer()
+        db.close()
+    logging.info("YIMBY SCRAPER daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
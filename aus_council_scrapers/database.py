@@ -1,13 +1,315 @@
-import sqlite3
+"""The legacy-mode `agendas.db`.
+
+Every function here used to open its own connection, commit and close it,
+so worker threads queued on SQLite's write lock, and the skip-checks ran
+full scans of a table past 100k rows.
+
+`Database` keeps the file in WAL mode, so readers never wait for the
+writer. Writes go onto a queue that one writer thread drains, committing
+each batch at once; each reading thread keeps its own connection. The URL
+columns the skip-checks filter on are indexed by `init()` (and by
+`scripts/migrate_database.py` for older files).
+
+Writes are asynchronous: `flush()` waits for them and re-raises the first
+one that failed, and `close()` flushes. A read can miss a row another
+thread queued a moment earlier, which the skip-checks tolerate: a council
+is scraped by one worker at a time.
+
+`seen_index()` answers the skip-check for a whole run from memory: it reads
+every (agenda, minutes) pair once, and `insert_result` adds to it as rows
+are queued.
+"""
+
+import atexit
 import datetime
+import hashlib
 import json
+import logging
+import math
+import queue
+import sqlite3
+import threading
 import traceback
+from typing import Iterable, Optional
 
 from aus_council_scrapers.base import ScraperReturn
 
+DB_PATH = "agendas.db"
+# Most statements queued before the writer commits.
+BATCH_SIZE = 100
+
+INDEXES = {
+    "agendas_agenda_url": "agenda_url",
+    "agendas_download_url": "download_url",
+    "agendas_minutes_url": "minutes_url",
+}
+
+
+def create_indexes(conn: sqlite3.Connection) -> None:
+    for name, column in INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON agendas ({column})")
+
+
+class Database:
+    """One SQLite file shared by every thread of a run."""
+
+    def __init__(self, path: str = DB_PATH, batch_size: int = BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.__queue: queue.Queue = queue.Queue()
+        self.__local = threading.local()
+        self.__readers: list[sqlite3.Connection] = []
+        self.__writer: Optional[threading.Thread] = None
+        self.__error: Optional[BaseException] = None
+        self.__lock = threading.Lock()
+        self.__seen: Optional[SeenIndex] = None
+        self.__seen_lock = threading.Lock()
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL stays consistent at NORMAL; only the last commits can be lost
+        # to a power cut, not corrupted.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def read(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a query on this thread's own connection."""
+        conn = getattr(self.__local, "conn", None)
+        if conn is None:
+            conn = self.__local.conn = self.connect()
+            with self.__lock:
+                self.__readers.append(conn)
+        return conn.execute(sql, params).fetchall()
+
+    def write(self, sql: str, params: tuple = ()) -> None:
+        """Queue a statement for the writer thread."""
+        with self.__lock:
+            if self.__writer is None:
+                self.__writer = threading.Thread(
+                    target=self.__run, name=f"db-writer:{self.path}", daemon=True
+                )
+                self.__writer.start()
+        self.__queue.put((sql, params))
+
+    def seen(self, compact: bool = False) -> "SeenIndex":
+        """The run's `SeenIndex`, loaded on first use."""
+        with self.__seen_lock:
+            if self.__seen is None:
+                self.__seen = SeenIndex(self, compact=compact)
+            return self.__seen
+
+    def note_seen(
+        self,
+        agenda_url: Optional[str],
+        minutes_url: Optional[str],
+        download_url: Optional[str] = None,
+    ) -> None:
+        """Tell a loaded `SeenIndex` about a row just queued."""
+        if self.__seen is not None:
+            self.__seen.add(agenda_url, minutes_url, download_url)
+
+    def flush(self) -> None:
+        """Wait until every queued write is committed.
+
+        Raises the first write that failed since the last flush.
+        """
+        self.__queue.join()
+        with self.__lock:
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Flush, stop the writer, and close every connection."""
+        with self.__lock:
+            writer, self.__writer = self.__writer, None
+        if writer is not None:
+            self.__queue.put(None)
+            writer.join()
+        with self.__lock:
+            readers, self.__readers = self.__readers, []
+        for conn in readers:
+            conn.close()
+        self.__local = threading.local()
+        self.__seen = None
+        self.flush()
+
+    def __run(self) -> None:
+        conn = self.connect()
+        try:
+            while True:
+                batch = [self.__queue.get()]
+                while batch[-1] is not None and len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.__queue.get_nowait())
+                    except queue.Empty:
+                        break
+                self.__commit(conn, [item for item in batch if item is not None])
+                for _ in batch:
+                    self.__queue.task_done()
+                if batch[-1] is None:
+                    return
+        finally:
+            conn.close()
+
+    def __commit(self, conn: sqlite3.Connection, batch: list) -> None:
+        for sql, params in batch:
+            try:
+                conn.execute(sql, params)
+            except sqlite3.Error as e:
+                # One bad row must not cost the rest of the batch.
+                self.__logger.exception(f"Database write failed: {e}")
+                with self.__lock:
+                    self.__error = self.__error or e
+        try:
+            conn.commit()
+        except sqlite3.Error as e:
+            self.__logger.exception(f"Database commit failed: {e}")
+            with self.__lock:
+                self.__error = self.__error or e
+
+
+class BloomFilter:
+    """A fixed-size set of strings that may answer "yes" wrongly, never "no".
+
+    About 1.2 bytes an entry at a 1% false-positive rate, against the few
+    hundred bytes each pair of URLs costs in a Python set.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def __positions(self, key: str) -> Iterable[int]:
+        # Double hashing: k positions from two halves of one digest.
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self.__positions(key):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.__bits[position >> 3] & (1 << (position & 7))
+            for position in self.__positions(key)
+        )
+
+
+class SeenIndex:
+    """The (agenda, minutes) pairs `agendas.db` already holds, in memory.
 
-def init():
-    conn = sqlite3.connect("agendas.db")
+    Gives the same answers as `check_meeting_fully_scraped`: a meeting is
+    seen if a row has its agenda URL (as `agenda_url` or `download_url`)
+    and the same minutes URL, or no minutes when it has none. That makes
+    the check one set lookup, so it is loaded once per run with a single
+    query instead of one query per meeting.
+
+    `compact=True` keeps a `BloomFilter` instead of the URLs. A "no" from it
+    is final; a "maybe" is settled by querying the database, which happens
+    for already-seen meetings and about 1% of new ones.
+    """
+
+    def __init__(self, database: Database, compact: bool = False):
+        self.__database = database
+        self.__lock = threading.Lock()
+        self.fallbacks = 0
+
+        # Rows still queued must be in what is loaded.
+        database.flush()
+        rows = database.read(
+            "SELECT agenda_url, minutes_url, download_url FROM agendas"
+            " WHERE agenda_url IS NOT NULL OR download_url IS NOT NULL"
+        )
+        self.__pairs: Optional[set[str]] = None if compact else set()
+        # Room for the rows the run adds, too.
+        self.__bloom = BloomFilter(2 * len(rows) + 10_000) if compact else None
+        for row in rows:
+            self.add(*row)
+
+    @staticmethod
+    def __key(agenda_url: str, minutes_url: Optional[str]) -> str:
+        return f"{agenda_url}\n{minutes_url or ''}"
+
+    def add(
+        self,
+        agenda_url: Optional[str],
+        minutes_url: Optional[str],
+        download_url: Optional[str] = None,
+    ) -> None:
+        with self.__lock:
+            for url in {agenda_url, download_url}:
+                if not url:
+                    continue
+                key = self.__key(url, minutes_url)
+                if self.__pairs is not None:
+                    self.__pairs.add(key)
+                else:
+                    self.__bloom.add(key)
+
+    def is_seen(self, agenda_url: Optional[str], minutes_url: Optional[str]) -> bool:
+        if not agenda_url:
+            return False
+        key = self.__key(agenda_url, minutes_url)
+        with self.__lock:
+            if self.__pairs is not None:
+                return key in self.__pairs
+            if key not in self.__bloom:
+                return False
+            self.fallbacks += 1
+        self.__database.flush()
+        return check_meeting_fully_scraped(
+            agenda_url, minutes_url, db_path=self.__database.path
+        )
+
+    def filter_unseen(self, results: Iterable[ScraperReturn]) -> list[ScraperReturn]:
+        """The meetings in `results` that still need scraping, in order."""
+        return [
+            result
+            for result in results
+            if not self.is_seen(
+                result.agenda_url or result.download_url, result.minutes_url
+            )
+        ]
+
+
+_databases: dict[str, Database] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(path: Optional[str] = None) -> Database:
+    """The shared `Database` for `path`, by default `DB_PATH`."""
+    path = path or DB_PATH
+    with _databases_lock:
+        if path not in _databases:
+            if not _databases:
+                atexit.register(close)
+            _databases[path] = Database(path)
+        return _databases[path]
+
+
+def close() -> None:
+    """Commit every queued write and close every open database."""
+    with _databases_lock:
+        databases = list(_databases.values())
+        _databases.clear()
+    for database in databases:
+        database.close()
+
+
+def seen_index(path: Optional[str] = None, compact: bool = False) -> SeenIndex:
+    """The in-memory skip-check index for `path`, loaded on first use."""
+    return get_database(path).seen(compact=compact)
+
+
+def init(path: Optional[str] = None):
+    conn = get_database(path).connect()
     c = conn.cursor()
     c.execute(
         """CREATE TABLE IF NOT EXISTS agendas
@@ -30,6 +332,7 @@ def init():
                 error_message TEXT,
                 error_traceback TEXT)"""
     )
+    create_indexes(conn)
     conn.commit()
     conn.close()
 
@@ -44,9 +347,7 @@ def insert_error(council_name: str, state: str, exception: Exception):
     )
     formatted_traceback = "".join(traceback_lines)
 
-    conn = sqlite3.connect("agendas.db")
-    c = conn.cursor()
-    c.execute(
+    get_database().write(
         """
         INSERT INTO agendas (
                 date_scraped,
@@ -70,8 +371,6 @@ def insert_error(council_name: str, state: str, exception: Exception):
             formatted_traceback,  # error_traceback
         ),
     )
-    conn.commit()
-    conn.close()
 
 
 def insert_result(
@@ -93,9 +392,7 @@ def insert_result(
 
     is_meeting_in_past = scraper_result.is_date_in_past(state)
 
-    conn = sqlite3.connect("agendas.db")
-    c = conn.cursor()
-    c.execute(
+    get_database().write(
         """
         INSERT INTO agendas (
                 date_scraped,
@@ -149,8 +446,11 @@ def insert_result(
             ai_result,  # AI_result
         ),
     )
-    conn.commit()
-    conn.close()
+    get_database().note_seen(
+        scraper_result.agenda_url,
+        scraper_result.minutes_url,
+        scraper_result.download_url,
+    )
 
 
 def check_url(url: str):
@@ -158,20 +458,17 @@ def check_url(url: str):
 
     Checks against download_url, agenda_url, and minutes_url columns.
     """
-    conn = sqlite3.connect("agendas.db")
-    c = conn.cursor()
-    c.execute(
+    rows = get_database().read(
         """SELECT * FROM agendas 
-           WHERE download_url=? OR agenda_url=? OR minutes_url=?""",
+           WHERE download_url=? OR agenda_url=? OR minutes_url=?
+           LIMIT 1""",
         (url, url, url),
     )
-    result = c.fetchone()
-    conn.close()
-    return result
+    return rows[0] if rows else None
 
 
 def check_meeting_fully_scraped(
-    agenda_url: str | None, minutes_url: str | None, db_path: str = "agendas.db"
+    agenda_url: str | None, minutes_url: str | None, db_path: str | None = None
 ) -> bool:
     """Check if a meeting has been fully scraped (both agenda and minutes if both exist).
 
@@ -196,17 +493,12 @@ def check_meeting_fully_scraped(
         # No agenda URL means we can't check - should scrape
         return False
 
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-
     # Find records that match the agenda URL
-    c.execute(
+    results = get_database(db_path).read(
         """SELECT agenda_url, minutes_url FROM agendas 
            WHERE agenda_url=? OR download_url=?""",
         (agenda_url, agenda_url),
     )
-    results = c.fetchall()
-    conn.close()
 
     if not results:
         # No previous record found - need to scrape
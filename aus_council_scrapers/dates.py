@@ -0,0 +1,177 @@
+"""Fast, memoised parsing of the dates and times scrapers return.
+
+Every `ScraperReturn` has its `date` and `time` parsed, the InfoCouncil
+scrapers parse each row's date again to check its year, and the conformance
+report does the same for every recorded meeting. All of that went through
+dateutil's fuzzy parser, which tokenises and guesses at every call, on a
+few thousand strings that are mostly repeats of a few hundred ("14 May
+2024", "7:00 PM"). And `is_date_in_past` looked the state's timezone up and
+asked for `now()` for every meeting.
+
+Here each string is first matched against exact patterns for the shapes
+`DATE_REGEX` and `TIME_REGEX` find: "Tuesday 14th of May 2024", "14-05-2024",
+ISO dates, "7:00 PM", "7pm", "19:00". A match is built into a date or time
+directly. Anything else goes to dateutil, exactly as before. Both are
+memoised in bounded LRUs, failures included.
+
+The exact patterns only accept what dateutil reads the same way. Dotted
+times such as "7.30pm" are left to it because it reads them as 19:00, and
+a time that is not what dateutil would say is worse than a slow one.
+
+dateutil fills a missing year from today's date, so its answers are cached
+per day.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import re
+import threading
+import time
+from typing import Optional
+
+import pytz
+from dateutil.parser import parse as _dateutil_parse
+from dateutil.parser import parserinfo
+
+from aus_council_scrapers.constants import TIMEZONES_BY_STATE
+
+# Distinct strings remembered; a full run sees a few thousand.
+CACHE_SIZE = 8192
+
+_MONTHS = {
+    name.lower(): number
+    for number, names in enumerate(parserinfo.MONTHS, 1)
+    for name in names
+}
+_WEEKDAYS = "|".join(name for names in parserinfo.WEEKDAYS for name in names)
+
+# DATE_REGEX's first form: "Mon, 25 Dec 2024", "25th of December 2024".
+_TEXT_DATE = re.compile(
+    rf"(?:(?:{_WEEKDAYS}),?\s*)?(\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?"
+    r"([a-z]+)\s+(\d{4})",
+    re.IGNORECASE,
+)
+# DATE_REGEX's second form, with a four-digit year: "25-12-2024".
+_NUMERIC_DATE = re.compile(r"(\d{1,2})\s*([-/])\s*(\d{1,2})\s*\2\s*(\d{4})")
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+# TIME_REGEX's forms, less the dotted ones: "7:00 PM", "7pm", "19:00".
+_TIME = re.compile(
+    r"(\d{1,2})(?::(\d{2}))?\s*(?:(a|p)(?:m|\.m\.))?",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _exact_date(text: str) -> Optional[datetime.date]:
+    """The date, if `text` is in one of the exact forms; None to fall back."""
+    text = text.strip()
+    try:
+        if match := _ISO_DATE.fullmatch(text):
+            return datetime.date(*map(int, match.groups()))
+        if match := _TEXT_DATE.fullmatch(text):
+            month = _MONTHS.get(match.group(2).lower())
+            if month is None:
+                return None
+            return datetime.date(int(match.group(3)), month, int(match.group(1)))
+        if match := _NUMERIC_DATE.fullmatch(text):
+            first, _, second, year = match.groups()
+            first, second = int(first), int(second)
+            # dateutil reads month first unless that cannot be a month.
+            if first <= 12:
+                return datetime.date(int(year), first, second)
+            if second <= 12:
+                return datetime.date(int(year), second, first)
+    except ValueError:
+        # "31 June": let dateutil have the final word.
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _exact_time(text: str) -> Optional[datetime.time]:
+    match = _TIME.fullmatch(text.strip())
+    if match is None:
+        return None
+    hour, minute, meridiem = match.groups()
+    if minute is None and meridiem is None:
+        return None
+    hour, minute = int(hour), int(minute or 0)
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.lower() == "p" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return datetime.time(hour, minute)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _fuzzy(text: str, today: datetime.date) -> Optional[datetime.datetime]:
+    # `today` only keys the cache: dateutil reads it from the clock itself.
+    try:
+        return _dateutil_parse(text, fuzzy=True)
+    except Exception:
+        return None
+
+
+def parse_date(text) -> Optional[datetime.date]:
+    """The date in `text`, as dateutil's fuzzy parser reads it; None if it
+    has none."""
+    text = str(text)
+    exact = _exact_date(text)
+    if exact is not None:
+        return exact
+    parsed = _fuzzy(text, datetime.date.today())
+    return parsed.date() if parsed is not None else None
+
+
+def parse_time(text) -> Optional[datetime.time]:
+    """The time of day in `text`, as dateutil's fuzzy parser reads it; None
+    if it has none."""
+    text = str(text)
+    exact = _exact_time(text)
+    if exact is not None:
+        return exact
+    parsed = _fuzzy(text, datetime.date.today())
+    return parsed.time() if parsed is not None else None
+
+
+def year_of(text) -> Optional[int]:
+    date = parse_date(text)
+    return date.year if date is not None else None
+
+
+_today: dict[str, tuple[datetime.date, float]] = {}
+_today_lock = threading.Lock()
+
+
+def today_in(state: str) -> datetime.date:
+    """Today's date in `state`'s timezone.
+
+    Worked out once per state per day: the answer is kept until local
+    midnight.
+    """
+    state = state.upper()
+    cached = _today.get(state)
+    now = time.time()
+    if cached is not None and now < cached[1]:
+        return cached[0]
+    timezone = pytz.timezone(TIMEZONES_BY_STATE[state])
+    today = datetime.datetime.fromtimestamp(now, timezone).date()
+    midnight = timezone.localize(
+        datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time())
+    )
+    with _today_lock:
+        _today[state] = (today, midnight.timestamp())
+    return today
+
+
+def clear_caches() -> None:
+    """Forget every memoised answer (for tests and benchmarks)."""
+    _fuzzy.cache_clear()
+    _exact_date.cache_clear()
+    _exact_time.cache_clear()
+    with _today_lock:
+        _today.clear()
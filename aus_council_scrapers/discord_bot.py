@@ -1,12 +1,43 @@
+"""Discord notifications, delivered in the background by one session per run.
+
+A `DiscordNotifier` used to be built for every meeting: a new
+`discord.Client`, a gateway login through `client.run()`, one message,
+then close, all while `flush()` held the scraper's worker thread. On a busy
+night each council paid seconds of handshake before its worker could move
+on.
+
+Now one notifier lives for the whole run (or the daemon's lifetime), on its
+own thread and event loop. `send_message` only queues the message. The
+loop waits `batch_delay` for more, then posts everything queued for a
+channel in as few messages as Discord's length limit allows. Posts to a
+channel are kept at least `min_interval` apart, and a rate-limited post is
+retried after the delay Discord asks for. `flush()` waits until everything
+queued so far has been delivered, and `close()` flushes and stops the loop.
+
+`GatewayTransport` logs the bot in once and posts over Discord's REST API.
+`StubTransport` records posts in memory, for tests.
+"""
+
+from __future__ import annotations
+
 import asyncio
-import os
-from asyncio import AbstractEventLoop
-from typing import List, Optional
+import atexit
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Protocol
 
 import discord
-from dataclasses import dataclass
 
-from dotenv import dotenv_values
+# Discord rejects messages longer than this.
+MAX_MESSAGE_CHARS = 2000
+# How long the first queued message waits for others to join its batch.
+BATCH_DELAY = 2.0
+# Discord allows five posts per channel every five seconds.
+MIN_INTERVAL = 1.0
+MAX_ATTEMPTS = 4
+RETRY_DELAY = 2.0
 
 
 @dataclass
@@ -15,27 +46,270 @@ class QueuedMessage:
     message: str
 
 
-class DiscordNotifier:
-    def __init__(self, token):
-        intents = discord.Intents.default()
-        intents.message_content = True
-        self.__client = discord.Client(intents=intents)
-        self.__config = dotenv_values(".env") if os.path.exists(".env") else {}
-        self.__client.on_ready = self.__on_ready
-        self.__message_queue: List[QueuedMessage] = []
+class RateLimited(Exception):
+    """Discord asked for `retry_after` seconds before the next post."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"rate limited for {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class Transport(Protocol):
+    async def start(self) -> None: ...
+
+    async def send(self, channel_id: int, content: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class GatewayTransport:
+    """Posts through one logged-in `discord.Client`.
+
+    Only the REST session is opened: posting needs no gateway connection,
+    so there is no handshake at all, let alone one per message.
+    """
+
+    def __init__(self, token: str):
         self.__token = token
+        self.__client: Optional[discord.Client] = None
+        self.__channels: dict[int, discord.abc.Messageable] = {}
+
+    async def start(self) -> None:
+        self.__client = discord.Client(intents=discord.Intents.none())
+        await self.__client.login(self.__token)
+
+    async def send(self, channel_id: int, content: str) -> None:
+        channel = self.__channels.get(channel_id)
+        if channel is None:
+            channel = await self.__client.fetch_channel(channel_id)
+            self.__channels[channel_id] = channel
+        try:
+            await channel.send(content)
+        except discord.RateLimited as e:
+            raise RateLimited(e.retry_after) from e
+
+    async def close(self) -> None:
+        if self.__client is not None:
+            await self.__client.close()
+
+
+class StubTransport:
+    """Records what would have been posted, failing the first `failures`."""
+
+    def __init__(self, failures: int = 0, rate_limited_for: Optional[float] = None):
+        self.sent: list[tuple[int, str, float]] = []
+        self.started = self.closed = False
+        self.failures = failures
+        self.rate_limited_for = rate_limited_for
+
+    async def start(self) -> None:
+        self.started = True
+
+    async def send(self, channel_id: int, content: str) -> None:
+        if self.failures:
+            self.failures -= 1
+            if self.rate_limited_for is not None:
+                raise RateLimited(self.rate_limited_for)
+            raise ConnectionError("stub failure")
+        self.sent.append((channel_id, content, time.monotonic()))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def batch_posts(messages: list[str], limit: int = MAX_MESSAGE_CHARS) -> list[str]:
+    """Join messages into as few posts of at most `limit` characters as
+    possible, in order; a message that alone is too long is truncated."""
+    posts: list[str] = []
+    for message in messages:
+        message = message[:limit]
+        if posts and len(posts[-1]) + 2 + len(message) <= limit:
+            posts[-1] += "\n\n" + message
+        else:
+            posts.append(message)
+    return posts
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class DiscordNotifier:
+    """Queues messages from any thread; delivers them on its own loop."""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        batch_delay: float = BATCH_DELAY,
+        min_interval: float = MIN_INTERVAL,
+    ):
+        if transport is None:
+            transport = GatewayTransport(token)
+        self.batch_delay = batch_delay
+        self.min_interval = min_interval
+        self.sent = 0
+        self.dropped = 0
+        self.__transport = transport
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__inbox: Optional[asyncio.Queue] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__ready = threading.Event()
+        self.__lock = threading.Lock()
+        self.__last_post: dict[int, float] = {}
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def __start(self) -> None:
+        with self.__lock:
+            if self.__thread is None:
+                self.__ready = threading.Event()
+                self.__thread = threading.Thread(
+                    target=self.__serve,
+                    args=(self.__ready,),
+                    name="discord-notifier",
+                    daemon=True,
+                )
+                self.__thread.start()
+            ready = self.__ready
+        ready.wait()
+
+    def __put(self, item) -> None:
+        self.__start()
+        self.__loop.call_soon_threadsafe(self.__inbox.put_nowait, item)
+
+    def send_message(self, channel_id, message: str) -> None:
+        """Queue a message; returns at once."""
+        self.__put(QueuedMessage(int(channel_id), message))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every message queued so far is delivered (or dropped).
+
+        Returns False if `timeout` ran out first.
+        """
+        if self.__thread is None:
+            return True
+        marker = _Flush()
+        self.__put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 30) -> None:
+        """Deliver what is queued, then stop the loop and its session."""
+        with self.__lock:
+            thread = self.__thread
+        if thread is None:
+            return
+        self.__loop.call_soon_threadsafe(self.__inbox.put_nowait, _STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            self.__logger.error("Discord messages still queued at shutdown")
+        with self.__lock:
+            self.__thread = None
+
+    def __serve(self, ready: threading.Event) -> None:
+        self.__loop = asyncio.new_event_loop()
+        self.__inbox = asyncio.Queue()
+        ready.set()
+        try:
+            self.__loop.run_until_complete(self.__run())
+        finally:
+            self.__loop.close()
+
+    async def __run(self) -> None:
+        try:
+            await self.__transport.start()
+        except Exception as e:
+            self.__logger.exception(f"Could not log in to Discord: {e}")
+        try:
+            stopping = False
+            while not stopping:
+                item = await self.__inbox.get()
+                batch, markers = [], []
+                deadline = self.__loop.time() + self.batch_delay
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    if isinstance(item, _Flush):
+                        markers.append(item)
+                        break
+                    batch.append(item)
+                    try:
+                        item = await asyncio.wait_for(
+                            self.__inbox.get(),
+                            max(deadline - self.__loop.time(), 0),
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                await self.__deliver(batch)
+                for marker in markers:
+                    marker.done.set()
+        finally:
+            # Whatever arrived after the stop, deliver rather than lose.
+            leftovers = []
+            while not self.__inbox.empty():
+                item = self.__inbox.get_nowait()
+                if isinstance(item, QueuedMessage):
+                    leftovers.append(item)
+                elif isinstance(item, _Flush):
+                    item.done.set()
+            await self.__deliver(leftovers)
+            await self.__transport.close()
+
+    async def __deliver(self, batch: list[QueuedMessage]) -> None:
+        by_channel: dict[int, list[str]] = {}
+        for queued in batch:
+            by_channel.setdefault(queued.channel_id, []).append(queued.message)
+        for channel_id, messages in by_channel.items():
+            for post in batch_posts(messages):
+                await self.__post(channel_id, post)
+
+    async def __post(self, channel_id: int, content: str) -> None:
+        for attempt in range(MAX_ATTEMPTS):
+            wait = self.__last_post.get(channel_id, float("-inf")) + self.min_interval
+            if wait > self.__loop.time():
+                await asyncio.sleep(wait - self.__loop.time())
+            try:
+                await self.__transport.send(channel_id, content)
+            except RateLimited as e:
+                error, delay = e, e.retry_after
+            except Exception as e:
+                error, delay = e, RETRY_DELAY * 2**attempt
+            else:
+                self.sent += 1
+                return
+            finally:
+                self.__last_post[channel_id] = self.__loop.time()
+            if attempt + 1 < MAX_ATTEMPTS:
+                self.__logger.warning(
+                    f"Discord post failed ({error}); retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+        self.__logger.error(f"Dropped a Discord message: {error}")
+        self.dropped += 1
+
+
+_shared: Optional[DiscordNotifier] = None
+_shared_lock = threading.Lock()
+
 
-    async def __on_ready(self):
-        print("On ready")
-        while len(self.__message_queue):
-            message = self.__message_queue.pop()
-            print("Send message")
-            channel = await self.__client.fetch_channel(message.channel_id)
-            await channel.send(message.message)
-        await self.__client.close()
+def shared_notifier(token: str) -> DiscordNotifier:
+    """The process-wide notifier, logged in with `token` on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = DiscordNotifier(token)
+            atexit.register(_shared.close)
+        return _shared
 
-    def send_message(self, channel_id, message):
-        self.__message_queue.append(QueuedMessage(channel_id, message))
 
-    def flush(self):
-        self.__client.run(self.__token)
+def close_shared_notifier() -> None:
+    """Deliver what the process-wide notifier has queued and stop it."""
+    global _shared
+    with _shared_lock:
+        notifier, _shared = _shared, None
+    if notifier is not None:
+        notifier.close()
@@ -0,0 +1,289 @@
+"""Local store of extracted agenda and minutes text and keyword counts.
+
+`--fresh` deletes `agendas.db`, and every run downloaded and parsed each
+PDF it touched again, even one parsed the night before: 10-20 MB and a full
+`fitz` pass per agenda, to get back the same counts.
+
+`DocCache` is a SQLite file keyed by content. A document's extracted text
+is stored once, zlib-compressed, under the SHA-256 of the PDF bytes, with
+its word count and each keyword pattern's count. Each URL points at the
+document it last served, with the `ETag`/`Last-Modified` it came with, so
+`main.process_single_pdf` can revalidate with a conditional request: a 304
+needs no download at all, and a re-upload of identical bytes under a new
+URL needs no parse. Counts are stored per pattern, so adding a keyword
+costs a decompress and one scan of the text, not a download.
+
+The file is bounded by size, evicting the least recently used documents.
+It is on by default in legacy mode; `DOC_CACHE_PATH` moves it, and
+`--no-doc-cache` (or an empty `DOC_CACHE_PATH`) turns it off.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Optional, Union
+
+from aus_council_scrapers.keywords import KeywordCounts
+
+DEFAULT_PATH = ".cache/documents.sqlite"
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    sha256 TEXT PRIMARY KEY,
+    text BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    wordcount INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_last_used ON documents (last_used);
+CREATE TABLE IF NOT EXISTS counts (
+    sha256 TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (sha256, pattern)
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS urls_sha256 ON urls (sha256);
+"""
+
+
+def pattern_key(regex: Union[str, re.Pattern]) -> str:
+    """How a keyword pattern is stored: its source, plus any flags."""
+    if isinstance(regex, re.Pattern):
+        flags = regex.flags & ~re.UNICODE
+        return f"(?{flags}){regex.pattern}" if flags else regex.pattern
+    return regex
+
+
+@dataclass
+class UrlEntry:
+    url: str
+    sha256: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> dict[str, str]:
+        """Conditional-request headers for revalidating this URL."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DocCache:
+    """Extracted text and keyword counts by PDF content hash.
+
+    Safe to share between threads: there is one connection, used under a
+    lock. Every call is short; the slow parts (download, parse, counting)
+    happen outside it.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__conn: Optional[sqlite3.Connection] = None
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def __db(self) -> sqlite3.Connection:
+        # Opened lazily, so constructing a cache costs nothing.
+        if self.__conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.__conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.__conn.executescript(_SCHEMA)
+        return self.__conn
+
+    def lookup(self, url: str) -> Optional[UrlEntry]:
+        """What `url` served last time, if that document is still stored."""
+        with self.__lock:
+            row = (
+                self.__db()
+                .execute(
+                    "SELECT u.sha256, u.etag, u.last_modified FROM urls u"
+                    " JOIN documents d ON d.sha256 = u.sha256 WHERE u.url = ?",
+                    (url,),
+                )
+                .fetchone()
+            )
+        return UrlEntry(url, *row) if row else None
+
+    def remember(self, url: str, sha256: str, headers: Mapping[str, str]) -> None:
+        """Record that `url` served `sha256`, with the validators it sent."""
+        with self.__lock, self.__db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?)",
+                (url, sha256, headers.get("ETag"), headers.get("Last-Modified")),
+            )
+
+    def refresh(self, entry: UrlEntry, headers: Mapping[str, str]) -> None:
+        """Update a URL's validators after a 304."""
+        self.remember(
+            entry.url,
+            entry.sha256,
+            {
+                "ETag": headers.get("ETag") or entry.etag,
+                "Last-Modified": headers.get("Last-Modified") or entry.last_modified,
+            },
+        )
+
+    def counts(
+        self, sha256: str, regexes: Iterable[Union[str, re.Pattern]]
+    ) -> tuple[KeywordCounts, Optional[int]]:
+        """The stored counts for `regexes`, and the word count.
+
+        Patterns not counted yet are missing from the dict; the word count
+        is None when the document is not stored at all.
+        """
+        with self.__lock, self.__db() as db:
+            row = db.execute(
+                "SELECT wordcount FROM documents WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return {}, None
+            self.hits += 1
+            db.execute(
+                "UPDATE documents SET last_used = ? WHERE sha256 = ?",
+                (self.__clock(), sha256),
+            )
+            stored = dict(
+                db.execute(
+                    "SELECT pattern, count FROM counts WHERE sha256 = ?", (sha256,)
+                )
+            )
+        counts = {}
+        for regex in regexes:
+            key = pattern_key(regex)
+            if key in stored:
+                counts[regex] = stored[key]
+        return counts, row[0]
+
+    def text(self, sha256: str) -> Optional[str]:
+        """The document's extracted text, or None if it is not stored."""
+        with self.__lock:
+            row = (
+                self.__db()
+                .execute("SELECT text FROM documents WHERE sha256 = ?", (sha256,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def store(
+        self,
+        sha256: str,
+        text: str,
+        wordcount: int,
+        counts: KeywordCounts,
+    ) -> None:
+        """Keep a document's text and word count along with `counts`."""
+        data = zlib.compress(text.encode("utf-8"))
+        try:
+            with self.__lock, self.__db() as db:
+                db.execute(
+                    "INSERT OR IGNORE INTO documents VALUES (?, ?, ?, ?, ?)",
+                    (sha256, data, len(data), wordcount, self.__clock()),
+                )
+                self.__add_counts(db, sha256, counts)
+                self.__evict(db)
+        except sqlite3.Error as e:
+            self.__logger.warning(f"Could not cache document {sha256[:12]}: {e}")
+
+    def add_counts(self, sha256: str, counts: KeywordCounts) -> None:
+        """Keep counts for patterns added since the document was stored."""
+        with self.__lock, self.__db() as db:
+            self.__add_counts(db, sha256, counts)
+
+    def stats(self) -> dict[str, int]:
+        with self.__lock:
+            documents, size = (
+                self.__db()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM documents")
+                .fetchone()
+            )
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "documents": documents,
+                "bytes": size,
+            }
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__conn is not None:
+                self.__conn.close()
+                self.__conn = None
+
+    @staticmethod
+    def __add_counts(db, sha256: str, counts: KeywordCounts) -> None:
+        db.executemany(
+            "INSERT OR REPLACE INTO counts VALUES (?, ?, ?)",
+            [(sha256, pattern_key(regex), n) for regex, n in counts.items()],
+        )
+
+    def __evict(self, db) -> None:
+        (total,) = db.execute("SELECT COALESCE(SUM(size), 0) FROM documents").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for sha256, size in db.execute(
+            "SELECT sha256, size FROM documents ORDER BY last_used"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            total -= size
+            evicted.append((sha256,))
+        db.executemany("DELETE FROM documents WHERE sha256 = ?", evicted)
+        db.executemany("DELETE FROM counts WHERE sha256 = ?", evicted)
+        db.executemany("DELETE FROM urls WHERE sha256 = ?", evicted)
+
+
+_shared: dict[str, DocCache] = {}
+_shared_lock = threading.Lock()
+
+
+def default_doc_cache() -> Optional[DocCache]:
+    """The cache at `DOC_CACHE_PATH`, or None when it is turned off.
+
+    `DOC_CACHE_MAX_MB` bounds its size. Read at use rather than at import,
+    like `http_cache.default_cache`, so `main` can set it from the command
+    line.
+    """
+    path = os.environ.get("DOC_CACHE_PATH", DEFAULT_PATH)
+    if not path:
+        return None
+    with _shared_lock:
+        if path not in _shared:
+            max_mb = os.environ.get("DOC_CACHE_MAX_MB")
+            _shared[path] = DocCache(
+                path,
+                int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES,
+            )
+        return _shared[path]
@@ -0,0 +1,227 @@
+"""A bounded pool of warm headless-Chrome drivers shared by every fetcher.
+
+Each `DefaultFetcher` used to start its own Chrome on first Selenium use and
+keep it until `close()`, which nothing called, so every Selenium council in a
+run held a browser — a few hundred MB each — until the process exited.
+Startup is seconds per driver, and memory is what stopped us running those
+councils in parallel.
+
+`DriverPool` starts at most `size` drivers and lends them out. A fetcher
+leases one on its first Selenium call and gives it back in `close()`; the
+next lease gets the same warm browser with its cookies, storage and page
+cleared. A driver is quit instead of reused once it has loaded `max_pages`
+pages, or when it crashed, so a leaking or wedged Chrome does not outlive
+one council. When every driver is out, `acquire` waits, and the wait is
+recorded so a run can report whether the pool is too small.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES = 100
+
+
+def new_chrome_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    # Suppress automation signals that bot-detection (e.g. Akamai) checks for
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {
+            "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        },
+    )
+    return driver
+
+
+def reset_driver(driver) -> None:
+    """Leave no trace of the previous council for the next lease."""
+    driver.delete_all_cookies()
+    driver.execute_script(
+        "try { window.localStorage.clear(); window.sessionStorage.clear(); }"
+        " catch (e) {}"
+    )
+    driver.get("about:blank")
+
+
+@dataclass
+class DriverLease:
+    driver: Any
+    pages: int = 0
+    broken: bool = False
+
+
+@dataclass
+class PoolStats:
+    leases: int = 0
+    started: int = 0
+    recycled: int = 0
+    crashed: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    waits: list[float] = field(default_factory=list, repr=False)
+
+
+class DriverPool:
+    """At most `size` drivers, leased one council at a time.
+
+    Thread-safe. `factory` starts a driver and `reset` clears one between
+    leases; both are injectable so the pool can be tested without Chrome.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        factory: Callable[[], Any] = new_chrome_driver,
+        reset: Callable[[Any], None] = reset_driver,
+        monotonic: Callable[[], float] = time.monotonic,
+    ):
+        self.size = size
+        self.max_pages = max_pages
+        self.__factory = factory
+        self.__reset = reset
+        self.__monotonic = monotonic
+        self.__idle: list[Any] = []
+        self.__live = 0
+        self.__closed = False
+        self.__stats = PoolStats()
+        self.__cond = threading.Condition()
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def acquire(self, timeout: Optional[float] = None) -> DriverLease:
+        """Lease a driver, starting one if the pool has room.
+
+        Raises `TimeoutError` if none comes free within `timeout` seconds.
+        """
+        started = self.__monotonic()
+        with self.__cond:
+            while not self.__idle and self.__live >= self.size:
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (self.__monotonic() - started)
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No Selenium driver free after {timeout:.0f}s "
+                            f"(pool size {self.size})"
+                        )
+                self.__cond.wait(remaining)
+
+            driver = self.__idle.pop() if self.__idle else None
+            if driver is None:
+                # Claim the slot now; Chrome starts outside the lock.
+                self.__live += 1
+            self.__record_wait(self.__monotonic() - started)
+
+        if driver is None:
+            try:
+                driver = self.__factory()
+            except BaseException:
+                with self.__cond:
+                    self.__live -= 1
+                    self.__cond.notify()
+                raise
+            with self.__cond:
+                self.__stats.started += 1
+        return DriverLease(driver)
+
+    def release(self, lease: DriverLease) -> None:
+        """Return a leased driver: reset it for reuse, or quit it."""
+        reason = None
+        if lease.broken:
+            reason = "crashed"
+        elif lease.pages >= self.max_pages:
+            reason = "recycled"
+        else:
+            try:
+                self.__reset(lease.driver)
+            except Exception as e:
+                self.__logger.warning(f"Could not reset a Selenium driver: {e}")
+                reason = "crashed"
+
+        if reason is None:
+            with self.__cond:
+                if not self.__closed:
+                    self.__idle.append(lease.driver)
+                    self.__cond.notify()
+                    return
+                # Shut down while leased: nothing will quit it from idle.
+                self.__live -= 1
+            self.__quit(lease.driver)
+            return
+
+        self.__quit(lease.driver)
+        with self.__cond:
+            self.__live -= 1
+            if reason == "crashed":
+                self.__stats.crashed += 1
+            else:
+                self.__stats.recycled += 1
+            self.__cond.notify()
+
+    def stats(self) -> PoolStats:
+        with self.__cond:
+            stats = PoolStats(**self.__stats.__dict__)
+            stats.waits = list(self.__stats.waits)
+            return stats
+
+    def shutdown(self) -> None:
+        """Quit every idle driver. Leased ones are quit when released."""
+        with self.__cond:
+            self.__closed = True
+            idle, self.__idle = self.__idle, []
+            self.__live -= len(idle)
+        for driver in idle:
+            self.__quit(driver)
+
+    def __record_wait(self, waited: float) -> None:
+        stats = self.__stats
+        stats.leases += 1
+        if waited > 0.001:
+            stats.waited += 1
+            stats.waits.append(waited)
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+    def __quit(self, driver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            self.__logger.debug(f"Selenium driver did not quit cleanly: {e}")
+
+
+_shared: Optional[DriverPool] = None
+_shared_lock = threading.Lock()
+
+
+def shared_driver_pool() -> DriverPool:
+    """The process-wide pool, sized by `SELENIUM_POOL_SIZE`.
+
+    `SELENIUM_MAX_PAGES` sets how many pages a driver loads before it is
+    replaced.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = DriverPool(
+                size=int(os.environ.get("SELENIUM_POOL_SIZE", DEFAULT_POOL_SIZE)),
+                max_pages=int(os.environ.get("SELENIUM_MAX_PAGES", DEFAULT_MAX_PAGES)),
+            )
+            atexit.register(_shared.shutdown)
+        return _shared
@@ -0,0 +1,202 @@
+"""Which parts of each council's listing are closed, and what they held.
+
+A past year's InfoCouncil page whose every meeting has both its agenda and
+its minutes essentially never changes again, yet every run fetched and
+parsed it, back to 2019, for every council: most of a run's requests, and
+most of its exposure to WAFs.
+
+`PeriodHistory` remembers, per council and period (a year, or a page), the
+meetings last parsed from it and their hash. The hash is of the meetings,
+not the page, so a session token or timestamp in the markup does not count
+as a change. A period is closed once it ended more than `close_after` ago,
+it is complete, and two fetches in a row found the same meetings. Complete
+means every meeting has its minutes or is itself older than `close_after`:
+panels and cancelled meetings never get minutes, and a year in which any
+meeting lacked them would otherwise never close. An empty period never
+closes. A closed period is answered from the store without a request.
+Nothing reopens a period but `--full`, which fetches everything and
+records what it finds.
+
+Scrapers reach it through `BaseScraper.history`, which `main` sets; it is
+None otherwise, so tests and scripts never depend on what an earlier run
+stored.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Callable, Optional
+
+from aus_council_scrapers import clock
+from aus_council_scrapers.base import ScraperReturn
+
+DEFAULT_PATH = ".cache/history.sqlite"
+DEFAULT_CLOSE_AFTER = datetime.timedelta(days=180)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS periods (
+    council TEXT NOT NULL,
+    period TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    closed INTEGER NOT NULL,
+    meetings TEXT NOT NULL,
+    checked TEXT NOT NULL,
+    PRIMARY KEY (council, period)
+);
+"""
+
+
+def is_complete(meetings: list[ScraperReturn], cutoff: datetime.date) -> bool:
+    """Every meeting has its minutes, or took place before `cutoff`.
+
+    A period with no meetings is never complete: an error page served with a
+    200, or a template the parser no longer reads, looks just like that.
+    """
+    if not meetings:
+        return False
+    for meeting in meetings:
+        if meeting.minutes_url:
+            continue
+        try:
+            if meeting.cleaned_date >= cutoff:
+                return False
+        except ValueError:
+            return False
+    return True
+
+
+class PeriodHistory:
+    """Closed periods for every council, in one SQLite file.
+
+    Safe to share between threads: one connection, used under a lock.
+    `refetch_all` (``--full``) makes every period read as open, while still
+    recording what is fetched.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        close_after: datetime.timedelta = DEFAULT_CLOSE_AFTER,
+        refetch_all: bool = False,
+        today: Callable[[], datetime.date] = clock.today,
+    ):
+        self.path = path
+        self.close_after = close_after
+        self.refetch_all = refetch_all
+        self.skipped = 0
+        self.fetched = 0
+        self.__today = today
+        self.__lock = threading.Lock()
+        self.__conn: Optional[sqlite3.Connection] = None
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    def __db(self) -> sqlite3.Connection:
+        if self.__conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.__conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.__conn.executescript(_SCHEMA)
+        return self.__conn
+
+    def for_council(self, council: str) -> "CouncilHistory":
+        return CouncilHistory(self, council)
+
+    def closed(self, council: str, period: str) -> Optional[list[ScraperReturn]]:
+        """The stored meetings of a closed period, or None if it is open."""
+        if self.refetch_all:
+            return None
+        with self.__lock:
+            row = (
+                self.__db()
+                .execute(
+                    "SELECT meetings FROM periods"
+                    " WHERE council = ? AND period = ? AND closed",
+                    (council, period),
+                )
+                .fetchone()
+            )
+            if row is not None:
+                self.skipped += 1
+        if row is None:
+            return None
+        return [ScraperReturn.from_dict(d) for d in json.loads(row[0])]
+
+    def record(
+        self,
+        council: str,
+        period: str,
+        meetings: list[ScraperReturn],
+        ends: datetime.date,
+    ) -> bool:
+        """Store a fetched period; returns whether it is now closed."""
+        data = json.dumps([m.to_dict() for m in meetings], ensure_ascii=False)
+        digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        cutoff = self.__today() - self.close_after
+        try:
+            with self.__lock, self.__db() as db:
+                self.fetched += 1
+                row = db.execute(
+                    "SELECT sha256 FROM periods WHERE council = ? AND period = ?",
+                    (council, period),
+                ).fetchone()
+                closed = (
+                    ends < cutoff
+                    and is_complete(meetings, cutoff)
+                    and row is not None
+                    and row[0] == digest
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO periods VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        council,
+                        period,
+                        digest,
+                        closed,
+                        data,
+                        self.__today().isoformat(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self.__logger.warning(f"Could not record {council} {period}: {e}")
+            return False
+        return closed
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__conn is not None:
+                self.__conn.close()
+                self.__conn = None
+
+
+class CouncilHistory:
+    """One council's view of a `PeriodHistory`."""
+
+    def __init__(self, history: PeriodHistory, council: str):
+        self.history = history
+        self.council = council
+
+    def closed(self, period: str) -> Optional[list[ScraperReturn]]:
+        return self.history.closed(self.council, period)
+
+    def record(
+        self,
+        period: str,
+        meetings: list[ScraperReturn],
+        ends: datetime.date,
+    ) -> bool:
+        return self.history.record(self.council, period, meetings, ends)
+
+
+def default_history(refetch_all: bool = False) -> Optional[PeriodHistory]:
+    """The store at `HISTORY_PATH`, or None when it is set empty."""
+    path = os.environ.get("HISTORY_PATH", DEFAULT_PATH)
+    if not path:
+        return None
+    return PeriodHistory(path, refetch_all=refetch_all)
@@ -0,0 +1,254 @@
+"""On-disk HTTP cache for conditional requests.
+
+Most of what a nightly run fetches has not changed since the night before:
+InfoCouncil year pages for past years, Darebin's year pages, Banyule's
+listings. Fetching them in full every time costs the council bandwidth and
+us a slot in its rate budget for nothing.
+
+`HttpCache` keeps each GET response body on disk with its `ETag` and
+`Last-Modified` validators. `DefaultFetcher` (and `AsyncFetcher`) sends
+them back as `If-None-Match` / `If-Modified-Since`, and a 304 is answered
+from disk. A
+response whose `Cache-Control: max-age` (or `Expires`) has not run out is
+served without a request at all; `no-store` is never written and `no-cache`
+always revalidates. The directory is bounded by size, evicting the least
+recently used entries first.
+
+The cache is opt-in: set `HTTP_CACHE_DIR` (or pass `--http-cache` to
+`main`). It sits under `DefaultFetcher`, so `RecordingFetcher` records the
+body the scraper was actually given and replays stay exact.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+# Once over `max_bytes`, evict down to this fraction of it, so that the
+# writes after an eviction do not each trigger another.
+EVICT_TO = 0.9
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Absolute time (seconds since the epoch) the body is fresh until, or None
+    # when every use must be revalidated.
+    fresh_until: Optional[float] = None
+
+    def validators(self) -> dict[str, str]:
+        """Conditional-request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _cache_control(headers) -> set[str]:
+    value = headers.get("Cache-Control") or ""
+    return {part.strip().lower() for part in value.split(",") if part.strip()}
+
+
+def _fresh_until(headers, now: float) -> Optional[float]:
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return None
+
+    match = _MAX_AGE_RE.search(headers.get("Cache-Control") or "")
+    if match:
+        return now + int(match.group(1))
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            # "Expires: 0" and other junk mean already expired.
+            return None
+    return None
+
+
+class HttpCache:
+    """A directory of cached GET responses, bounded to `max_bytes`.
+
+    Safe to share between threads. Each entry is one JSON file named by a
+    hash of the request key; its modification time records when it was last
+    used, which is what eviction orders by. The directory is scanned once,
+    and sizes and last-used times are kept in memory from then on.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        # name -> (size, last used)
+        self.__entries: Optional[dict[str, tuple[int, float]]] = None
+        self.__bytes = 0
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def key(url: str, kwargs: Optional[dict] = None) -> str:
+        if not kwargs:
+            return url
+        return url + "\n" + json.dumps(kwargs, sort_keys=True, default=str)
+
+    def __path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def __name(self, key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+
+    def __index(self) -> dict[str, tuple[int, float]]:
+        # Scanned once, lazily, so constructing a cache costs nothing.
+        if self.__entries is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.__entries = {}
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    self.__entries[entry.name] = (stat.st_size, stat.st_mtime)
+            self.__bytes = sum(size for size, _ in self.__entries.values())
+        return self.__entries
+
+    def __forget(self, name: str) -> None:
+        size, _ = self.__index().pop(name, (0, 0.0))
+        self.__bytes -= size
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """The stored entry for `key`, or None. Marks it recently used."""
+        with self.__lock:
+            index = self.__index()
+            name = self.__name(key)
+            if name not in index:
+                return None
+            try:
+                with open(self.__path(name), encoding="utf-8") as f:
+                    entry = CacheEntry(**json.load(f))
+                os.utime(self.__path(name))
+            except (OSError, ValueError, TypeError):
+                # A half-written or foreign file is just a miss.
+                self.__forget(name)
+                return None
+            index[name] = (index[name][0], time.time())
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.fresh_until is not None and self.__clock() < entry.fresh_until
+
+    def store(self, key: str, url: str, body: str, headers) -> None:
+        """Keep a 200 response if it can ever be reused."""
+        if "no-store" in _cache_control(headers):
+            return
+
+        entry = CacheEntry(
+            url=url,
+            body=body,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            fresh_until=_fresh_until(headers, self.__clock()),
+        )
+        if not (entry.etag or entry.last_modified or entry.fresh_until):
+            # Nothing to revalidate with and no lifetime: it cannot be reused.
+            return
+        self.__write(key, entry)
+
+    def refresh(self, key: str, entry: CacheEntry, headers) -> None:
+        """Update an entry's validators and lifetime after a 304."""
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.fresh_until = _fresh_until(headers, self.__clock())
+        self.__write(key, entry)
+
+    def record(self, hit: bool) -> None:
+        with self.__lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.__index()),
+                "bytes": self.__bytes,
+            }
+
+    def __write(self, key: str, entry: CacheEntry) -> None:
+        data = json.dumps(entry.__dict__, ensure_ascii=False).encode("utf-8")
+        with self.__lock:
+            index = self.__index()
+            name = self.__name(key)
+            tmp = self.__path(f"{name}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, self.__path(name))
+            except OSError as e:
+                self.__logger.warning(f"Could not cache {entry.url}: {e}")
+                return
+            self.__forget(name)
+            index[name] = (len(data), time.time())
+            self.__bytes += len(data)
+            if self.__bytes > self.max_bytes:
+                self.__evict()
+
+    def __evict(self) -> None:
+        index = self.__entries
+        target = self.max_bytes * EVICT_TO
+        for name in sorted(index, key=lambda name: index[name][1]):
+            if self.__bytes <= target:
+                break
+            self.__forget(name)
+            try:
+                os.remove(self.__path(name))
+            except OSError:
+                pass
+
+
+_shared: dict[str, HttpCache] = {}
+_shared_lock = threading.Lock()
+
+
+def default_cache() -> Optional[HttpCache]:
+    """The cache named by `HTTP_CACHE_DIR`, or None when caching is off.
+
+    Read at fetch time rather than at import: scrapers build their fetchers
+    when they register, before `main` has parsed `--http-cache`.
+    """
+    directory = os.environ.get("HTTP_CACHE_DIR")
+    if not directory:
+        return None
+    with _shared_lock:
+        if directory not in _shared:
+            max_mb = os.environ.get("HTTP_CACHE_MAX_MB")
+            _shared[directory] = HttpCache(
+                directory,
+                int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES,
+            )
+        return _shared[directory]
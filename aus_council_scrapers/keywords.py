@@ -0,0 +1,98 @@
+"""Keyword counting for agenda and minutes text.
+
+`extract_keywords` used to normalise the text in three full `re.sub` passes
+plus a lowercased copy, then hand each raw pattern in `COUNCIL_HOUSING_REGEX`
+to `re.findall`, so every document was scanned about sixteen times. This is
+the hot spot of legacy mode on 500-page agendas.
+
+`KeywordMatcher` compiles a pattern set once and is cached per set, and the
+text is normalised a page at a time with one split/join instead of two
+regex passes over whitespace. The patterns are still counted one scan each:
+folding them into one alternation (with a lookahead, so each pattern keeps
+its own non-overlapping matches) was measured slower under CPython's `re`
+than the separate scans, which use its literal-prefix fast search. See
+`scripts/bench_keywords.py`.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import Iterable, Union
+
+KeywordCounts = dict[str, int]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalise(text: str) -> str:
+    """Collapse whitespace, drop punctuation, lowercase.
+
+    The order matters and is kept from the original: collapsing first means
+    "a - b" becomes "a  b", with two spaces, which the word count has always
+    counted as an extra word.
+    """
+    # Same as re.sub(r"\s+", " ", text): str.split() splits on the same
+    # whitespace, but drops rather than collapses a leading or trailing run.
+    collapsed = " ".join(text.split())
+    if text[:1].isspace():
+        collapsed = " " + collapsed if collapsed else " "
+    if text[-1:].isspace() and collapsed != " ":
+        collapsed += " "
+    return _PUNCTUATION.sub("", collapsed).lower()
+
+
+def normalise_pages(pages: Iterable[str]) -> str:
+    """`normalise("".join(pages))`, computed one page at a time.
+
+    Each substitution only looks at one character or one whitespace run, so
+    the pages can be normalised separately. The exception is a whitespace
+    run straddling a page break: normalised whole it is one space, but each
+    page contributes one, so the second is dropped.
+    """
+    parts = []
+    previous_ends_in_space = False
+    for page in pages:
+        if not page:
+            continue
+        cleaned = normalise(page)
+        if previous_ends_in_space and page[0].isspace():
+            cleaned = cleaned[1:]
+        parts.append(cleaned)
+        previous_ends_in_space = page[-1].isspace()
+    return "".join(parts)
+
+
+class KeywordMatcher:
+    """Counts of several patterns, compiled once.
+
+    Counts are keyed by the patterns as given, exactly as `extract_keywords`
+    always returned them.
+    """
+
+    def __init__(self, regexes: Iterable[Union[str, re.Pattern]]):
+        self.regexes = list(regexes)
+        self.__compiled = [re.compile(regex) for regex in self.regexes]
+
+    def count(self, text: str) -> KeywordCounts:
+        return {
+            regex: len(pattern.findall(text))
+            for regex, pattern in zip(self.regexes, self.__compiled)
+        }
+
+    def extract(self, text: Union[str, Iterable[str]]) -> tuple[KeywordCounts, int]:
+        """Keyword counts and word count for a document or its page texts."""
+        pages = [text] if isinstance(text, str) else text
+        cleaned = normalise_pages(pages)
+        # Same as len(cleaned.split(" ")), without building the list.
+        return self.count(cleaned), cleaned.count(" ") + 1
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_matcher(regexes: tuple) -> KeywordMatcher:
+    return KeywordMatcher(regexes)
+
+
+def matcher_for(regexes: Iterable[Union[str, re.Pattern]]) -> KeywordMatcher:
+    """A compiled matcher for `regexes`, built once per distinct pattern set."""
+    return _cached_matcher(tuple(regexes))
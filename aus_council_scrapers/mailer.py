@@ -0,0 +1,277 @@
+"""Email notifications, sent in the background over one SMTP connection.
+
+`send_email` used to open a new connection to Gmail for every meeting, run
+STARTTLS and log in, send one message and quit, all on the scraper's
+worker thread. Each new agenda cost its council a few TLS and SMTP round
+trips before the worker could move on, and a night with twenty new agendas
+meant twenty handshakes and twenty emails.
+
+Now one `Mailer` lives for the whole run (or the daemon's lifetime) and
+sends from its own thread. `notify` only queues. The connection is opened
+and logged in on the first message and reused for the rest; it is closed
+after `idle_timeout` without mail, since servers drop idle connections
+anyway. A dropped connection is reopened and the message sent again; other
+failures are retried with a backoff, and a message that keeps failing is
+logged and dropped.
+
+In digest mode (`--email-digest`, or `EMAIL_DIGEST=1`) `notify` collects
+each meeting's section instead, and `send_digest()` sends everything
+collected as one message. The run sends it when it finishes; the daemon,
+after every round.
+
+The server is Gmail's unless `SMTP_HOST` and `SMTP_PORT` say otherwise;
+`SMTP_STARTTLS=0` skips STARTTLS, for a local relay.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Mapping, Optional
+
+from aus_council_scrapers.utils import config, write_digest
+
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 587
+# Close the connection after this long without mail.
+IDLE_TIMEOUT = 120.0
+# Seconds to wait on the server before giving up on a command.
+SMTP_TIMEOUT = 30.0
+MAX_ATTEMPTS = 4
+RETRY_DELAY = 2.0
+
+
+@dataclass
+class QueuedEmail:
+    subject: str
+    body: str
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class Mailer:
+    """Queues emails from any thread; sends them on its own."""
+
+    def __init__(
+        self,
+        sender: str,
+        password: Optional[str],
+        to: str,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        starttls: bool = True,
+        digest: bool = False,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ):
+        self.sender = sender
+        self.to = to
+        self.host = host
+        self.port = port
+        self.starttls = starttls
+        self.digest = digest
+        self.idle_timeout = idle_timeout
+        self.sent = 0
+        self.dropped = 0
+        self.__password = password
+        self.__inbox: queue.Queue = queue.Queue()
+        self.__sections: list[tuple[str, str]] = []
+        self.__thread: Optional[threading.Thread] = None
+        self.__lock = threading.Lock()
+        self.__smtp: Optional[smtplib.SMTP] = None
+        self.__logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_config(cls, settings: Mapping[str, str] = config) -> Optional[Mailer]:
+        """The mailer `.env` configures, or None when email is turned off."""
+        to = settings.get("GMAIL_ACCOUNT_RECEIVE")
+        if not to or settings.get("GMAIL_FUNCTIONALITY", "0") != "1":
+            return None
+        digest = os.environ.get("EMAIL_DIGEST", settings.get("EMAIL_DIGEST", "0"))
+        return cls(
+            settings.get("GMAIL_ACCOUNT_SEND"),
+            settings.get("GMAIL_PASSWORD"),
+            to,
+            host=settings.get("SMTP_HOST") or SMTP_HOST,
+            port=int(settings.get("SMTP_PORT") or SMTP_PORT),
+            starttls=settings.get("SMTP_STARTTLS", "1") != "0",
+            digest=digest == "1",
+        )
+
+    def notify(self, subject: str, section: str) -> None:
+        """Email one meeting's `write_email_section`: now, or in the digest."""
+        if self.digest:
+            with self.__lock:
+                self.__sections.append((subject, section))
+        else:
+            self.send(subject, write_digest([section]))
+
+    def send(self, subject: str, body: str) -> None:
+        """Queue a message; returns at once."""
+        self.__start()
+        self.__inbox.put(QueuedEmail(subject, body))
+
+    def send_digest(self) -> int:
+        """Queue one message holding every section collected so far.
+
+        Returns how many meetings it covers.
+        """
+        with self.__lock:
+            sections, self.__sections = self.__sections, []
+        if not sections:
+            return 0
+        if len(sections) == 1:
+            subject = sections[0][0]
+        else:
+            subject = f"New agendas: {len(sections)} meetings"
+        self.send(subject, write_digest([section for _, section in sections]))
+        return len(sections)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every message queued so far is sent (or dropped).
+
+        Returns False if `timeout` ran out first.
+        """
+        if self.__thread is None:
+            return True
+        marker = _Flush()
+        self.__inbox.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 60) -> None:
+        """Send the digest and whatever is queued, then quit the connection."""
+        self.send_digest()
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+        if thread is None:
+            return
+        self.__inbox.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            self.__logger.error("Emails still queued at shutdown")
+
+    def __start(self) -> None:
+        with self.__lock:
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__serve, name="mailer", daemon=True
+                )
+                self.__thread.start()
+
+    def __serve(self) -> None:
+        try:
+            while True:
+                try:
+                    item = self.__inbox.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    self.__disconnect()
+                    continue
+                if item is _STOP:
+                    break
+                if isinstance(item, _Flush):
+                    item.done.set()
+                else:
+                    self.__deliver(item)
+        finally:
+            self.__disconnect()
+
+    def __connection(self) -> smtplib.SMTP:
+        if self.__smtp is None:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+            try:
+                if self.starttls:
+                    smtp.starttls()
+                if self.__password:
+                    smtp.login(self.sender, self.__password)
+            except BaseException:
+                smtp.close()
+                raise
+            self.__smtp = smtp
+        return self.__smtp
+
+    def __disconnect(self) -> None:
+        smtp, self.__smtp = self.__smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    def __deliver(self, email: QueuedEmail) -> None:
+        msg = MIMEMultipart()
+        msg["From"] = self.sender
+        msg["To"] = self.to
+        msg["Subject"] = email.subject
+        msg.attach(MIMEText(email.body, "plain"))
+        text = msg.as_string()
+
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                self.__connection().sendmail(self.sender, self.to, text)
+            except smtplib.SMTPAuthenticationError as e:
+                # Trying again will not change the password.
+                self.__disconnect()
+                error = e
+                break
+            except smtplib.SMTPServerDisconnected as e:
+                # Most likely the server closed an idle connection.
+                error, delay = e, 0 if attempt == 0 else RETRY_DELAY * 2**attempt
+            except (smtplib.SMTPException, OSError) as e:
+                error, delay = e, RETRY_DELAY * 2**attempt
+            else:
+                self.sent += 1
+                self.__logger.info(f"Sent email: {email.subject}")
+                return
+            self.__disconnect()
+            if attempt + 1 < MAX_ATTEMPTS:
+                self.__logger.warning(
+                    f"Sending email failed ({error}); retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+        self.__logger.error(f"Dropped an email ({email.subject}): {error}")
+        self.dropped += 1
+
+
+_shared: Optional[Mailer] = None
+_shared_lock = threading.Lock()
+
+
+def shared_mailer() -> Optional[Mailer]:
+    """The process-wide mailer, or None when email is turned off."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Mailer.from_config()
+            if _shared is not None:
+                atexit.register(_shared.close)
+        return _shared
+
+
+def send_shared_digest() -> int:
+    """Queue the process-wide mailer's digest, if it has one."""
+    with _shared_lock:
+        mailer = _shared
+    return mailer.send_digest() if mailer is not None else 0
+
+
+def close_shared_mailer() -> None:
+    """Send what the process-wide mailer has collected and queued, and stop it."""
+    global _shared
+    with _shared_lock:
+        mailer, _shared = _shared, None
+    if mailer is not None:
+        mailer.close()
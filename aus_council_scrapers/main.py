@@ -1,30 +1,46 @@
 import argparse
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import contextlib
 import io
 import json
 import logging
 import os.path
+import sqlite3
 import sys
 import time
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 from dotenv import dotenv_values
 
 import aus_council_scrapers.database as db
-from aus_council_scrapers.base import SCRAPER_REGISTRY, BaseScraper, ScraperReturn
+from aus_council_scrapers.base import (
+    SCRAPER_REGISTRY,
+    BaseScraper,
+    ScraperReturn,
+    newest_first,
+)
 from aus_council_scrapers.constants import EARLIEST_YEAR
-from aus_council_scrapers.discord_bot import DiscordNotifier
+from aus_council_scrapers.cpu import shared_cpu_pool
+from aus_council_scrapers.discord_bot import close_shared_notifier, shared_notifier
+from aus_council_scrapers.mailer import close_shared_mailer, shared_mailer
+from aus_council_scrapers.doc_cache import DocCache, default_doc_cache
+from aus_council_scrapers.driver_pool import shared_driver_pool
+from aus_council_scrapers.history import default_history
+from aus_council_scrapers.http_cache import default_cache
 from aus_council_scrapers.logging_config import setup_logging
+from aus_council_scrapers.metrics import default_metrics
+from aus_council_scrapers.ratelimit import default_fetch_delay, shared_scheduler
 from aus_council_scrapers.utils import (
     KeywordCounts,
     download_pdf,
     extract_keywords,
     format_date_for_message,
-    read_pdf,
-    send_email,
-    write_email,
+    open_pdf,
+    page_texts,
+    save_debug_copy,
+    write_email_section,
 )
 
 config = dotenv_values(".env")
@@ -37,6 +53,71 @@ def json_default(o):
     return str(o)
 
 
+class NdjsonWriter:
+    """Writes each council's result to stdout as one JSON line, as it finishes.
+
+    `--format json` holds every result until the slowest council is done,
+    so a consumer sees nothing until the end, and the run holds every
+    meeting in memory. Here a council's line is written as soon as its
+    scraper returns. In adapter mode each meeting gets its own line before
+    the council's. Only a small summary of each result is kept, for the
+    closing summary line and the run report.
+
+    Every line has a "type": "meeting", "council" or "summary".
+    """
+
+    def __init__(self, args, stream=None):
+        self.args = args
+        # Taken now, before suppress_stdout swaps sys.stdout for a buffer.
+        self.stream = stream or sys.stdout
+        self.started = time.time()
+
+    def write(self, record: dict) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False, default=json_default))
+        self.stream.write("\n")
+        self.stream.flush()
+
+    def emit(self, out: dict) -> dict:
+        """Write one result; return the summary of it that is kept instead."""
+        record = {"type": "council", **out}
+        meetings = record.pop("meetings", None)
+        for meeting in meetings or ():
+            self.write(
+                {
+                    "type": "meeting",
+                    "council": out.get("council"),
+                    "state": out.get("state"),
+                    **meeting,
+                }
+            )
+        kept = {
+            "ok": out.get("ok"),
+            "council": out.get("council"),
+            "state": out.get("state"),
+            "error": out.get("error"),
+            "meeting_count": _meeting_count(out),
+        }
+        record["meeting_count"] = kept["meeting_count"]
+        self.write(record)
+        return kept
+
+    def summary(self, results: list[dict]) -> None:
+        self.write(
+            {
+                "type": "summary",
+                "format_version": 1,
+                "adapter_mode": self.args.adapter,
+                "council_filter": self.args.council,
+                "state_filter": self.args.state,
+                "years_filter": self.args.years,
+                "councils": len(results),
+                "ok": sum(1 for r in results if r.get("ok")),
+                "meetings": sum(r["meeting_count"] for r in results),
+                "elapsed_s": round(time.time() - self.started, 3),
+            }
+        )
+
+
 @contextlib.contextmanager
 def suppress_stdout(enabled: bool):
     """
@@ -68,11 +149,24 @@ def main():
     )
     parser.add_argument("--log-level", help="Set the log level", default="INFO")
     parser.add_argument("--workers", help="Number of workers", default=6, type=int)
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        default="threads",
+        help=(
+            "threads: one worker thread per running scraper. async: drive every "
+            "scraper on one event loop; scrapers not yet ported to it run on "
+            "--workers threads as before."
+        ),
+    )
     parser.add_argument(
         "--format",
-        choices=["text", "json"],
+        choices=["text", "json", "ndjson"],
         default="text",
-        help="Output format. Use json for machine-readable adapter output.",
+        help=(
+            "Output format. Use json for machine-readable adapter output, or "
+            "ndjson to receive each council's result as soon as it finishes."
+        ),
     )
     parser.add_argument(
         "--adapter",
@@ -84,6 +178,71 @@ def main():
         action="store_true",
         help="Skip PDF download/keyword extraction (useful for adapter mode).",
     )
+    parser.add_argument(
+        "--http-cache",
+        nargs="?",
+        const=".cache/http",
+        metavar="DIR",
+        help=(
+            "Cache pages on disk and revalidate them with conditional requests "
+            "(default directory: .cache/http). Same as setting HTTP_CACHE_DIR."
+        ),
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=(
+            "Fetch every year and page, including the closed ones earlier runs "
+            "stored (complete, and over six months old)."
+        ),
+    )
+    parser.add_argument(
+        "--html-parser",
+        choices=["lxml", "html.parser"],
+        help=(
+            "Parser for fetched pages (default: lxml when installed). "
+            "Same as setting HTML_PARSER."
+        ),
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        metavar="N",
+        help=(
+            "Extract PDF text and count keywords in N worker processes, so "
+            "councils' PDF stages run in parallel; 'auto' for one per core "
+            "(default 0: on the scraper's own thread). Same as CPU_WORKERS."
+        ),
+    )
+    parser.add_argument(
+        "--email-digest",
+        action="store_true",
+        help=(
+            "Send one email listing every new meeting when the run finishes, "
+            "instead of one per meeting. Same as EMAIL_DIGEST=1."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-json",
+        metavar="PATH",
+        help=(
+            "Write a run report to PATH: each council's outcome, and requests, "
+            "bytes, status codes, retries, latency and throttle and backoff "
+            "waits per host and per council."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        metavar="PATH",
+        help="Write the fetch metrics to PATH in the Prometheus text format.",
+    )
+    parser.add_argument(
+        "--no-doc-cache",
+        action="store_true",
+        help=(
+            "Download and parse every PDF again instead of reusing the text and "
+            "keyword counts stored from earlier runs."
+        ),
+    )
     args = parser.parse_args()
 
     # Validate years argument
@@ -107,59 +266,88 @@ def main():
     setup_logging(level=args.log_level.upper())
     logging.info("YIMBY SCRAPER Started")
     start_time = time.time()
+    started_at = datetime.now().astimezone()
+
+    if args.http_cache:
+        # Fetchers look the cache up when they fetch, so this reaches the
+        # ones the scrapers built at registration too.
+        os.environ["HTTP_CACHE_DIR"] = args.http_cache
+    if args.no_doc_cache:
+        os.environ["DOC_CACHE_PATH"] = ""
+    if args.html_parser:
+        os.environ["HTML_PARSER"] = args.html_parser
+    if args.cpu_workers:
+        os.environ["CPU_WORKERS"] = args.cpu_workers
+    if args.email_digest:
+        os.environ["EMAIL_DIGEST"] = "1"
 
     # DB is legacy-mode only
     if not args.adapter:
         if args.fresh:
-            try:
-                os.remove("./agendas.db")
-            except FileNotFoundError:
-                pass
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(db.DB_PATH + suffix)
+                except FileNotFoundError:
+                    pass
+
+        # Creates the table on first run, and the indexes on older files.
+        db.init()
+        # Every skip-check this run is answered from one load.
+        db.seen_index()
+
+    # Only the selected scrapers' modules are imported and built.
+    scrapers = SCRAPER_REGISTRY.select(council=args.council, state=args.state)
+
+    # Adapter runs leave no files behind.
+    history = None if args.adapter else default_history(refetch_all=args.full)
+    if history is not None:
+        for scraper in scrapers:
+            scraper.history = history.for_council(scraper.council_name)
+
+    run_options = dict(
+        skip_keywords=args.skip_keywords,
+        adapter_mode=args.adapter,
+        skip_pdf=args.skip_pdf,
+        years=args.years,
+    )
 
-        if not os.path.exists("./agendas.db"):
-            db.init()
+    ndjson = NdjsonWriter(args) if args.format == "ndjson" else None
+    if ndjson is not None:
+        run_options["emit"] = ndjson.emit
 
-    futures = []
-    results: list[dict] = []
-
-    # In JSON mode, suppress any accidental prints from scrapers
-    with suppress_stdout(args.format == "json"):
-        with ThreadPoolExecutor(max_workers=args.workers) as executor:
-            for scraper in SCRAPER_REGISTRY.values():
-                # Filter by council and state
-                if args.state and args.state.lower() != scraper.state.lower():
-                    continue
-                if (
-                    args.council
-                    and args.council.lower() != scraper.council_name.lower()
-                ):
-                    continue
-
-                futures.append(
-                    executor.submit(
-                        run_scraper,
-                        scraper,
-                        skip_keywords=args.skip_keywords,
-                        adapter_mode=args.adapter,
-                        skip_pdf=args.skip_pdf,
-                        years=args.years,
-                    )
+    try:
+        # In JSON mode, suppress any accidental prints from scrapers
+        with suppress_stdout(args.format in ("json", "ndjson")):
+            if args.engine == "async":
+                results = asyncio.run(
+                    run_scrapers_async(scrapers, args.workers, **run_options)
                 )
+            else:
+                results = run_scrapers_threaded(scrapers, args.workers, **run_options)
+    finally:
+        if history is not None:
+            history.close()
 
-            # Gather results safely (one failure shouldn't kill JSON output)
-            for fut in futures:
-                try:
-                    out = fut.result()
-                except Exception as e:
-                    # This catches unexpected exceptions escaping run_scraper
-                    logging.exception(f"Worker future failed unexpectedly: {e}")
-                    out = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    shared_cpu_pool().shutdown()
+    close_shared_notifier()
+    close_shared_mailer()
 
-                if out is not None:
-                    results.append(out)
+    if not args.adapter:
+        # Commit what the writer thread still has queued.
+        try:
+            db.close()
+        except sqlite3.Error:
+            logging.error("Some results were not saved; see the errors above")
 
     results.sort(key=lambda r: (r.get("state", ""), r.get("council", "")))
 
+    # Written before the JSON output returns, so adapter runs report too.
+    write_metrics(args, results, started_at)
+
+    if ndjson is not None:
+        ndjson.summary(results)
+        return
+
     # JSON output mode: stdout should contain JSON ONLY
     if args.format == "json":
         payload = {
@@ -174,9 +362,247 @@ def main():
         sys.stdout.write("\n")
         return
 
+    cache = default_cache()
+    if cache is not None:
+        stats = cache.stats()
+        logging.info(
+            f"HTTP cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['entries']} entries ({stats['bytes'] / 1e6:.1f} MB)"
+        )
+
+    if history is not None and history.skipped + history.fetched:
+        logging.info(
+            f"History: {history.skipped} closed periods served from the store, "
+            f"{history.fetched} fetched"
+        )
+
+    doc_cache = default_doc_cache()
+    if doc_cache is not None and doc_cache.hits + doc_cache.misses:
+        stats = doc_cache.stats()
+        logging.info(
+            f"Document cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['documents']} documents ({stats['bytes'] / 1e6:.1f} MB)"
+        )
+        doc_cache.close()
+
+    fetch = default_metrics().report()["total"]
+    if fetch["requests"] or fetch["selenium_pages"]:
+        logging.info(
+            f"Fetches: {fetch['requests']} requests "
+            f"({fetch['bytes'] / 1e6:.1f} MB), {fetch['selenium_pages']} Selenium "
+            f"pages, {fetch['retries']} retries; waited {fetch['throttle_wait_s']:.0f}s "
+            f"on the throttle and {fetch['backoff_wait_s']:.0f}s backing off"
+        )
+
+    pool = shared_driver_pool()
+    pool_stats = pool.stats()
+    if pool_stats.leases:
+        logging.info(
+            f"Selenium pool: {pool_stats.leases} leases, {pool_stats.started} "
+            f"drivers started, {pool_stats.waited} waited "
+            f"(max {pool_stats.max_wait:.1f}s, total {pool_stats.total_wait:.1f}s)"
+        )
+    pool.shutdown()
+
     logging.info(f"YIMBY SCRAPER Finished in {time.time() - start_time:.2f}s")
 
 
+def _meeting_count(result: dict) -> int:
+    # Adapter output lists every meeting; legacy output carries the newest.
+    # A result NdjsonWriter has already written keeps only the count.
+    if "meeting_count" in result:
+        return result["meeting_count"]
+    if "meetings" in result:
+        return len(result["meetings"])
+    return 1 if result.get("meeting") else 0
+
+
+def _error_type(error) -> Optional[str]:
+    # handle_failure reports {"type", "message"}; a worker that died
+    # outright leaves "Type: message".
+    if isinstance(error, dict):
+        return error.get("type")
+    return error.split(":", 1)[0] if error else None
+
+
+def write_metrics(args, results: list[dict], started_at: datetime) -> None:
+    """Write the run report and Prometheus textfile, if asked for.
+
+    A report that cannot be written is logged, never allowed to fail a run
+    that has already scraped everything.
+    """
+    metrics = default_metrics()
+    try:
+        if args.metrics_prom:
+            metrics.write_prometheus(args.metrics_prom)
+        if args.metrics_json:
+            pool = shared_driver_pool().stats()
+            report = {
+                "format_version": 1,
+                "started": started_at.isoformat(timespec="seconds"),
+                "finished": datetime.now().astimezone().isoformat(timespec="seconds"),
+                "engine": args.engine,
+                "workers": args.workers,
+                "fetch_delay": default_fetch_delay(),
+                "councils": [
+                    {
+                        "council": r.get("council"),
+                        "state": r.get("state"),
+                        "ok": r.get("ok"),
+                        "meetings": _meeting_count(r),
+                        "error": _error_type(r.get("error")),
+                    }
+                    for r in results
+                ],
+                "fetch": metrics.report(),
+                "selenium_pool": {
+                    "leases": pool.leases,
+                    "started": pool.started,
+                    "waited": pool.waited,
+                    "total_wait_s": round(pool.total_wait, 3),
+                    "max_wait_s": round(pool.max_wait, 3),
+                },
+            }
+            with open(args.metrics_json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+    except OSError as e:
+        logging.error(f"Could not write the run metrics: {e}")
+
+
+def run_scrapers_threaded(
+    scrapers: list[BaseScraper], workers: int, emit=None, **run_options
+):
+    """Run the scrapers on `workers` threads; return their results.
+
+    When given, `emit(result)` is called with each result as its scraper
+    finishes, and what it returns is kept in the result's place.
+    """
+    outputs: dict[int, dict] = {}
+    position = {id(scraper): i for i, scraper in enumerate(scrapers)}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Gather results safely (one failure shouldn't kill JSON output)
+        for scraper, fut in dispatch_by_host(
+            executor, scrapers, workers, run_scraper, **run_options
+        ):
+            try:
+                out = fut.result()
+            except Exception as e:
+                # This catches unexpected exceptions escaping run_scraper
+                logging.exception(f"Worker future failed unexpectedly: {e}")
+                out = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+            if out is not None:
+                if emit is not None:
+                    out = emit(out)
+                outputs[position[id(scraper)]] = out
+
+    # Report in registry order, whatever order the councils finished in.
+    return [outputs[i] for i in sorted(outputs)]
+
+
+def dispatch_by_host(
+    executor: ThreadPoolExecutor,
+    scrapers: list[BaseScraper],
+    workers: int,
+    fn,
+    **kwargs,
+):
+    """Submit `fn(scraper, **kwargs)` as hosts become ready; yield finished futures.
+
+    Submitting everything up front ran scrapers in registry order, so a
+    worker could sit in a throttle sleep for a host another scraper was
+    already using while councils on idle hosts waited in the queue. Instead,
+    a scraper is only started when no other running scraper shares its host,
+    and among those the host whose rate budget frees soonest goes first.
+    `(scraper, future)` pairs are yielded in completion order.
+    """
+    scheduler = shared_scheduler()
+    pending = list(scrapers)
+    busy_hosts: dict[str, int] = {}
+    running: dict = {}
+
+    def next_ready() -> Optional[BaseScraper]:
+        candidates = [
+            (scheduler.ready_in(s.host), i)
+            for i, s in enumerate(pending)
+            if not s.host or not busy_hosts.get(s.host)
+        ]
+        return pending.pop(min(candidates)[1]) if candidates else None
+
+    while pending or running:
+        while pending and len(running) < workers:
+            scraper = next_ready()
+            if scraper is None:
+                break
+            busy_hosts[scraper.host] = busy_hosts.get(scraper.host, 0) + 1
+            running[executor.submit(fn, scraper, **kwargs)] = scraper
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for fut in done:
+            scraper = running.pop(fut)
+            busy_hosts[scraper.host] -= 1
+            yield scraper, fut
+
+
+async def run_scrapers_async(
+    scrapers: list[BaseScraper], workers: int, emit=None, **run_options
+):
+    """Drive every scraper from one event loop.
+
+    Scrapers ported to `ascraper` fetch through an `AsyncFetcher`, so their
+    requests and throttle waits cost no threads however many are in flight.
+    The rest run `run_scraper` on a worker thread, at most `workers` at once,
+    exactly as the threaded engine would. `emit` is called as each scraper
+    finishes, as in `run_scrapers_threaded`.
+    """
+    # Imported here so the threaded engine does not need aiohttp.
+    from aus_council_scrapers.async_fetch import AsyncFetcher
+
+    sync_slots = asyncio.Semaphore(workers)
+
+    async def run_one(scraper: BaseScraper, session):
+        if not scraper.supports_async:
+            async with sync_slots:
+                return await asyncio.to_thread(run_scraper, scraper, **run_options)
+
+        previous_fetcher = scraper.fetcher
+        scraper.fetcher = AsyncFetcher(session, council=scraper.council_name)
+        try:
+            return await run_scraper_async(scraper, **run_options)
+        finally:
+            await scraper.fetcher.aclose()
+            scraper.fetcher = previous_fetcher
+
+    async def finish(scraper: BaseScraper, session):
+        try:
+            out = await run_one(scraper, session)
+        except Exception as e:
+            logging.exception(f"Worker future failed unexpectedly: {e}")
+            out = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        if out is not None and emit is not None:
+            out = emit(out)
+        return out
+
+    results: list[dict] = []
+    async with AsyncFetcher.open_session() as session:
+        outcomes = await asyncio.gather(
+            *(finish(scraper, session) for scraper in scrapers),
+            return_exceptions=True,
+        )
+
+    for out in outcomes:
+        if isinstance(out, BaseException):
+            logging.exception(f"Worker future failed unexpectedly: {out}", exc_info=out)
+            out = {"ok": False, "error": f"{type(out).__name__}: {out}"}
+            if emit is not None:
+                out = emit(out)
+        if out is not None:
+            results.append(out)
+
+    return results
+
+
 def run_scraper(
     scraper: BaseScraper,
     skip_keywords: bool = False,
@@ -184,6 +610,7 @@ def run_scraper(
     skip_pdf: bool = False,
     years: list[int] = None,
 ):
+    started = time.monotonic()
     try:
         scraper.logger.info("Scraper started")
 
@@ -191,162 +618,257 @@ def run_scraper(
         if years:
             scraper.years_filter = years
 
-        results = get_agenda_info(scraper, adapter_mode=adapter_mode)
-
-        # Filter by years if specified
-        if years:
-            results = [
-                r for r in results if r.cleaned_date and r.cleaned_date.year in years
-            ]
-            scraper.logger.info(f"Filtered to {len(results)} meetings in years {years}")
+        try:
+            if adapter_mode:
+                results = get_agenda_info(scraper, adapter_mode=adapter_mode)
+            else:
+                # Legacy mode reports one meeting: read no further than it.
+                results = get_newest_meeting(scraper, years)
+        finally:
+            # Hand any leased Selenium driver back before the PDF stage, so
+            # the next Selenium council is not kept waiting for it.
+            scraper.fetcher.close()
+        return handle_results(
+            scraper, results, skip_keywords, adapter_mode, skip_pdf, years
+        )
 
-        # In adapter mode, return all meetings in JSON format
-        if adapter_mode:
-            meetings = []
-            for result in results:
-                date_value = (
-                    result.cleaned_date.isoformat() if result.cleaned_date else None
-                )
-                time_value = (
-                    result.cleaned_time.isoformat() if result.cleaned_time else None
-                )
+    except Exception as e:
+        return handle_failure(scraper, e, adapter_mode)
+    finally:
+        default_metrics().ran(scraper.council_name, time.monotonic() - started)
 
-                meetings.append(
-                    {
-                        "name": result.name,
-                        "date": date_value,
-                        "time": time_value,
-                        "webpage_url": result.webpage_url,
-                        "agenda_url": result.agenda_url,
-                        "minutes_url": result.minutes_url,
-                        "agenda_html_url": result.agenda_html_url,
-                        "minutes_html_url": result.minutes_html_url,
-                        "download_url": result.download_url,
-                        "location": getattr(result, "location", None)
-                        or getattr(result, "cleaned_location", None),
-                    }
-                )
 
-            scraper.logger.info(
-                f"Scraper finished successfully with {len(meetings)} meetings"
-            )
-            return {
-                "ok": True,
-                "council": scraper.council_name,
-                "state": scraper.state.upper(),
-                "meetings": meetings,  # Changed from "meeting" to "meetings" (array)
-            }
+async def run_scraper_async(
+    scraper: BaseScraper,
+    skip_keywords: bool = False,
+    adapter_mode: bool = False,
+    skip_pdf: bool = False,
+    years: list[int] = None,
+):
+    """`run_scraper` for a scraper ported to `ascraper`."""
+    started = time.monotonic()
+    try:
+        scraper.logger.info("Scraper started")
 
-        # Legacy mode: process only the first meeting (backward compatibility)
-        if not results:
-            scraper.logger.info("No meetings found")
-            return None
+        if years:
+            scraper.years_filter = years
 
-        result = results[0]  # Take first meeting for legacy mode
+        if adapter_mode:
+            scraper.logger.info("Finding agenda...")
+            results = prepare_results(scraper, await scraper.ascraper(), adapter_mode)
+        else:
+            # `ascraper` lists every meeting in whatever order its pages came
+            # back; pick the one the threaded engine would.
+            meetings = newest_first(await scraper.ascraper())
+            results = get_newest_meeting(scraper, years, meetings)
 
-        # Skip if already scraped (legacy mode only)
-        # Only skip if BOTH agenda and minutes URLs match a previous scrape
-        # This allows re-scraping when minutes are added later
-        if not adapter_mode:
-            # Determine the agenda URL to check
-            agenda_url = result.agenda_url or result.download_url
-            minutes_url = result.minutes_url
+        args = (scraper, results, skip_keywords, adapter_mode, skip_pdf, years)
+        if adapter_mode:
+            return handle_results(*args)
+        # Legacy mode downloads PDFs and writes the database, which would
+        # block the loop.
+        return await asyncio.to_thread(handle_results, *args)
 
-            if db.check_meeting_fully_scraped(agenda_url, minutes_url):
-                scraper.logger.info(
-                    "Skipping scraper, meeting already fully scraped "
-                    f"(agenda: {bool(agenda_url)}, minutes: {bool(minutes_url)})"
-                )
-                return None
-            else:
-                scraper.logger.info(
-                    f"Processing meeting (agenda: {bool(agenda_url)}, minutes: {bool(minutes_url)})"
-                )
+    except Exception as e:
+        return handle_failure(scraper, e, adapter_mode)
+    finally:
+        default_metrics().ran(scraper.council_name, time.monotonic() - started)
 
-        agenda_keywords = {}
-        minutes_keywords = {}
-        agenda_wordcount = None
-        minutes_wordcount = None
-        if (not skip_keywords) and (not skip_pdf) and (not adapter_mode):
-            agenda_keywords, minutes_keywords, agenda_wordcount, minutes_wordcount = (
-                process_pdfs(scraper, result)
-            )
 
-        # Combine keywords from both documents
-        extracted_keywords = combine_keywords(agenda_keywords, minutes_keywords)
+def handle_results(
+    scraper: BaseScraper,
+    results: list[ScraperReturn],
+    skip_keywords: bool,
+    adapter_mode: bool,
+    skip_pdf: bool,
+    years: list[int] | None,
+):
+    """Filter, store and notify for one scraper's meetings.
 
-        if not adapter_mode:
-            db.insert_result(
-                council_name=scraper.council_name,
-                state=scraper.state,
-                scraper_result=result,
-                keywords=extracted_keywords,
-                agenda_wordcount=agenda_wordcount,
-                minutes_wordcount=minutes_wordcount,
+    Returns the scraper's entry for the JSON output, or None when there is
+    nothing to report. Exceptions propagate to the caller, which reports them
+    through `handle_failure`.
+    """
+    # Filter by years if specified
+    if years:
+        results = [
+            r for r in results if r.cleaned_date and r.cleaned_date.year in years
+        ]
+        scraper.logger.info(f"Filtered to {len(results)} meetings in years {years}")
+
+    # In adapter mode, return all meetings in JSON format
+    if adapter_mode:
+        meetings = []
+        for result in results:
+            date_value = (
+                result.cleaned_date.isoformat() if result.cleaned_date else None
+            )
+            time_value = (
+                result.cleaned_time.isoformat() if result.cleaned_time else None
             )
-            scraper.logger.info("Saved meeting details to db")
-
-        if not adapter_mode:
-            if not result.is_date_in_past(scraper.state):
-                notify_email(scraper, result, extracted_keywords)
-                notify_discord(scraper, result)
-            else:
-                scraper.logger.warning(
-                    "Skipping notification because date is in the past"
-                )
-
-        scraper.logger.info("Scraper finished successfully")
 
-        # Adapter output: JSON-safe primitives only (force strings for date/time)
-        date_value = result.cleaned_date.isoformat() if result.cleaned_date else None
-        time_value = result.cleaned_time.isoformat() if result.cleaned_time else None
+            meetings.append(
+                {
+                    "name": result.name,
+                    "date": date_value,
+                    "time": time_value,
+                    "webpage_url": result.webpage_url,
+                    "agenda_url": result.agenda_url,
+                    "minutes_url": result.minutes_url,
+                    "agenda_html_url": result.agenda_html_url,
+                    "minutes_html_url": result.minutes_html_url,
+                    "download_url": result.download_url,
+                    "location": getattr(result, "location", None)
+                    or getattr(result, "cleaned_location", None),
+                }
+            )
 
+        scraper.logger.info(
+            f"Scraper finished successfully with {len(meetings)} meetings"
+        )
         return {
             "ok": True,
             "council": scraper.council_name,
             "state": scraper.state.upper(),
-            "meeting": {
-                "name": result.name,
-                "date": date_value,
-                "time": time_value,
-                "webpage_url": result.webpage_url,
-                "agenda_url": result.agenda_url,
-                "minutes_url": result.minutes_url,
-                "download_url": result.download_url,  # Kept for backward compatibility
-            },
-            "location": getattr(result, "location", None)
-            or getattr(result, "cleaned_location", None),
+            "meetings": meetings,  # Changed from "meeting" to "meetings" (array)
         }
 
-    except Exception as e:
-        scraper.logger.exception(f"Scraper failed: {e}")
+    # Legacy mode: process only the first meeting (backward compatibility)
+    if not results:
+        scraper.logger.info("No meetings found")
+        return None
 
-        if not adapter_mode:
-            try:
-                db.insert_error(
-                    council_name=scraper.council_name,
-                    state=scraper.state,
-                    exception=e,
-                )
-            except Exception as e2:
-                logging.exception(f"YIMBY SCRAPER Fatal Error {e2}")
-                os._exit(1)
+    result = results[0]  # Take first meeting for legacy mode
 
-        # Adapter mode: structured, machine-friendly error
-        return {
-            "ok": False,
-            "council": scraper.council_name,
-            "state": scraper.state.upper(),
-            "error": {
-                "type": type(e).__name__,
-                "message": str(e),
-            },
-        }
+    # Skip if already scraped (legacy mode only)
+    # Only skip if BOTH agenda and minutes URLs match a previous scrape
+    # This allows re-scraping when minutes are added later
+    if not adapter_mode:
+        # Determine the agenda URL to check
+        agenda_url = result.agenda_url or result.download_url
+        minutes_url = result.minutes_url
 
+        if db.seen_index().is_seen(agenda_url, minutes_url):
+            scraper.logger.info(
+                "Skipping scraper, meeting already fully scraped "
+                f"(agenda: {bool(agenda_url)}, minutes: {bool(minutes_url)})"
+            )
+            return None
+        else:
+            scraper.logger.info(
+                f"Processing meeting (agenda: {bool(agenda_url)}, minutes: {bool(minutes_url)})"
+            )
 
-def get_agenda_info(scraper: BaseScraper, adapter_mode: bool = False) -> list[ScraperReturn]:
+    agenda_keywords = {}
+    minutes_keywords = {}
+    agenda_wordcount = None
+    minutes_wordcount = None
+    if (not skip_keywords) and (not skip_pdf) and (not adapter_mode):
+        agenda_keywords, minutes_keywords, agenda_wordcount, minutes_wordcount = (
+            process_pdfs(scraper, result)
+        )
+
+    # Combine keywords from both documents
+    extracted_keywords = combine_keywords(agenda_keywords, minutes_keywords)
+
+    if not adapter_mode:
+        db.insert_result(
+            council_name=scraper.council_name,
+            state=scraper.state,
+            scraper_result=result,
+            keywords=extracted_keywords,
+            agenda_wordcount=agenda_wordcount,
+            minutes_wordcount=minutes_wordcount,
+        )
+        scraper.logger.info("Saved meeting details to db")
+
+    if not adapter_mode:
+        if not result.is_date_in_past(scraper.state):
+            notify_email(scraper, result, extracted_keywords)
+            notify_discord(scraper, result)
+        else:
+            scraper.logger.warning("Skipping notification because date is in the past")
+
+    scraper.logger.info("Scraper finished successfully")
+
+    # Adapter output: JSON-safe primitives only (force strings for date/time)
+    date_value = result.cleaned_date.isoformat() if result.cleaned_date else None
+    time_value = result.cleaned_time.isoformat() if result.cleaned_time else None
+
+    return {
+        "ok": True,
+        "council": scraper.council_name,
+        "state": scraper.state.upper(),
+        "meeting": {
+            "name": result.name,
+            "date": date_value,
+            "time": time_value,
+            "webpage_url": result.webpage_url,
+            "agenda_url": result.agenda_url,
+            "minutes_url": result.minutes_url,
+            "download_url": result.download_url,  # Kept for backward compatibility
+        },
+        "location": getattr(result, "location", None)
+        or getattr(result, "cleaned_location", None),
+    }
+
+
+def handle_failure(scraper: BaseScraper, e: Exception, adapter_mode: bool) -> dict:
+    scraper.logger.exception(f"Scraper failed: {e}")
+
+    if not adapter_mode:
+        try:
+            db.insert_error(
+                council_name=scraper.council_name,
+                state=scraper.state,
+                exception=e,
+            )
+        except Exception as e2:
+            logging.exception(f"YIMBY SCRAPER Fatal Error {e2}")
+            os._exit(1)
+
+    # Adapter mode: structured, machine-friendly error
+    return {
+        "ok": False,
+        "council": scraper.council_name,
+        "state": scraper.state.upper(),
+        "error": {
+            "type": type(e).__name__,
+            "message": str(e),
+        },
+    }
+
+
+def get_agenda_info(
+    scraper: BaseScraper, adapter_mode: bool = False
+) -> list[ScraperReturn]:
     scraper.logger.info("Finding agenda...")
-    results = scraper.scraper()
+    return prepare_results(scraper, scraper.scraper(), adapter_mode)
+
+
+def get_newest_meeting(
+    scraper: BaseScraper,
+    years: list[int] | None = None,
+    meetings: Iterable[ScraperReturn] | None = None,
+) -> list[ScraperReturn]:
+    """The newest meeting (in `years`, if given) as a one-item list.
+
+    Reads `meetings`, newest first, or else `scraper.iter_meetings()`, and
+    stops as soon as the meeting is found.
+    """
+    scraper.logger.info("Finding agenda...")
+    if meetings is None:
+        meetings = scraper.iter_meetings()
+    for meeting in meetings:
+        (result,) = prepare_results(scraper, [meeting])
+        if not years or (result.cleaned_date and result.cleaned_date.year in years):
+            return [result]
+    return []
+
+
+def prepare_results(
+    scraper: BaseScraper, results: list[ScraperReturn], adapter_mode: bool = False
+) -> list[ScraperReturn]:
     scraper.logger.debug(f"Found {len(results)} meetings")
 
     processed_results = []
@@ -376,25 +898,7 @@ def get_agenda_info(scraper: BaseScraper, adapter_mode: bool = False) -> list[Sc
 def process_pdf(
     scraper: BaseScraper, result: ScraperReturn
 ) -> tuple[KeywordCounts, int]:
-    scraper.logger.info("Downloading PDF...")
-    download_pdf(result.download_url, scraper.council_name)
-
-    scraper.logger.info("Reading PDF...")
-    council_name = scraper.council_name
-    text = read_pdf(council_name)
-    with open(f"files/{council_name}_latest.txt", "w", encoding="utf-8") as f:
-        f.write(text)
-
-    keywords, wordcount = extract_keywords(scraper.keyword_regexes, text)
-    scraper.logger.debug(f"Extracted PDF keywords: {json.dumps(keywords, indent=2)}")
-
-    if not config.get("SAVE_FILES", "0") == "1":
-        if os.path.exists(f"files/{scraper.council_name}_latest.pdf"):
-            os.remove(f"files/{scraper.council_name}_latest.pdf")
-        if os.path.exists(f"files/{scraper.council_name}_latest.txt"):
-            os.remove(f"files/{scraper.council_name}_latest.txt")
-
-    return keywords, wordcount
+    return process_single_pdf(scraper, result.download_url, "latest")
 
 
 def process_pdfs(
@@ -447,30 +951,87 @@ def process_single_pdf(
     Returns:
         tuple: (keywords, wordcount)
     """
-    council_name = scraper.council_name
-    filename = f"{council_name}_{doc_type}"
-
-    scraper.logger.info(f"Downloading {doc_type} PDF...")
-    download_pdf(pdf_url, filename)
-
-    scraper.logger.info(f"Reading {doc_type} PDF...")
-    text = read_pdf(filename)
-
-    with open(f"files/{filename}.txt", "w", encoding="utf-8") as f:
-        f.write(text)
+    cache = default_doc_cache()
+    save_files = config.get("SAVE_FILES", "0") == "1"
+    if cache is not None and not save_files:
+        keywords, wordcount = process_cached_pdf(scraper, cache, pdf_url, doc_type)
+    elif not save_files:
+        scraper.logger.info(f"Downloading {doc_type} PDF...")
+        with download_pdf(pdf_url) as download:
+            scraper.logger.info(f"Reading {doc_type} PDF...")
+            keywords, wordcount = shared_cpu_pool().pdf_keyword_counts(
+                download, scraper.keyword_regexes
+            )
+    else:
+        scraper.logger.info(f"Downloading {doc_type} PDF...")
+        with open_pdf(pdf_url) as doc:
+            scraper.logger.info(f"Reading {doc_type} PDF...")
+            pages = save_debug_copy(
+                doc, page_texts(doc), f"files/{scraper.council_name}_{doc_type}"
+            )
+            keywords, wordcount = extract_keywords(scraper.keyword_regexes, pages)
 
-    keywords, wordcount = extract_keywords(scraper.keyword_regexes, text)
     scraper.logger.debug(
         f"Extracted {doc_type} keywords: {json.dumps(keywords, indent=2)}"
     )
+    return keywords, wordcount
 
-    if not config.get("SAVE_FILES", "0") == "1":
-        if os.path.exists(f"files/{filename}.pdf"):
-            os.remove(f"files/{filename}.pdf")
-        if os.path.exists(f"files/{filename}.txt"):
-            os.remove(f"files/{filename}.txt")
 
-    return keywords, wordcount
+def process_cached_pdf(
+    scraper: BaseScraper, cache: DocCache, pdf_url: str, doc_type: str
+) -> tuple[KeywordCounts, int]:
+    """`process_single_pdf` through the document cache.
+
+    A PDF seen before is revalidated with a conditional request, and one
+    whose bytes are already stored, under any URL, is not parsed again.
+    """
+    regexes = scraper.keyword_regexes
+    known = cache.lookup(pdf_url)
+
+    scraper.logger.info(f"Downloading {doc_type} PDF...")
+    with download_pdf(
+        pdf_url, headers=known.validators() if known else None
+    ) as download:
+        if not download.not_modified:
+            result = cached_keywords(cache, download.sha256, regexes)
+            if result is None:
+                scraper.logger.info(f"Reading {doc_type} PDF...")
+                text, counts, wordcount = shared_cpu_pool().pdf_keywords(
+                    download, regexes
+                )
+                result = counts, wordcount
+                cache.store(download.sha256, text, wordcount, counts)
+            cache.remember(pdf_url, download.sha256, download.headers)
+            return result
+
+    result = cached_keywords(cache, known.sha256, regexes)
+    if result is None:
+        # Evicted since the lookup, so the lookup now misses: fetch in full.
+        return process_cached_pdf(scraper, cache, pdf_url, doc_type)
+    scraper.logger.info(f"{doc_type.capitalize()} PDF unchanged since last run")
+    cache.refresh(known, download.headers)
+    return result
+
+
+def cached_keywords(
+    cache: DocCache, sha256: str, regexes: list
+) -> Optional[tuple[KeywordCounts, int]]:
+    """Counts for a stored document, counting any new patterns from its text.
+
+    None if the document is not stored.
+    """
+    counts, wordcount = cache.counts(sha256, regexes)
+    if wordcount is None:
+        return None
+    missing = [regex for regex in regexes if regex not in counts]
+    if missing:
+        text = cache.text(sha256)
+        if text is None:
+            return None
+        added, _ = shared_cpu_pool().keywords(missing, text)
+        cache.add_counts(sha256, added)
+        counts.update(added)
+    return {regex: counts[regex] for regex in regexes}, wordcount
 
 
 def combine_keywords(
@@ -504,18 +1065,17 @@ def combine_keywords(
 def notify_email(
     scraper: BaseScraper, result: ScraperReturn, extracted_data: KeywordCounts
 ):
-    email_to = config.get("GMAIL_ACCOUNT_RECEIVE", None)
-    email_enabled = config.get("GMAIL_FUNCTIONALITY", "0") == "1"
-
-    if email_to and email_enabled:
-        scraper.logger.info("Sending email...")
-
-        formatted_date = format_date_for_message(result.cleaned_date)
-        subject = f"New agenda: {scraper.council_name} {formatted_date} meeting"
-        body = write_email(scraper.council_name, result, extracted_data)
-        send_email(email_to, subject, body)
+    mailer = shared_mailer()
+    if mailer is None:
+        return
 
-        scraper.logger.info("Sent email")
+    formatted_date = format_date_for_message(result.cleaned_date)
+    subject = f"New agenda: {scraper.council_name} {formatted_date} meeting"
+    # Sent in the background, or held for the run's digest.
+    mailer.notify(
+        subject, write_email_section(scraper.council_name, result, extracted_data)
+    )
+    scraper.logger.info("Queued email")
 
 
 def notify_discord(scraper: BaseScraper, result: ScraperReturn):
@@ -524,9 +1084,6 @@ def notify_discord(scraper: BaseScraper, result: ScraperReturn):
     discord_group_tag = config.get("DISCORD_GROUP_TAG", "<@&1111808815097196585>")
 
     if discord_token and channel_id:
-        scraper.logger.info("Sending discord message...")
-
-        discord = DiscordNotifier(discord_token)
         formatted_date = format_date_for_message(result.cleaned_date)
 
         # Build message with available documents
@@ -542,10 +1099,9 @@ def notify_discord(scraper: BaseScraper, result: ScraperReturn):
         if not result.agenda_url and not result.minutes_url and result.download_url:
             message += f"\n{result.download_url}"
 
-        discord.send_message(channel_id, message)
-        discord.flush()
-
-        scraper.logger.info("Discord message sent")
+        # Delivered in the background, batched with other councils'.
+        shared_notifier(discord_token).send_message(channel_id, message)
+        scraper.logger.info("Discord message queued")
 
 
 if __name__ == "__main__":
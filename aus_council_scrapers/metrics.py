@@ -0,0 +1,299 @@
+"""Where a run's time went: per-host and per-council fetch metrics.
+
+`--workers` and `FETCH_DELAY` were sized by guesswork, because a run left
+nothing behind but warnings: not how long councils took to answer, how much
+of each worker's time was spent asleep in the per-host throttle, or how
+often a `Retry-After` held it up. `FetchMetrics` counts, for each host and
+council, the requests sent and their status codes, the bytes received,
+retries, Selenium page loads, and the seconds spent waiting on the throttle
+and on backoff, with a latency histogram per pair.
+
+Fetchers record into the process-wide `default_metrics()` unless given their
+own. `main` writes it out at the end of a run: `--metrics-json` as part of a
+run report, `--metrics-prom` in the Prometheus text format for
+node_exporter's textfile collector.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROMETHEUS_PREFIX = "council_scraper"
+
+
+class Histogram:
+    """Observations counted into fixed buckets, as Prometheus does."""
+
+    def __init__(self, bounds: Iterable[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """(upper bound, observations at or below it), ending with "+Inf"."""
+        total, buckets = 0, []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            buckets.append(("+Inf" if bound == float("inf") else f"{bound:g}", total))
+        return buckets
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+@dataclass
+class Series:
+    """Everything recorded for one (host, council) pair."""
+
+    requests: int = 0
+    bytes: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    retries: int = 0
+    selenium_pages: int = 0
+    selenium_errors: int = 0
+    throttle_wait: float = 0.0
+    backoff_wait: float = 0.0
+    latency: Histogram = field(default_factory=Histogram)
+
+    def merge(self, other: "Series") -> None:
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.statuses.update(other.statuses)
+        self.retries += other.retries
+        self.selenium_pages += other.selenium_pages
+        self.selenium_errors += other.selenium_errors
+        self.throttle_wait += other.throttle_wait
+        self.backoff_wait += other.backoff_wait
+        self.latency.merge(other.latency)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "statuses": {
+                str(k): v for k, v in sorted(self.statuses.items(), key=_by_status)
+            },
+            "retries": self.retries,
+            "selenium_pages": self.selenium_pages,
+            "selenium_errors": self.selenium_errors,
+            "throttle_wait_s": round(self.throttle_wait, 3),
+            "backoff_wait_s": round(self.backoff_wait, 3),
+            "latency_s": self.latency.to_dict(),
+        }
+
+
+def _by_status(item) -> str:
+    # Codes are ints and a failed request is "error"; they sort as text.
+    return str(item[0])
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class FetchMetrics:
+    """Thread-safe fetch counters and histograms, keyed by host and council.
+
+    `council` is whatever the fetcher was built for; fetchers that were not
+    built for one council record under "".
+    """
+
+    def __init__(self):
+        self.__series: dict[tuple[str, str], Series] = {}
+        self.__runs: dict[str, float] = {}
+        self.__lock = threading.Lock()
+
+    def __get(self, host: str, council: Optional[str]) -> Series:
+        key = (host, council or "")
+        series = self.__series.get(key)
+        if series is None:
+            series = self.__series[key] = Series()
+        return series
+
+    def request(
+        self,
+        host: str,
+        council: Optional[str],
+        status: int | str,
+        seconds: float,
+        size: int = 0,
+    ) -> None:
+        """One HTTP request; `status` is "error" when no response came back."""
+        with self.__lock:
+            series = self.__get(host, council)
+            series.requests += 1
+            series.bytes += size
+            series.statuses[status] += 1
+            series.latency.observe(seconds)
+
+    def selenium_page(
+        self, host: str, council: Optional[str], seconds: float, ok: bool = True
+    ) -> None:
+        with self.__lock:
+            series = self.__get(host, council)
+            series.selenium_pages += 1
+            if not ok:
+                series.selenium_errors += 1
+            series.latency.observe(seconds)
+
+    def throttled(self, host: str, council: Optional[str], seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self.__lock:
+            self.__get(host, council).throttle_wait += seconds
+
+    def retry(self, host: str, council: Optional[str], backoff: float) -> None:
+        with self.__lock:
+            series = self.__get(host, council)
+            series.retries += 1
+            series.backoff_wait += backoff
+
+    def ran(self, council: str, seconds: float) -> None:
+        """How long a council's scraper took, fetching and all."""
+        with self.__lock:
+            self.__runs[council] = self.__runs.get(council, 0.0) + seconds
+
+    def __grouped(self, index: int) -> dict[str, Series]:
+        grouped: dict[str, Series] = {}
+        for key, series in self.__series.items():
+            grouped.setdefault(key[index], Series()).merge(series)
+        return dict(sorted(grouped.items()))
+
+    def report(self) -> dict:
+        """Totals, the same figures per host and per council, and run times."""
+        with self.__lock:
+            hosts = self.__grouped(0)
+            councils = self.__grouped(1)
+            total = Series()
+            for series in self.__series.values():
+                total.merge(series)
+            runs = {c: round(s, 3) for c, s in sorted(self.__runs.items())}
+        return {
+            "total": total.to_dict(),
+            "run_s": runs,
+            "hosts": {host: s.to_dict() for host, s in hosts.items()},
+            "councils": {council: s.to_dict() for council, s in councils.items()},
+        }
+
+    def prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        p = PROMETHEUS_PREFIX
+        families = {
+            "requests_total": ("counter", "HTTP requests sent, by status."),
+            "response_bytes_total": ("counter", "Response body bytes received."),
+            "retries_total": ("counter", "Requests retried after a retryable status."),
+            "selenium_pages_total": ("counter", "Pages loaded through Selenium."),
+            "selenium_errors_total": (
+                "counter",
+                "Selenium page loads that timed out or failed.",
+            ),
+            "throttle_wait_seconds_total": (
+                "counter",
+                "Seconds spent waiting for the per-host rate budget.",
+            ),
+            "backoff_wait_seconds_total": (
+                "counter",
+                "Seconds spent backing off before retries.",
+            ),
+            "fetch_duration_seconds": (
+                "histogram",
+                "Time to fetch a page, by requests or Selenium.",
+            ),
+        }
+        samples: dict[str, list[str]] = {name: [] for name in families}
+        with self.__lock:
+            items = sorted(self.__series.items())
+            for (host, council), s in items:
+                labels = (
+                    f'host="{_escape_label(host)}",council="{_escape_label(council)}"'
+                )
+                for status, count in sorted(s.statuses.items(), key=_by_status):
+                    samples["requests_total"].append(
+                        f'{p}_requests_total{{{labels},status="{status}"}} {count}'
+                    )
+                for name, value in (
+                    ("response_bytes_total", s.bytes),
+                    ("retries_total", s.retries),
+                    ("selenium_pages_total", s.selenium_pages),
+                    ("selenium_errors_total", s.selenium_errors),
+                    ("throttle_wait_seconds_total", round(s.throttle_wait, 6)),
+                    ("backoff_wait_seconds_total", round(s.backoff_wait, 6)),
+                ):
+                    samples[name].append(f"{p}_{name}{{{labels}}} {value}")
+                histogram = samples["fetch_duration_seconds"]
+                for bound, count in s.latency.cumulative():
+                    histogram.append(
+                        f'{p}_fetch_duration_seconds_bucket{{{labels},le="{bound}"}}'
+                        f" {count}"
+                    )
+                histogram.append(
+                    f"{p}_fetch_duration_seconds_sum{{{labels}}}"
+                    f" {round(s.latency.sum, 6)}"
+                )
+                histogram.append(
+                    f"{p}_fetch_duration_seconds_count{{{labels}}} {s.latency.count}"
+                )
+
+        lines = []
+        for name, (kind, help_text) in families.items():
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            lines.extend(samples[name])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write `prometheus()` to `path` atomically.
+
+        The textfile collector may read the file at any moment, so it is
+        written beside it and renamed into place.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".prom.tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.prometheus())
+            # mkstemp makes the file private, and the collector may run as
+            # another user.
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+_shared: Optional[FetchMetrics] = None
+_shared_lock = threading.Lock()
+
+
+def default_metrics() -> FetchMetrics:
+    """The process-wide metrics every fetcher records into by default."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = FetchMetrics()
+        return _shared
@@ -0,0 +1,113 @@
+"""Per-host request budgets shared by every fetcher in the process.
+
+Council WAFs block on request *rate*. Each `DefaultFetcher` used to space its
+own requests with a private dict of last-request times, so two scrapers whose
+councils share a host — InfoCouncil and docspublished both serve several
+councils — were each polite on their own and together twice as fast as the
+host allows.
+
+`HostScheduler` keeps one token bucket per host for the whole process. A
+fetcher reserves a token before each request and is told how long to wait
+for it; it does the waiting itself, so the same scheduler serves threads
+(`time.sleep`) and coroutines (`asyncio.sleep`). Reserving ahead of time
+under a lock means concurrent callers queue behind each other for a host
+instead of all waking at once.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+DEFAULT_FETCH_DELAY = 2.0
+
+
+def host_of(url: str) -> str:
+    return urllib.parse.urlparse(url).netloc
+
+
+def default_fetch_delay() -> float:
+    return float(os.environ.get("FETCH_DELAY", DEFAULT_FETCH_DELAY))
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated_at: float
+
+
+class HostScheduler:
+    """Token bucket per host: one request per `interval` seconds on average.
+
+    `burst` is how many requests a host that has been idle may receive back
+    to back. The default of one reproduces the old fixed spacing. Each token
+    costs a jittered amount, so a long run of requests is not a metronome
+    while the average rate stays exact.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        burst: int = 1,
+        monotonic: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = interval
+        self.burst = burst
+        self.__monotonic = monotonic
+        self.__buckets: dict[str, _Bucket] = {}
+        self.__lock = threading.Lock()
+
+    def __refill(self, host: str, now: float) -> _Bucket:
+        bucket = self.__buckets.get(host)
+        if bucket is None:
+            bucket = self.__buckets[host] = _Bucket(float(self.burst), now)
+        elif now > bucket.updated_at:
+            bucket.tokens = min(
+                float(self.burst),
+                bucket.tokens + (now - bucket.updated_at) / self.interval,
+            )
+            bucket.updated_at = now
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """Claim the next request slot for `url`'s host.
+
+        Returns the seconds the caller must wait before sending.
+        """
+        if self.interval <= 0:
+            return 0.0
+
+        host = host_of(url)
+        with self.__lock:
+            now = self.__monotonic()
+            bucket = self.__refill(host, now)
+            wait = max(0.0, (1.0 - bucket.tokens) * self.interval)
+            bucket.tokens -= random.uniform(0.75, 1.25)
+        return wait
+
+    def ready_in(self, host: str) -> float:
+        """Seconds until `host` could be sent a request, without claiming it."""
+        if self.interval <= 0:
+            return 0.0
+
+        with self.__lock:
+            bucket = self.__refill(host, self.__monotonic())
+            return max(0.0, (1.0 - bucket.tokens) * self.interval)
+
+
+_shared: Optional[HostScheduler] = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler() -> HostScheduler:
+    """The process-wide scheduler, spaced by `FETCH_DELAY`."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HostScheduler(default_fetch_delay())
+        return _shared
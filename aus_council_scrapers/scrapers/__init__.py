@@ -1,2 +1,30 @@
-from aus_council_scrapers.scrapers.vic import *
-from aus_council_scrapers.scrapers.nsw import *
+"""Council scrapers, one module per council, grouped by state.
+
+Nothing is imported eagerly: `SCRAPER_REGISTRY` imports a scraper's module
+when that scraper is selected, and `load_all()` imports every module the
+state packages list. Scraper classes are still reachable as attributes of
+this package and of each state package.
+"""
+
+import importlib
+
+STATES = ("vic", "nsw")
+
+
+def load_all() -> None:
+    for state in STATES:
+        importlib.import_module(f"{__name__}.{state}").load_all()
+
+
+def export(package: str, modules, name: str):
+    """Find scraper class `name` in `package`'s modules, importing them all."""
+    if name.endswith("Scraper"):
+        for module in modules:
+            loaded = importlib.import_module(f"{package}.{module}")
+            if hasattr(loaded, name):
+                return getattr(loaded, name)
+    raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+
+def __getattr__(name):
+    return export(__name__, STATES, name)
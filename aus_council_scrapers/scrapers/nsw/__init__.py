@@ -1,36 +1,50 @@
-from aus_council_scrapers.scrapers.nsw.burwood import BurwoodNSWScraper
-from aus_council_scrapers.scrapers.nsw.camden import CamdenScraper
-from aus_council_scrapers.scrapers.nsw.campbelltown import CampbelltownScraper
-from aus_council_scrapers.scrapers.nsw.canada_bay import CanadaBayScraper
-from aus_council_scrapers.scrapers.nsw.canterbury_bankstown import (
-    CanterburyBankstownScraper,
+import importlib
+
+from aus_council_scrapers.scrapers import export
+
+# Modules whose scrapers are registered; see `load_all`.
+SCRAPER_MODULES = (
+    "burwood",
+    "camden",
+    "campbelltown",
+    "canada_bay",
+    "canterbury_bankstown",
+    "cumberland",
+    "georges_river",
+    "hornsby",
+    "hunters_hill",
+    "innerwest",
+    "kuringgai",
+    "lane_cove",
+    "liverpool",
+    "northern_beaches",
+    "parramatta",
+    "penrith_city",
+    "randwick",
+    "ryde",
+    "strathfield",
+    "waverley",
+    "woollahra",
 )
-from aus_council_scrapers.scrapers.nsw.cumberland import CumberlandScraper
-from aus_council_scrapers.scrapers.nsw.georges_river import GeorgesRiverScraper
-from aus_council_scrapers.scrapers.nsw.hornsby import HornsbyScraper
-from aus_council_scrapers.scrapers.nsw.hunters_hill import HuntersHillScraper
-from aus_council_scrapers.scrapers.nsw.innerwest import InnerWestScraper
-from aus_council_scrapers.scrapers.nsw.kuringgai import KuRingGaiScraper
-from aus_council_scrapers.scrapers.nsw.lane_cove import LaneCoveScraper
-from aus_council_scrapers.scrapers.nsw.liverpool import LiverpoolScraper
-from aus_council_scrapers.scrapers.nsw.northern_beaches import NorthernBeachesScraper
-from aus_council_scrapers.scrapers.nsw.parramatta import ParramattaScraper
-from aus_council_scrapers.scrapers.nsw.penrith_city import PenrithCityScraper
-from aus_council_scrapers.scrapers.nsw.randwick import RandwickScraper
-from aus_council_scrapers.scrapers.nsw.ryde import RydeScraper
-from aus_council_scrapers.scrapers.nsw.strathfield import StrathfieldNSWScraper
-from aus_council_scrapers.scrapers.nsw.waverley import WaverleyScraper
-from aus_council_scrapers.scrapers.nsw.woollahra import WoollahraScraper
 
 # BROKEN
-# from council_scrapers.scrapers.nsw.bayside_nsw import BaysideNSWScraper
-# from council_scrapers.scrapers.nsw.north_sydney import NorthSydneyScraper
-# from council_scrapers.scrapers.nsw.willoughby import WilloughbyNSWScraper
+# bayside_nsw (BaysideNSWScraper)
+# north_sydney (NorthSydneyScraper)
+# willoughby (WilloughbyNSWScraper)
 
 # NOT IMPLEMENTED
-# from council_scrapers.scrapers.nsw.blacktown import BlacktownScraper
-# from council_scrapers.scrapers.nsw.fairfield_city import FairfieldCityScraper
-# from council_scrapers.scrapers.nsw.mosman import MosmanScraper
-# from council_scrapers.scrapers.nsw.sutherland_shire import SutherlandShireScraper
-# from council_scrapers.scrapers.nsw.sydney import SydneyScraper
-# from council_scrapers.scrapers.nsw.the_hills import TheHillsScraper
+# blacktown (BlacktownScraper)
+# fairfield_city (FairfieldCityScraper)
+# mosman (MosmanScraper)
+# sutherland_shire (SutherlandShireScraper)
+# sydney (SydneyScraper)
+# the_hills (TheHillsScraper)
+
+
+def load_all() -> None:
+    for module in SCRAPER_MODULES:
+        importlib.import_module(f"{__name__}.{module}")
+
+
+def __getattr__(name):
+    return export(__name__, SCRAPER_MODULES, name)
@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 import re
 
 
@@ -23,13 +22,13 @@ class CamdenScraper(BaseScraper):
         minutes_url = None
 
         output = self.fetcher.fetch_with_requests(webpage_url)
-        soup = BeautifulSoup(output, "html.parser")
+        soup = self.soup(output)
         meets = soup.find("h4")
         link = meets.find_next("a")["href"]
         latest_year = f"{self.base_url}/" + link
 
         output = self.fetcher.fetch_with_requests(latest_year)
-        soup = BeautifulSoup(output, "html.parser")
+        soup = self.soup(output)
 
         latest_meet = soup.find("h2")
         # Custom pattern. TODO: Refactor to use constant regex.
@@ -53,7 +53,7 @@ class CampbelltownScraper(BaseScraper):
         """
         try:
             html = self._fetch_html(meetings_url)
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self.soup(html)
 
             candidates: list[tuple[int, str]] = []
             for a in soup.select("a[href]"):
@@ -160,7 +160,7 @@ class CampbelltownScraper(BaseScraper):
             if len(output) < 100 or "<body></body>" in output:
                 return results
 
-            soup = BeautifulSoup(output, "html.parser")
+            soup = self.soup(output)
 
             # Find all h2 headers that indicate meetings
             for header in soup.find_all("h2"):
@@ -233,7 +233,7 @@ class CampbelltownScraper(BaseScraper):
         try:
             # Use selenium directly for the meetings index page
             html = self.fetcher.fetch_with_selenium(meetings_url)
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self.soup(html)
 
             # The page links every year twice (navigation and body), so
             # collect by year — scraping a year page twice emitted every
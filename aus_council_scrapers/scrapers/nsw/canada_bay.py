@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 import re
 
 
@@ -27,7 +26,7 @@ class CanadaBayScraper(BaseScraper):
 
         response = self.fetcher.fetch_with_requests(webpage_url)
 
-        soup = BeautifulSoup(response, "html.parser")
+        soup = self.soup(response)
 
         name = None
         date = None
@@ -4,7 +4,6 @@ from aus_council_scrapers.base import (
     register_scraper,
     Fetcher,
 )
-from bs4 import BeautifulSoup
 
 
 @register_scraper
@@ -26,7 +25,7 @@ class CanterburyBankstownScraper(BaseScraper):
         download_url = None
 
         output = self.fetcher.fetch_with_requests(webpage_url)
-        soup = BeautifulSoup(output, "html.parser")
+        soup = self.soup(output)
 
         latest_meet = soup.find("tr", class_="ms-rteTableOddRow-4")
         date = latest_meet.find_next("td").contents[0]
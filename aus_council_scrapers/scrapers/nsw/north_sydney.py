@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, register_scraper, ScraperReturn
-from bs4 import BeautifulSoup
 import re
 
 
@@ -22,11 +21,11 @@ class NorthSydneyScraper(BaseScraper):
         download_url = None
 
         output = self.fetch_with_requests(webpage_url)
-        soup = BeautifulSoup(output.content, "html.parser")
+        soup = self.soup(output.content)
         nextUrl = soup.find("a", class_="listing__link")["href"]
 
         meetingPage = self.fetch_with_requests(f"{self.base_url}{nextUrl}")
-        soup = BeautifulSoup(meetingPage.content, "html.parser")
+        soup = self.soup(meetingPage.content)
 
         links = soup.find_all("a", class_="listing__link")
         filtered_links = [link for link in links if "agenda" in link.text.lower()]
@@ -4,7 +4,6 @@ from aus_council_scrapers.base import (
     register_scraper,
     Fetcher,
 )
-from bs4 import BeautifulSoup
 import re
 
 
@@ -28,11 +27,11 @@ class RydeScraper(BaseScraper):
         download_url = None
 
         output = self.fetcher.fetch_with_requests(webpage_url)
-        soup = BeautifulSoup(output, "html.parser")
+        soup = self.soup(output)
         next_url = soup.find("article").find("a")["href"]
 
         meeting_page = self.fetcher.fetch_with_requests(next_url)
-        soup = BeautifulSoup(meeting_page, "html.parser")
+        soup = self.soup(meeting_page)
 
         # name and date
         name_date = soup.find("h1", class_="oc-page-title").text
@@ -8,7 +8,6 @@ from datetime import datetime, timezone
 from typing import Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
 from aus_council_scrapers.constants import EARLIEST_YEAR
@@ -180,7 +179,7 @@ class StrathfieldNSWScraper(BaseScraper):
         combined = "\n".join(normalised_blobs)
 
         # 3) Try to parse anchors if there's HTML
-        soup = BeautifulSoup(combined, "html.parser")
+        soup = self.soup(combined, only="a")
         pdf_links: list[str] = []
 
         for a in soup.select("a[href]"):
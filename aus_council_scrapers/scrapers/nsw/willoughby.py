@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 from datetime import datetime
 
 
@@ -13,7 +12,7 @@ class WilloughbyNSWScraper(BaseScraper):
 
     def council_minutes_scraper(self, meeting_url) -> ScraperReturn | None:
         output = self.fetch_with_requests(meeting_url)
-        soup = BeautifulSoup(output.content, "html.parser")
+        soup = self.soup(output.content)
         div = soup.find("div", class_="meeting-container")  # Find the main container
         meeting_info = {
             "name": None,
@@ -63,7 +62,7 @@ class WilloughbyNSWScraper(BaseScraper):
 
         output = self.fetch_with_requests(webpage_url)
 
-        soup = BeautifulSoup(output.content, "html.parser")
+        soup = self.soup(output.content)
 
         # meetings are articles yay semantic web
         articles = soup.find_all("article")
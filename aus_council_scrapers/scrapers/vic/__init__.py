@@ -1,25 +1,38 @@
-from aus_council_scrapers.scrapers.vic.banyule import BanyuleScraper
-from aus_council_scrapers.scrapers.vic.bayside import BaysideVicScraper
-from aus_council_scrapers.scrapers.vic.brimbank import BrimbankScraper
-from aus_council_scrapers.scrapers.vic.boroondara import BoroondaraScraper
-from aus_council_scrapers.scrapers.vic.darebin import DarebinScraper
-from aus_council_scrapers.scrapers.vic.glen_eira import GlenEiraScraper
-from aus_council_scrapers.scrapers.vic.manningham import ManninghamScraper
-from aus_council_scrapers.scrapers.vic.melbourne import MelbourneScraper
-from aus_council_scrapers.scrapers.vic.merribek import MerribekScraper
-
-from aus_council_scrapers.scrapers.vic.port_phillip import PortPhilipScraper
-from aus_council_scrapers.scrapers.vic.whitehorse import WhitehorseScraper
-from aus_council_scrapers.scrapers.vic.yarra import YarraScraper
+import importlib
+
+from aus_council_scrapers.scrapers import export
+
+# Modules whose scrapers are registered; see `load_all`.
+SCRAPER_MODULES = (
+    "banyule",
+    "bayside",
+    "brimbank",
+    "boroondara",
+    "darebin",
+    "glen_eira",
+    "manningham",
+    "melbourne",
+    "merribek",
+    "port_phillip",
+    "whitehorse",
+    "yarra",
+)
 
 # BROKEN SCRAPERS
-# from council_scrapers.scrapers.vic.maribyrnong import MaribyrnongScraper
+# maribyrnong (MaribyrnongScraper)
 
 # UNIMPLEMENTED SCRAPERS
-# from council_scrapers.scrapers.vic.stonnington import StonningtonScraper
-# from council_scrapers.scrapers.vic.manningham import ManninghamScraper
-# from council_scrapers.scrapers.vic.monash import MonashScraper
-# from council_scrapers.scrapers.vic.kingston import KingstonScraper
-# from council_scrapers.scrapers.vic.hobsons_bay import HobsonsBayScraper
-# from council_scrapers.scrapers.vic.moonee_valley import MooneeValleyScraper
-# from council_scrapers.scrapers.vic.stonnington import StonningtonScraper
+# stonnington (StonningtonScraper)
+# monash (MonashScraper)
+# kingston (KingstonScraper)
+# hobsons_bay (HobsonsBayScraper)
+# moonee_valley (MooneeValleyScraper)
+
+
+def load_all() -> None:
+    for module in SCRAPER_MODULES:
+        importlib.import_module(f"{__name__}.{module}")
+
+
+def __getattr__(name):
+    return export(__name__, SCRAPER_MODULES, name)
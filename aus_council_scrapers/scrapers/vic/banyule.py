@@ -130,7 +130,7 @@ class BanyuleScraper(BaseScraper):
     ) -> None:
         """Collect every meeting in the listing as currently filtered."""
         while True:
-            page_soup = BeautifulSoup(driver.page_source, "html.parser")
+            page_soup = self.soup(driver.page_source)
             for item in _parse_listing_items(page_soup):
                 if item[2] not in seen_cvids:
                     seen_cvids.add(item[2])
@@ -158,7 +158,7 @@ class BanyuleScraper(BaseScraper):
         gap in this scraper — there is nothing here to fix.
         """
         listing_html = self.fetcher.fetch_with_selenium(self.webpage_url)
-        initial_soup = BeautifulSoup(listing_html, "html.parser")
+        initial_soup = self.soup(listing_html)
 
         all_items: list[tuple[str, str, str]] = []
         seen_cvids: set[str] = set()
@@ -220,7 +220,7 @@ class BanyuleScraper(BaseScraper):
 
         # The browser wraps the JSON in <html><body><pre>…</pre></body></html>
         # Extract the raw JSON string.
-        soup = BeautifulSoup(raw, "html.parser")
+        soup = self.soup(raw, only="pre")
         pre = soup.find("pre")
         json_text = pre.get_text() if pre else raw
         try:
@@ -234,7 +234,7 @@ class BanyuleScraper(BaseScraper):
                 return None
 
         html = data.get("html", "")
-        return BeautifulSoup(html, "html.parser") if html else None
+        return self.soup(html) if html else None
 
     def _extract_doc_url(self, section: BeautifulSoup) -> str | None:
         for a in section.find_all("a", href=True):
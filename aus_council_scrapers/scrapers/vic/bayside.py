@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 
@@ -20,7 +19,7 @@ class BaysideVicScraper(BaseScraper):
 
         # Fetch all agendas
         agendas_html = self.fetcher.fetch_with_requests(agendas_page_url)
-        agendas_soup = BeautifulSoup(agendas_html, "html.parser")
+        agendas_soup = self.soup(agendas_html)
         agenda_list = agendas_soup.find("div", class_="page__body")
 
         # Build a dict of meetings from agendas: date -> meeting info
@@ -52,7 +51,7 @@ class BaysideVicScraper(BaseScraper):
         # Fetch all minutes and match them to agendas
         try:
             minutes_html = self.fetcher.fetch_with_requests(minutes_page_url)
-            minutes_soup = BeautifulSoup(minutes_html, "html.parser")
+            minutes_soup = self.soup(minutes_html)
             minutes_list = minutes_soup.find("div", class_="page__body")
 
             if minutes_list:
@@ -52,9 +52,8 @@ class BoroondaraScraper(BaseScraper):
     )
 
     def _soup(self, url: str) -> BeautifulSoup:
-        # The fetcher throttles per host and backs off on 429 already; a run
-        # over ~115 event pages needs nothing more than that.
-        return BeautifulSoup(self.fetcher.fetch_with_requests(url), "html.parser")
+        # The fetcher throttles per host and backs off on 429 already.
+        return self.soup(self.fetcher.fetch_with_requests(url))
 
     def _years_filter(self) -> set[int] | None:
         years = getattr(self, "years_filter", None)
@@ -229,35 +228,40 @@ class BoroondaraScraper(BaseScraper):
                 if url not in event_urls:
                     event_urls.append(url)
 
-        results: list[ScraperReturn] = []
-        for event_url in event_urls:
-            slug_year = self._year_from_slug(event_url)
-            if years and slug_year and slug_year not in years:
-                continue
-
-            soup = self._soup(event_url)
-            agenda_url, minutes_url = self._agenda_and_minutes(soup)
-            if not agenda_url and not minutes_url:
-                # Scheduled but nothing published yet, or a cancelled meeting.
-                # A record with no documents fails the pipeline's required-field
-                # check, so there is nothing to emit.
-                continue
-
-            h1 = soup.find("h1")
-            name = h1.get_text(" ", strip=True) if h1 else "Council Meeting"
-            date, time = self._date_and_time(soup, name)
-
-            results.append(
-                ScraperReturn(
-                    name=name,
-                    date=date,
-                    time=time,
-                    webpage_url=event_url,
-                    download_url=agenda_url or minutes_url,  # backward compatibility
-                    agenda_url=agenda_url,
-                    minutes_url=minutes_url,
-                    location=self._location(soup),
-                )
+        # The listings are paged by "next" links and have to be walked in
+        # order, but the ~115 event pages they point at are independent.
+        wanted = [
+            url
+            for url in event_urls
+            if not (
+                years
+                and (slug_year := self._year_from_slug(url))
+                and slug_year not in years
             )
+        ]
+        meetings = self.fetch_many(wanted, parse=self._parse_event_page)
+        return [meeting for meeting in meetings if meeting is not None]
+
+    def _parse_event_page(self, event_url: str, html: str) -> ScraperReturn | None:
+        soup = self.soup(html)
+        agenda_url, minutes_url = self._agenda_and_minutes(soup)
+        if not agenda_url and not minutes_url:
+            # Scheduled but nothing published yet, or a cancelled meeting.
+            # A record with no documents fails the pipeline's required-field
+            # check, so there is nothing to emit.
+            return None
 
-        return results
+        h1 = soup.find("h1")
+        name = h1.get_text(" ", strip=True) if h1 else "Council Meeting"
+        date, time = self._date_and_time(soup, name)
+
+        return ScraperReturn(
+            name=name,
+            date=date,
+            time=time,
+            webpage_url=event_url,
+            download_url=agenda_url or minutes_url,  # backward compatibility
+            agenda_url=agenda_url,
+            minutes_url=minutes_url,
+            location=self._location(soup),
+        )
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import date, datetime
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
 from aus_council_scrapers.constants import EARLIEST_YEAR
@@ -44,7 +43,7 @@ class BrimbankScraper(BaseScraper):
         return f"{self.base_url}/about-council/your-council/agendas-and-minutes/council-meetings-{year}"
 
     def _parse_year_page(self, html: str, year: int) -> list[ScraperReturn]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.soup(html)
         results: list[ScraperReturn] = []
         webpage_url = self._year_page_url(year)
 
@@ -112,6 +111,11 @@ class BrimbankScraper(BaseScraper):
         results: list[ScraperReturn] = []
 
         for year in target_years:
+            stored = self.closed_period(str(year))
+            if stored is not None:
+                results.extend(stored)
+                continue
+
             url = self._year_page_url(year)
             try:
                 html = self.fetcher.fetch_with_requests(url)
@@ -120,6 +124,7 @@ class BrimbankScraper(BaseScraper):
                 continue
 
             year_results = self._parse_year_page(html, year)
+            self.record_period(str(year), year_results, date(year, 12, 31))
             results.extend(year_results)
 
         # Sort by date descending (newest first)
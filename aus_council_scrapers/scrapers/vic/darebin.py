@@ -1,7 +1,6 @@
 import datetime
 import re
 
-from bs4 import BeautifulSoup
 
 from aus_council_scrapers import clock
 from aus_council_scrapers.base import (
@@ -10,6 +9,7 @@ from aus_council_scrapers.base import (
     register_scraper,
 )
 from aus_council_scrapers.constants import EARLIEST_YEAR
+from aus_council_scrapers.dates import year_of
 
 _BASE_URL = "https://www.darebin.vic.gov.au"
 _LISTING_URL = (
@@ -48,18 +48,14 @@ class DarebinScraper(BaseScraper):
         normalised = href.replace("-", " ").replace("_", " ")
         for m in self.date_regex.finditer(normalised):
             candidate = m.group()
-            try:
-                from dateutil.parser import parse as _parse
-                if _parse(candidate, fuzzy=True).year == year:
-                    return candidate
-            except Exception:
-                pass
+            if year_of(candidate) == year:
+                return candidate
         return None
 
     def _parse_year_page(self, year: int) -> list[ScraperReturn]:
         url = _YEAR_PAGE_URL.format(year=year)
         html = self.fetcher.fetch_with_selenium(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.soup(html, only="a")
 
         # Collect agenda/minutes URLs keyed by (date_str, meeting_type).
         # dict value: {"agenda_url": ..., "minutes_url": ...}
@@ -88,11 +84,7 @@ class DarebinScraper(BaseScraper):
             # If the date belongs to a different year (e.g. "adjourned from
             # 22 December 2025" on the 2026 page), try to recover the actual
             # meeting date from the PDF URL, which usually contains the real date.
-            try:
-                from dateutil.parser import parse as _parse
-                extracted_year = _parse(date_str, fuzzy=True).year
-            except Exception:
-                extracted_year = None
+            extracted_year = year_of(date_str)
 
             if extracted_year != year:
                 url_date = self._date_from_url(href, year)
@@ -112,6 +104,7 @@ class DarebinScraper(BaseScraper):
                 meetings[key]["minutes_url"] = full_url
 
         results = self._build_results(meetings, order, url)
+        self.record_period(str(year), results, datetime.date(year, 12, 31))
         return results
 
     def _resolve_shared_document(
@@ -182,7 +175,9 @@ class DarebinScraper(BaseScraper):
 
         all_results: list[ScraperReturn] = []
         for year in years_to_fetch:
-            results = self._parse_year_page(year)
+            results = self.closed_period(str(year))
+            if results is None:
+                results = self._parse_year_page(year)
             all_results.extend(results)
 
         return all_results
@@ -2,7 +2,6 @@ import datetime
 import json
 import re
 
-from bs4 import BeautifulSoup
 
 from aus_council_scrapers import clock
 from aus_council_scrapers.base import (
@@ -44,7 +43,7 @@ class GlenEiraScraper(BaseScraper):
 
     def _extract_meeting_links(self, html: str, seen: set) -> list[str]:
         """Return new meeting page hrefs found in html, updating seen in place."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.soup(html)
         links = []
         for a in soup.find_all("a", href=True):
             href = a["href"]
@@ -82,7 +81,7 @@ class GlenEiraScraper(BaseScraper):
         for href in meeting_links:
             meeting_url = _abs(href)
             meeting_html = self.fetcher.fetch_with_requests(meeting_url)
-            meeting_soup = BeautifulSoup(meeting_html, "html.parser")
+            meeting_soup = self.soup(meeting_html)
 
             # Date and time from page content
             page_text = meeting_soup.get_text(" ", strip=True)
@@ -1,6 +1,5 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
 from aus_council_scrapers.constants import EARLIEST_YEAR
-from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 from urllib.parse import urljoin
@@ -18,7 +17,7 @@ class ManninghamScraper(BaseScraper):
     def _get_meeting_links(self) -> list[str]:
         """Return all council meeting page URLs from the listings page."""
         html = self.fetcher.fetch_with_requests(self.webpage_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.soup(html)
         urls = []
         seen = set()
         for a in soup.find_all("a", href=True):
@@ -34,7 +33,7 @@ class ManninghamScraper(BaseScraper):
     def _parse_meeting_page(self, url: str) -> ScraperReturn | None:
         """Fetch a meeting page and extract agenda/minutes info."""
         html = self.fetcher.fetch_with_requests(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.soup(html)
 
         # Date and time: prefer ICS export (upcoming meetings), fall back to page title
         ics = soup.find("a", class_="js-ics-export")
@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 import re
 
 
@@ -21,7 +20,7 @@ class MaribyrnongScraper(BaseScraper):
             self.logger.error("Failed to fetch the main page.")
             return []
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = self.soup(response.content)
         latest_meeting_link = soup.find(
             "a", class_="accordion-trigger minutes-trigger ajax-trigger"
         )["href"]
@@ -32,7 +31,7 @@ class MaribyrnongScraper(BaseScraper):
             self.logger.error("Failed to fetch the latest meeting page.")
             return []
 
-        soup = BeautifulSoup(meeting_response.content, "html.parser")
+        soup = self.soup(meeting_response.content)
         meeting_container = soup.find("div", class_="meeting-container")
         if not meeting_container:
             self.logger.error("Meeting container not found.")
@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 import re
 
 
@@ -16,14 +15,14 @@ class MelbourneScraper(BaseScraper):
 
         # Find next meeting url
         raw_html = self.fetcher.fetch_with_selenium(webpage_url)
-        init_soup = BeautifulSoup(raw_html, "html.parser")
+        init_soup = self.soup(raw_html)
         meeting_a = init_soup.select_one("#meetingResults .result a")
         meeting_url = meeting_a["href"]
         meeting_name = meeting_a.get_text()
 
         # Parse html of next meeting
         meeting_html = self.fetcher.fetch_with_selenium(meeting_url)
-        meeting_soup = BeautifulSoup(meeting_html, "html.parser")
+        meeting_soup = self.soup(meeting_html)
 
         # Date
         date_search = self.date_regex.search(meeting_name)
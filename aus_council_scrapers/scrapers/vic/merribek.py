@@ -151,9 +151,7 @@ class MerribekScraper(BaseScraper):
         return _DEFAULT_NAME
 
     def scraper(self) -> list[ScraperReturn]:
-        soup = BeautifulSoup(
-            self.fetcher.fetch_with_requests(_LISTING_URL), "html.parser"
-        )
+        soup = self.soup(self.fetcher.fetch_with_requests(_LISTING_URL))
 
         results = []
         seen = set()
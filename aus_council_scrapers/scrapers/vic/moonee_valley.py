@@ -1,5 +1,4 @@
 from aus_council_scrapers.base import BaseScraper, ScraperReturn, register_scraper
-from bs4 import BeautifulSoup
 import re
 
 
@@ -18,8 +17,8 @@ class MooneeValleyScraper(BaseScraper):
         output = self.fetch_with_selenium(webpage_url)
         self.close()
 
-        # Feed the HTML to BeautifulSoup
-        soup = BeautifulSoup(output, "html.parser")
+        # Parse the HTML
+        soup = self.soup(output)
 
         name = None
         date = None
@@ -16,15 +16,13 @@ from __future__ import annotations
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-
 from aus_council_scrapers.base import (
     InfoCouncilScraper,
     ScraperReturn,
     register_scraper,
 )
 from aus_council_scrapers.constants import EARLIEST_YEAR
+from aus_council_scrapers.dates import year_of
 
 _ARCHIVE_PATH = "/about-the-council/council-meetings/previous-meetings-and-agendas/"
 
@@ -52,11 +50,11 @@ class PortPhilipScraper(InfoCouncilScraper):
 
         # Only reach into the archive for years InfoCouncil does not carry, so
         # the two sources cannot produce the same meeting twice.
-        years = {y for y in (_year_of(r.date) for r in results) if y}
+        years = {y for y in (year_of(r.date) for r in results) if y}
         floor = min(years) if years else None
 
         for meeting in self._scrape_archive():
-            year = _year_of(meeting.date)
+            year = year_of(meeting.date)
             if year and year >= EARLIEST_YEAR and (floor is None or year < floor):
                 results.append(meeting)
 
@@ -71,7 +69,7 @@ class PortPhilipScraper(InfoCouncilScraper):
             self.logger.warning(f"Could not fetch the Port Phillip archive: {e}")
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self.soup(html)
         meetings = []
 
         for item in soup.find_all(class_="i-accordion__item"):
@@ -114,10 +112,3 @@ class PortPhilipScraper(InfoCouncilScraper):
             )
 
         return meetings
-
-
-def _year_of(date_str) -> int | None:
-    try:
-        return parse_date(str(date_str), fuzzy=True).year
-    except Exception:
-        return None
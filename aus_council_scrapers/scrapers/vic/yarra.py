@@ -117,7 +117,7 @@ class YarraScraper(BaseScraper):
     def scraper(self) -> list[ScraperReturn]:
         index_url = "https://www.yarracity.vic.gov.au/about-us/council-and-committee-meetings/council-meetings"
         index_html = self.fetcher.fetch_with_requests(index_url)
-        index_soup = BeautifulSoup(index_html, "html.parser")
+        index_soup = self.soup(index_html)
 
         meetings = self._extract_meeting_links(index_soup)
         if not meetings:
@@ -131,7 +131,7 @@ class YarraScraper(BaseScraper):
         best = None  # (meeting_date, meeting_url, agenda_url, meeting_soup)
         for meeting_date, meeting_text, meeting_url in meetings_to_check:
             meeting_html = self.fetcher.fetch_with_requests(meeting_url)
-            meeting_soup = BeautifulSoup(meeting_html, "html.parser")
+            meeting_soup = self.soup(meeting_html)
 
             agenda_url = self._find_agenda_in_documents_section(meeting_soup)
             if not agenda_url:
@@ -0,0 +1,121 @@
+"""Parsing fetched pages into BeautifulSoup trees.
+
+Parsing is most of a replay run's CPU, and the trees are the largest thing a
+worker thread holds: every InfoCouncil year page was built into a full
+html.parser tree to read one table out of it. `make_soup` parses with lxml,
+a dependency, falling back to the standard library's html.parser where it
+cannot be imported, and given `only` builds just the elements a scraper
+reads (a SoupStrainer), so the rest of the page is tokenised but never
+turned into objects.
+
+Both backends must hand scrapers the same strings; the cassettes replay
+identically under either. They differ in one way that reaches our results:
+libxml2 turns CRLF into LF in text, while html.parser keeps it, and
+InfoCouncil committee cells carry their CRLFs into meeting names. So before
+lxml sees a page, carriage returns in text are written as character
+references, which libxml2 decodes without normalising. Script and style
+bodies are raw text, where a reference would not be decoded, so they are
+left alone and do lose their CRs under lxml; no scraper reads them through
+a soup.
+
+`HTML_PARSER` picks the backend ("lxml" or "html.parser"); by default it is
+lxml if it can be imported.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import os
+import re
+import warnings
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit, XMLParsedAsHTMLWarning
+
+BACKENDS = ("lxml", "html.parser")
+
+# Some InfoCouncil sites serve XHTML with an XML declaration, which sets off
+# this warning under lxml on every page. It is HTML to us, as to html.parser.
+warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+
+_RAW_TEXT = re.compile(r"(<(script|style)\b.*?</\2\s*>)", re.IGNORECASE | re.DOTALL)
+# A carriage return with no ">" before the next "<" is in text, not in a tag.
+_TEXT_CR = re.compile(r"\r(?=[^<>]*<)")
+_SELECTOR = re.compile(r"^([\w-]*)(?:([#.])([\w-]+))?$")
+
+
+@functools.lru_cache(maxsize=None)
+def lxml_installed() -> bool:
+    return importlib.util.find_spec("lxml") is not None
+
+
+def default_backend() -> str:
+    """The backend named by `HTML_PARSER`, else lxml when it is installed.
+
+    Read at parse time rather than at import, like the other settings
+    `main` passes through the environment.
+    """
+    backend = os.environ.get("HTML_PARSER")
+    if not backend:
+        return "lxml" if lxml_installed() else "html.parser"
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"HTML_PARSER must be one of {', '.join(BACKENDS)}, not {backend!r}"
+        )
+    return backend
+
+
+def _has_class(name: str):
+    def match(value) -> bool:
+        if value is None:
+            return False
+        values = value.split() if isinstance(value, str) else value
+        return name in values
+
+    return match
+
+
+@functools.lru_cache(maxsize=None)
+def strainer(selector: str) -> SoupStrainer:
+    """A SoupStrainer for a one-step selector: `tag`, `tag#id` or `tag.class`.
+
+    Anything richer is better written as a SoupStrainer and passed as is.
+    """
+    found = _SELECTOR.match(selector.strip())
+    if found is None or not (found.group(1) or found.group(3)):
+        raise ValueError(f"Unsupported selector for partial parsing: {selector!r}")
+    tag, kind, value = found.groups()
+    attrs = {}
+    if kind == "#":
+        attrs["id"] = value
+    elif kind == ".":
+        attrs["class"] = _has_class(value)
+    return SoupStrainer(tag or None, attrs=attrs)
+
+
+def escape_text_carriage_returns(markup: str) -> str:
+    """Write carriage returns in text as ``&#13;`` so libxml2 keeps them."""
+    if "\r" not in markup:
+        return markup
+    parts = _RAW_TEXT.split(markup)
+    # split() yields text, the raw-text element, and its tag name in turn.
+    for i in range(0, len(parts), 3):
+        parts[i] = _TEXT_CR.sub("&#13;", parts[i])
+    return "".join(part for i, part in enumerate(parts) if i % 3 != 2)
+
+
+def make_soup(
+    markup: Union[str, bytes],
+    only: Union[str, SoupStrainer, None] = None,
+    backend: Optional[str] = None,
+) -> BeautifulSoup:
+    """Parse `markup`, keeping only the elements `only` selects, if given."""
+    backend = backend or default_backend()
+    if backend == "lxml":
+        if isinstance(markup, bytes):
+            # Decode as html.parser would, rather than by libxml2's own rules.
+            markup = UnicodeDammit(markup, is_html=True).unicode_markup
+        markup = escape_text_carriage_returns(markup)
+    parse_only = strainer(only) if isinstance(only, str) else only
+    return BeautifulSoup(markup, backend, parse_only=parse_only)
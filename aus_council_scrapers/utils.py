@@ -1,64 +1,186 @@
+import contextlib
+import hashlib
 import os.path
 import re
-import smtplib
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Optional
+from typing import Iterable, Iterator, Mapping, Optional, Union
 
 import fitz
 import pytz
 import requests
-from base import ScraperReturn
 from dotenv import dotenv_values
 
+from aus_council_scrapers.base import ScraperReturn
 from aus_council_scrapers.constants import TIMEZONES_BY_STATE
+from aus_council_scrapers.keywords import KeywordCounts, matcher_for
 
 config = dotenv_values(".env") if os.path.exists(".env") else {}
 
 
-def download_pdf(link: str, council_name: str):
-    response = requests.get(link)
-    os.makedirs("files", exist_ok=True)
-    with open(f"files/{council_name}_latest.pdf", "wb") as f:
-        f.write(response.content)
+# Agendas run to 16 MB; anything far beyond that is not a meeting paper.
+MAX_PDF_BYTES = int(float(config.get("PDF_MAX_MB", 64)) * 1024 * 1024)
+# PDFs up to this size are parsed straight from memory; larger ones are
+# spooled to a private temporary file so a run does not hold them in RAM.
+PDF_IN_MEMORY_BYTES = 32 * 1024 * 1024
+# (connect, read) seconds. The read timeout is per chunk, not for the file.
+PDF_TIMEOUT = (10, 60)
+_CHUNK_BYTES = 64 * 1024
+
+
+class PdfTooLarge(ValueError):
+    pass
+
+
+@dataclass
+class PdfDownload:
+    """A downloaded PDF, held in memory or spooled to a private file."""
+
+    url: str
+    headers: Mapping[str, str]
+    # Hex SHA-256 of the body; None when the server answered 304.
+    sha256: Optional[str] = None
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.sha256 is None
+
+    def open(self) -> fitz.Document:
+        if self.path is not None:
+            return fitz.open(self.path, filetype="pdf")
+        return fitz.open(stream=self.data, filetype="pdf")
+
+
+@contextlib.contextmanager
+def download_pdf(
+    link: str,
+    max_bytes: int = MAX_PDF_BYTES,
+    timeout=PDF_TIMEOUT,
+    in_memory_bytes: int = PDF_IN_MEMORY_BYTES,
+    headers: Optional[dict[str, str]] = None,
+) -> Iterator[PdfDownload]:
+    """Download a PDF in chunks, hashing it as it arrives.
+
+    Pass conditional-request `headers` to allow a 304, which yields a
+    download with no body. Any spooled file is removed on exit. Raises
+    `PdfTooLarge` past `max_bytes`.
+    """
+    buffer = bytearray()
+    digest = hashlib.sha256()
+    spool = None
+    try:
+        with requests.get(
+            link, stream=True, timeout=timeout, headers=headers
+        ) as response:
+            if response.status_code == 304:
+                yield PdfDownload(link, response.headers)
+                return
+            response.raise_for_status()
+            declared = response.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > max_bytes:
+                raise PdfTooLarge(f"{link} is {int(declared)} bytes")
+
+            size = 0
+            for chunk in response.iter_content(_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise PdfTooLarge(f"{link} is over {max_bytes} bytes")
+                digest.update(chunk)
+                if spool is None and size > in_memory_bytes:
+                    spool = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+                    spool.write(buffer)
+                    buffer = bytearray()
+                if spool is None:
+                    buffer.extend(chunk)
+                else:
+                    spool.write(chunk)
+
+        download = PdfDownload(link, response.headers, digest.hexdigest())
+        if spool is None:
+            download.data = bytes(buffer)
+        else:
+            spool.close()
+            download.path = spool.name
+        yield download
+    finally:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+
+
+@contextlib.contextmanager
+def open_pdf(
+    link: str,
+    max_bytes: int = MAX_PDF_BYTES,
+    timeout=PDF_TIMEOUT,
+    in_memory_bytes: int = PDF_IN_MEMORY_BYTES,
+) -> Iterator[fitz.Document]:
+    """Download a PDF in chunks and open it, without a shared file.
+
+    This used to write every PDF to ``files/<council>_latest.pdf`` with no
+    timeout and no size limit, then read it back. Two councils running at
+    once could clobber each other's file, and a stalled or enormous download
+    held a worker forever. Raises `PdfTooLarge` past `max_bytes`.
+    """
+    with download_pdf(link, max_bytes, timeout, in_memory_bytes) as download:
+        with download.open() as doc:
+            yield doc
+
+
+def page_texts(doc: fitz.Document) -> Iterator[str]:
+    """Each page's text in order, extracted as it is asked for."""
+    for page in doc:
+        yield page.get_text()
 
 
-def read_pdf(council_name: str):
-    doc = fitz.open(f"files/{council_name}_latest.pdf")
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
+def save_debug_copy(
+    doc: fitz.Document, pages: Iterable[str], path_prefix: str
+) -> Iterator[str]:
+    """Pass `pages` through, writing the PDF and its text beside `path_prefix`.
 
+    Only for ``SAVE_FILES=1``: the pipeline itself never touches the disk.
+    """
+    os.makedirs(os.path.dirname(path_prefix) or ".", exist_ok=True)
+    doc.save(f"{path_prefix}.pdf")
+    with open(f"{path_prefix}.txt", "w", encoding="utf-8") as f:
+        for text in pages:
+            f.write(text)
+            yield text
 
-KeywordCounts = dict[str, int]
 
+def extract_keywords(
+    regexes: list[re.Pattern], text: Union[str, Iterable[str]]
+) -> tuple[KeywordCounts, int]:
+    """Keyword counts and word count for a document or its page texts.
 
-def extract_keywords(regexes: list[re.Pattern], text) -> tuple[KeywordCounts, int]:
-    cleaned = re.sub(r"\s+", " ", text)
-    cleaned = re.sub(r"\t", " ", cleaned)
-    cleaned = re.sub(r"[^\w\s]", "", cleaned)
-    cleaned = cleaned.lower()
-    keywords = {regex: len(re.findall(regex, cleaned)) for regex in regexes}
-    wordcount = len(cleaned.split(" "))
-    return keywords, wordcount
+    The pattern set is compiled once and the text normalised page by page;
+    see `aus_council_scrapers.keywords`.
+    """
+    return matcher_for(regexes).extract(text)
 
 
-def write_email(
+EMAIL_GREETING = "Hello,\n\n"
+EMAIL_SIGN_OFF = "\n\nThank you,\nYour friendly neighborhood agenda scraper"
+
+
+def write_email_section(
     council_name: str,
     scraper_result: ScraperReturn,
     parser_results: Optional[dict[str, int]] = None,
 ) -> str:
-    email_body = f"Hello,\n\nThe {council_name} meeting documents for {scraper_result.date} are now available.\n\n"
+    """One meeting's part of an email: its documents and keyword matches."""
+    section = f"The {council_name} meeting documents for {scraper_result.date} are now available.\n\n"
 
     # Add agenda link if available
     if scraper_result.agenda_url:
-        email_body += f"Agenda: {scraper_result.agenda_url}\n"
+        section += f"Agenda: {scraper_result.agenda_url}\n"
 
     # Add minutes link if available
     if scraper_result.minutes_url:
-        email_body += f"Minutes: {scraper_result.minutes_url}\n"
+        section += f"Minutes: {scraper_result.minutes_url}\n"
 
     # Fallback to download_url for backward compatibility
     if (
@@ -66,35 +188,32 @@ def write_email(
         and not scraper_result.minutes_url
         and scraper_result.download_url
     ):
-        email_body += f"Download: {scraper_result.download_url}\n"
+        section += f"Download: {scraper_result.download_url}\n"
 
-    email_body += "\n"
+    section += "\n"
 
     if parser_results and len(parser_results) > 0:
-        email_body += "Here are the matches found in the documents:\n"
-        email_body += "\nKeyword matches:\n"
+        section += "Here are the matches found in the documents:\n"
+        section += "\nKeyword matches:\n"
         for regex, count in parser_results.items():
-            email_body += f"- {regex}: {count} matches\n"
-
-    email_body += "\n\nThank you,\nYour friendly neighborhood agenda scraper"
-
-    return email_body
-
-
-def send_email(to, subject, body):
-    sender_email = config["GMAIL_ACCOUNT_SEND"]
-    password = config["GMAIL_PASSWORD"]
-    msg = MIMEMultipart()
-    msg["From"] = sender_email
-    msg["To"] = to
-    msg["Subject"] = subject
-    msg.attach(MIMEText(body, "plain"))
-    server = smtplib.SMTP("smtp.gmail.com", 587)
-    server.starttls()
-    server.login(sender_email, password)
-    text = msg.as_string()
-    server.sendmail(sender_email, to, text)
-    server.quit()
+            section += f"- {regex}: {count} matches\n"
+
+    return section
+
+
+def write_digest(sections: list[str]) -> str:
+    """An email body holding one or more `write_email_section`s."""
+    return EMAIL_GREETING + f"\n{'-' * 40}\n\n".join(sections) + EMAIL_SIGN_OFF
+
+
+def write_email(
+    council_name: str,
+    scraper_result: ScraperReturn,
+    parser_results: Optional[dict[str, int]] = None,
+) -> str:
+    return write_digest(
+        [write_email_section(council_name, scraper_result, parser_results)]
+    )
 
 
 def format_date_for_message(date: datetime.date):
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Benchmark every scraper by replaying its recorded cassette.
+
+The cassettes under tests/test-cases replay a scraper with no network at all,
+so its run time is our own work: parsing pages, and turning what they hold
+into meetings. Each scraper is replayed `--runs` times, keeping the best wall
+and CPU time, and once more under tracemalloc for its peak allocation. CPU
+time spent building soups is reported separately from the rest, which is
+extraction and normalisation.
+
+A run whose meetings differ from the cassette's is reported and not timed:
+a benchmark of a broken replay says nothing. Scrapers without a cassette, or
+listed in `tests/known_broken.REPLAY_BROKEN`, are skipped.
+
+Save a baseline before a parser or regex change and compare after it; the
+comparison fails (exit 1) when a council's CPU time or peak grows by more
+than `--threshold`.
+
+Usage:
+    python scripts/bench.py                            # every cassette
+    python scripts/bench.py -k burwood -k inner_west --runs 10
+    python scripts/bench.py --save bench-before.json
+    python scripts/bench.py --baseline bench-before.json --threshold 0.15
+    python scripts/bench.py --json > bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import importlib
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers import base, clock, soup  # noqa: E402
+from aus_council_scrapers.base import SCRAPER_REGISTRY, ScraperReturn  # noqa: E402
+from tests.cassette import PlaybackFetcher, cassette_paths, load_replay  # noqa: E402
+from tests.known_broken import REPLAY_BROKEN  # noqa: E402
+
+# Differences smaller than this are noise, whatever their ratio.
+MIN_DELTA_S = 0.002
+MIN_DELTA_KIB = 64
+
+
+class ParseTimer:
+    """Adds up the CPU time spent in `make_soup`, across threads."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.__lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def installed(self):
+        make_soup = base.make_soup
+
+        def timed(*args, **kwargs):
+            started = time.thread_time()
+            try:
+                return make_soup(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - started
+                with self.__lock:
+                    self.seconds += elapsed
+
+        base.make_soup = timed
+        try:
+            yield self
+        finally:
+            base.make_soup = make_soup
+
+
+def cassettes(patterns: list[str]) -> list[tuple[str, type]]:
+    """(slug, scraper class) for every replayable cassette `patterns` select."""
+    selected = []
+    for entry in SCRAPER_REGISTRY.manifest():
+        slug = entry["slug"]
+        if patterns and not any(p in slug for p in patterns):
+            continue
+        if slug in REPLAY_BROKEN or not all(map(os.path.exists, cassette_paths(slug))):
+            continue
+        importlib.import_module(entry["module"])
+        selected.append((slug, type(SCRAPER_REGISTRY[entry["class"]])))
+    return selected
+
+
+def replay(cls: type, replay_data: list, slug: str) -> list[ScraperReturn]:
+    scraper = cls()
+    scraper.fetcher = PlaybackFetcher(replay_data, slug)
+    with clock.frozen(scraper.fetcher.recorded_date):
+        return scraper.scraper()
+
+
+def bench(slug: str, cls: type, runs: int) -> dict:
+    result_path, replay_path = cassette_paths(slug)
+    replay_data = load_replay(replay_path)
+    with open(result_path) as f:
+        expected = json.load(f)
+    # Cassettes cut before scrapers returned lists hold a single object.
+    if isinstance(expected, dict):
+        expected = [expected]
+    expected = [ScraperReturn.from_dict(r) for r in expected]
+
+    # An untimed first replay checks the result, and warms the imports and
+    # caches a long run would have warm too.
+    meetings = replay(cls, replay_data, slug)
+    if meetings != expected:
+        return {"error": "meetings differ from the cassette"}
+
+    best, best_wall = None, float("inf")
+    for _ in range(runs):
+        timer = ParseTimer()
+        # Garbage from the last replay is not this one's cost.
+        gc.collect()
+        with timer.installed():
+            wall, cpu = time.perf_counter(), time.process_time()
+            replay(cls, replay_data, slug)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if best is None or cpu < best["cpu_s"]:
+            best = {
+                "meetings": len(meetings),
+                "cpu_s": cpu,
+                "parse_cpu_s": timer.seconds,
+                "normalise_cpu_s": max(cpu - timer.seconds, 0.0),
+            }
+        best_wall = min(best_wall, wall)
+    best["wall_s"] = best_wall
+
+    tracemalloc.start()
+    try:
+        replay(cls, replay_data, slug)
+        best["peak_kib"] = tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+    return best
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Councils whose CPU time or peak allocation regressed past `threshold`."""
+    regressions = []
+    for slug, now in results.items():
+        before = baseline.get("results", {}).get(slug)
+        if not before or "error" in now or "error" in before:
+            continue
+        for key, floor in (("cpu_s", MIN_DELTA_S), ("peak_kib", MIN_DELTA_KIB)):
+            grew = now[key] - before[key]
+            if grew > floor and now[key] > before[key] * (1 + threshold):
+                regressions.append(
+                    f"{slug}: {key} {before[key]:.4g} -> {now[key]:.4g}"
+                    f" (+{grew / before[key]:.0%})"
+                )
+    return regressions
+
+
+def print_table(results: dict, baseline: dict | None) -> None:
+    before = (baseline or {}).get("results", {})
+    print(
+        f"{'council':28} {'meetings':>8} {'wall ms':>8} {'cpu ms':>8}"
+        f" {'parse':>8} {'normalise':>9} {'peak KiB':>9} {'vs base':>8}"
+    )
+    for slug, r in results.items():
+        if "error" in r:
+            print(f"{slug:28} {r['error']}")
+            continue
+        change = ""
+        if slug in before and "error" not in before[slug]:
+            change = f"{r['cpu_s'] / before[slug]['cpu_s'] - 1:+.0%}"
+        print(
+            f"{slug:28} {r['meetings']:8} {r['wall_s'] * 1000:8.1f}"
+            f" {r['cpu_s'] * 1000:8.1f} {r['parse_cpu_s'] * 1000:8.1f}"
+            f" {r['normalise_cpu_s'] * 1000:9.1f} {r['peak_kib']:9} {change:>8}"
+        )
+    timed = [r for r in results.values() if "error" not in r]
+    total_cpu = sum(r["cpu_s"] for r in timed)
+    total_parse = sum(r["parse_cpu_s"] for r in timed)
+    if total_cpu:
+        print(
+            f"\n{len(timed)} councils, {total_cpu:.2f} s CPU,"
+            f" {total_parse / total_cpu:.0%} of it parsing"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        metavar="SLUG",
+        help="only councils whose slug contains SLUG (repeatable)",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="best of N replays")
+    parser.add_argument("--json", action="store_true", help="print JSON, not a table")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare to saved results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fractional growth that counts as a regression (default 0.2)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    selected = cassettes(args.patterns)
+    if not selected:
+        sys.exit("No replayable cassettes selected; run from the repository root.")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "html_parser": soup.default_backend(),
+            "runs": args.runs,
+        },
+        "results": {slug: bench(slug, cls, args.runs) for slug, cls in selected},
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(report["results"], baseline)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if baseline is None:
+        return 0
+    regressions = compare(report["results"], baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Measure how the PDF stage scales with `--cpu-workers`.
+
+A run hands each council's agenda to the PDF stage from its own scraper
+thread. This does the same: `--threads` threads each parse `--docs` PDFs
+(built from the council page text recorded in the test cassettes, `--pages`
+pages long) through a `CpuPool`, once per worker count. It reports the wall
+time, documents per second and the speed-up over parsing on the threads
+themselves (0 workers).
+
+Each pool parses a document per worker before it is timed, so process
+start-up is not counted; a real run pays it once. The keyword counts must
+match across worker counts.
+
+Usage:
+    python scripts/bench_cpu.py                          # 0, 1, 2, 4 ... cores
+    python scripts/bench_cpu.py --workers 0 4 8 --threads 6 --docs 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers.constants import COUNCIL_HOUSING_REGEX  # noqa: E402
+from aus_council_scrapers.cpu import CpuPool  # noqa: E402
+from aus_council_scrapers.utils import PdfDownload  # noqa: E402
+from scripts.bench_keywords import cassette_pages  # noqa: E402
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        # Page text is full of blank lines; a box that overflows stays empty.
+        text = " ".join(text.split())
+        page.insert_textbox(page.rect + (36, 36, -36, -36), text, fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def timed(workers: int, pdf: bytes, docs: int, threads: int) -> tuple[float, dict]:
+    pool = CpuPool(workers)
+    download = PdfDownload("https://bench.test/agenda.pdf", {}, "bench", data=pdf)
+
+    def parse(_):
+        return pool.pdf_keywords(download, COUNCIL_HOUSING_REGEX)
+
+    try:
+        # One document per worker at once, so every process is started.
+        with ThreadPoolExecutor(max(workers, 1)) as executor:
+            (_, counts, _), *_ = executor.map(parse, range(max(workers, 1)))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            results = list(executor.map(parse, range(docs)))
+        elapsed = time.perf_counter() - started
+    finally:
+        pool.shutdown()
+    if any(result[1] != counts for result in results):
+        sys.exit(f"Keyword counts differ with {workers} workers")
+    return elapsed, counts
+
+
+def main() -> int:
+    cores = os.cpu_count() or 1
+    default_workers = [0] + [n for n in (1, 2, 4, 8, 16) if n <= cores]
+    if cores not in default_workers:
+        default_workers.append(cores)
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--threads", type=int, default=6, help="scraper threads")
+    parser.add_argument("--docs", type=int, default=12, help="PDFs per run")
+    parser.add_argument("--pages", type=int, default=100, help="pages per PDF")
+    args = parser.parse_args()
+
+    pdf = make_pdf(cassette_pages(args.pages))
+    print(
+        f"{args.docs} PDFs of {args.pages} pages ({len(pdf) / 1e6:.1f} MB) from "
+        f"{args.threads} threads, {cores} cores\n"
+    )
+    print(f"{'cpu workers':>11} {'wall s':>8} {'docs/s':>8} {'speed-up':>9}")
+    baseline = None
+    for workers in args.workers:
+        elapsed, _ = timed(workers, pdf, args.docs, args.threads)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>11} {elapsed:8.2f} {args.docs / elapsed:8.2f}"
+            f" {baseline / elapsed:8.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
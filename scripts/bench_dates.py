@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark date and time normalisation against plain dateutil.
+
+Takes every meeting in the recorded scraper results under tests/test-cases
+and does what a run does with each: parse its date and time, check its
+year, and ask whether it is in the past. The old way calls dateutil's
+fuzzy parser and builds the state's timezone each time. The new way is
+`aus_council_scrapers.dates`.
+
+The new way starts each pass with empty caches, as a run does, so the
+timing counts the misses too. Every answer must match the old one.
+
+Usage:
+    python scripts/bench_dates.py
+    python scripts/bench_dates.py --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import sys
+import time
+
+import pytz
+from dateutil.parser import parse as parse_date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers import dates  # noqa: E402
+from aus_council_scrapers.constants import TIMEZONES_BY_STATE  # noqa: E402
+from tests.cassette import CASSETTE_DIR  # noqa: E402
+
+
+def recorded_meetings() -> list[tuple[str, str, str]]:
+    """(date, time, state) for every meeting in the recorded results."""
+    meetings = []
+    for path in sorted(glob.glob(os.path.join(CASSETTE_DIR, "*-result.json"))):
+        with open(path) as f:
+            data = json.load(f)
+        for meeting in data if isinstance(data, list) else [data]:
+            meetings.append(
+                (meeting.get("date"), meeting.get("time"), meeting.get("state", "VIC"))
+            )
+    if not meetings:
+        sys.exit("No recorded results found; run from the repository root.")
+    return meetings
+
+
+def old_way(meetings):
+    """The implementation this replaced, kept here as the reference."""
+    out = []
+    for date, time_, state in meetings:
+        try:
+            cleaned_date = parse_date(date, fuzzy=True).date()
+        except Exception:
+            cleaned_date = None
+        try:
+            cleaned_time = parse_date(time_, fuzzy=True).time() if time_ else None
+        except Exception:
+            cleaned_time = None
+        try:
+            year = parse_date(str(date), fuzzy=True).year
+        except Exception:
+            year = None
+        past = None
+        if cleaned_date is not None:
+            timezone = pytz.timezone(TIMEZONES_BY_STATE[state.upper()])
+            past = cleaned_date < datetime.datetime.now(timezone).date()
+        out.append((cleaned_date, cleaned_time, year, past))
+    return out
+
+
+def new_way(meetings):
+    dates.clear_caches()
+    out = []
+    for date, time_, state in meetings:
+        cleaned_date = dates.parse_date(date) if date else None
+        cleaned_time = dates.parse_time(time_) if time_ else None
+        year = dates.year_of(date)
+        past = None
+        if cleaned_date is not None:
+            past = cleaned_date < dates.today_in(state)
+        out.append((cleaned_date, cleaned_time, year, past))
+    return out
+
+
+def best_of(repeat: int, fn, meetings) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(meetings)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="best of N passes")
+    args = parser.parse_args()
+
+    meetings = recorded_meetings()
+    distinct = len({m[0] for m in meetings}) + len({m[1] for m in meetings})
+    print(f"{len(meetings)} meetings, {distinct} distinct date and time strings\n")
+
+    old_time, old = best_of(args.repeat, old_way, meetings)
+    new_time, new = best_of(args.repeat, new_way, meetings)
+    if old != new:
+        mismatches = [(m, a, b) for m, a, b in zip(meetings, old, new) if a != b]
+        sys.exit(f"{len(mismatches)} answers differ, e.g. {mismatches[:3]}")
+
+    print(f"{'':>10} {'total ms':>9} {'µs/meeting':>11}")
+    for label, elapsed in (("dateutil", old_time), ("dates", new_time)):
+        print(f"{label:>10} {elapsed * 1e3:9.1f} {elapsed / len(meetings) * 1e6:11.1f}")
+    print(f"\nspeed-up: {old_time / new_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
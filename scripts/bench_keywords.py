@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark keyword extraction against the old per-pattern implementation.
+
+Counts must match exactly; the point is how long a large agenda takes. Give
+it real agendas (local PDFs or URLs), or by default it builds a document
+from the council page text recorded in the test cassettes, repeated to the
+length of a long agenda.
+
+Usage:
+    python scripts/bench_keywords.py                       # cassette text
+    python scripts/bench_keywords.py agenda.pdf https://…/agenda.pdf
+    python scripts/bench_keywords.py --pages 500 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers.constants import COUNCIL_HOUSING_REGEX  # noqa: E402
+from aus_council_scrapers.keywords import KeywordMatcher  # noqa: E402
+from tests.cassette import CASSETTE_DIR, load_replay, resolve  # noqa: E402
+
+PAGE_CHARS = 3000  # about one page of agenda text
+
+
+def old_extract_keywords(regexes, text):
+    """The implementation this replaced, kept here as the reference."""
+    cleaned = re.sub(r"\s+", " ", text)
+    cleaned = re.sub(r"\t", " ", cleaned)
+    cleaned = re.sub(r"[^\w\s]", "", cleaned)
+    cleaned = cleaned.lower()
+    keywords = {regex: len(re.findall(regex, cleaned)) for regex in regexes}
+    wordcount = len(cleaned.split(" "))
+    return keywords, wordcount
+
+
+def pdf_pages(source: str) -> list[str]:
+    import fitz
+
+    from aus_council_scrapers.utils import open_pdf, page_texts
+
+    if source.startswith(("http://", "https://")):
+        with open_pdf(source) as doc:
+            return list(page_texts(doc))
+    with fitz.open(source) as doc:
+        return list(page_texts(doc))
+
+
+def cassette_pages(pages: int) -> list[str]:
+    from bs4 import BeautifulSoup
+
+    text = []
+    for path in sorted(glob.glob(os.path.join(CASSETTE_DIR, "*-replay*"))):
+        for _, value in load_replay(path):
+            value = resolve(value)
+            if isinstance(value, str) and "<" in value:
+                text.append(BeautifulSoup(value, "html.parser").get_text())
+    corpus = "\n".join(text)
+    if not corpus:
+        sys.exit("No cassette text found; run from the repository root.")
+    while len(corpus) < pages * PAGE_CHARS:
+        corpus += corpus
+    return [corpus[i * PAGE_CHARS : (i + 1) * PAGE_CHARS] for i in range(pages)]
+
+
+def best_of(repeat: int, fn) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", help="agenda PDFs (paths or URLs)")
+    parser.add_argument("--pages", type=int, default=500, help="synthetic pages")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    documents = (
+        [(source, pdf_pages(source)) for source in args.pdfs]
+        if args.pdfs
+        else [(f"cassette text, {args.pages} pages", cassette_pages(args.pages))]
+    )
+
+    matcher = KeywordMatcher(COUNCIL_HOUSING_REGEX)
+    for name, pages in documents:
+        size = sum(len(p) for p in pages)
+        old_time, expected = best_of(
+            args.repeat,
+            lambda: old_extract_keywords(COUNCIL_HOUSING_REGEX, "".join(pages)),
+        )
+        new_time, got = best_of(args.repeat, lambda: matcher.extract(pages))
+        if got != expected:
+            print(f"{name}: MISMATCH\n  old: {expected}\n  new: {got}")
+            return 1
+        print(
+            f"{name}: {len(pages)} pages, {size / 1e6:.1f} MB — "
+            f"old {old_time * 1000:.0f} ms, new {new_time * 1000:.0f} ms "
+            f"({old_time / new_time:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
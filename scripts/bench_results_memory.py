@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Measure what holding every recorded meeting costs, before and after the
+slotted, interned `ScraperReturn`.
+
+Loads every -result.json under tests/test-cases, as `--copies` separate
+runs' worth. Builds a result for each meeting, then drops the parsed JSON
+and reports the bytes still held, so the strings that only the results keep
+are counted too. It also times comparing two full copies of the results,
+as the scraper tests do, and checks that both classes give the same
+`to_dict()` output.
+
+Usage:
+    python scripts/bench_results_memory.py
+    python scripts/bench_results_memory.py --copies 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers.base import ScraperReturn  # noqa: E402
+from tests.cassette import CASSETTE_DIR  # noqa: E402
+
+
+@dataclass
+class OldScraperReturn:
+    """The representation this replaced, kept here as the reference."""
+
+    name: Optional[str]
+    date: str
+    time: Optional[str]
+    webpage_url: str
+    download_url: str = None
+    agenda_url: Optional[str] = None
+    minutes_url: Optional[str] = None
+    agenda_html_url: Optional[str] = None
+    minutes_html_url: Optional[str] = None
+    location: Optional[str] = None
+    _cleaned_time: Optional[object] = None
+    _cleaned_date: Optional[object] = None
+
+    def __eq__(self, other):
+        if not isinstance(other, OldScraperReturn):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    to_dict = ScraperReturn.to_dict
+
+    @staticmethod
+    def from_dict(d):
+        return OldScraperReturn(
+            name=d["name"],
+            date=d["date"],
+            time=d["time"],
+            webpage_url=d["webpage_url"],
+            download_url=d.get("download_url"),
+            agenda_url=d.get("agenda_url"),
+            minutes_url=d.get("minutes_url"),
+            agenda_html_url=d.get("agenda_html_url"),
+            minutes_html_url=d.get("minutes_html_url"),
+            location=d.get("location"),
+        )
+
+
+def result_files() -> list[str]:
+    paths = sorted(glob.glob(os.path.join(CASSETTE_DIR, "*-result.json")))
+    if not paths:
+        sys.exit("No recorded results found; run from the repository root.")
+    return paths
+
+
+def load(cls, paths: list[str], copies: int) -> tuple[list, int]:
+    """Results for every recorded meeting, and the bytes they hold."""
+    gc.collect()
+    tracemalloc.start()
+    results = []
+    for _ in range(copies):
+        for path in paths:
+            with open(path) as f:
+                data = json.load(f)
+            results.extend(
+                cls.from_dict(d) for d in (data if isinstance(data, list) else [data])
+            )
+            del data
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, held
+
+
+def compare_time(a: list, b: list, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        assert a == b
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--copies", type=int, default=5, help="runs' worth of results to hold"
+    )
+    args = parser.parse_args()
+    paths = result_files()
+
+    rows = []
+    outputs = []
+    for label, cls in (("dataclass", OldScraperReturn), ("slotted", ScraperReturn)):
+        results, held = load(cls, paths, args.copies)
+        again, _ = load(cls, paths, 1)
+        elapsed = compare_time(results[: len(again)], again)
+        outputs.append([r.to_dict() for r in results])
+        rows.append((label, len(results), held, elapsed))
+        del results, again
+
+    if outputs[0] != outputs[1]:
+        sys.exit("to_dict() output differs between the two classes")
+
+    print(f"{'':>10} {'results':>8} {'held MiB':>9} {'B/result':>9} {'eq ms':>7}")
+    for label, count, held, elapsed in rows:
+        print(
+            f"{label:>10} {count:8d} {held / 2**20:9.2f} {held / count:9.0f}"
+            f" {elapsed * 1e3:7.2f}"
+        )
+    before, after = rows
+    print(
+        f"\nmemory: {before[2] / after[2]:.1f}x smaller,"
+        f" equality: {before[3] / after[3]:.1f}x faster"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Regenerate aus_council_scrapers/scrapers/manifest.json.
+
+The manifest lets `--council` and `--state` pick scrapers without importing
+every scraper module. Run this after adding, removing or renaming a scraper;
+tests/test_registry.py fails while the committed manifest is stale.
+
+Usage:
+    python scripts/generate_manifest.py          # rewrite the manifest
+    python scripts/generate_manifest.py --check  # exit 1 if it is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers.base import MANIFEST_PATH, SCRAPER_REGISTRY  # noqa: E402
+
+
+def build_manifest() -> list[dict]:
+    """One entry per registered scraper, ordered by module path.
+
+    Sorting makes the file independent of import order, so regenerating it
+    only ever changes the lines for scrapers that changed.
+    """
+    SCRAPER_REGISTRY.load_all()
+    entries = [
+        {
+            "slug": scraper.council_name,
+            "state": scraper.state,
+            "module": type(scraper).__module__,
+            "class": name,
+            "host": scraper.host,
+        }
+        for name, scraper in SCRAPER_REGISTRY.items()
+    ]
+    return sorted(entries, key=lambda e: (e["module"], e["class"]))
+
+
+def render(manifest: list[dict]) -> str:
+    return json.dumps(manifest, indent=2) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only check")
+    args = parser.parse_args()
+
+    text = render(build_manifest())
+    if args.check:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            if f.read() != text:
+                print(f"{MANIFEST_PATH} is stale; run scripts/generate_manifest.py")
+                return 1
+        return 0
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"Wrote {os.path.relpath(MANIFEST_PATH)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,17 @@
 Migration script to update the database schema to support both agendas and minutes.
 
 This script adds the new columns (agenda_url, minutes_url, minutes_wordcount)
-to existing database tables.
+to existing database tables, indexes the URL columns the skip-checks filter
+on, and switches the file to WAL mode.
 """
+import os
 import sqlite3
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aus_council_scrapers.database import INDEXES, create_indexes  # noqa: E402
+
 
 def migrate_database(db_path: str = "./agendas.db"):
     """Add new columns to support agenda and minutes URLs."""
@@ -57,7 +63,13 @@ def migrate_database(db_path: str = "./agendas.db"):
         rows_updated = c.rowcount
         print(f"✓ Migrated {rows_updated} rows")
 
+        print("\nIndexing URL columns...")
+        create_indexes(conn)
+        print(f"✓ Indexed {', '.join(INDEXES.values())}")
+
         conn.commit()
+        c.execute("PRAGMA journal_mode=WAL")
+        print(f"✓ Journal mode: {c.fetchone()[0]}")
         conn.close()
 
         print("\n✓ Migration completed successfully!")
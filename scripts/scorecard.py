@@ -16,40 +16,129 @@ Two kinds of finding, deliberately kept apart:
               means unfinished, not broken, and it is what progress is
               measured against.
 
+Assessments are cached in .cache/scorecard.json (moved with
+SCORECARD_CACHE_PATH), keyed by a hash of each fixture's content. Only
+fixtures that changed are assessed again, in parallel worker processes, so
+the pre-commit hook pays almost nothing when no fixture changed. The whole
+cache is dropped when the rules change (the source of the conformance and
+date modules) or the year turns over, since coverage is judged against the
+current year.
+
 Usage:
     python scripts/scorecard.py            # table + rollup
     python scripts/scorecard.py --json     # machine-readable
     python scripts/scorecard.py --gaps     # only what is not yet complete
+    python scripts/scorecard.py --no-cache # assess every fixture afresh
 """
 
 from __future__ import annotations
 
 import argparse
 import glob
+import hashlib
 import json
 import os
 import re
 import sys
+import tempfile
 from collections import Counter
+from typing import Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from aus_council_scrapers.conformance import assess  # noqa: E402
+from aus_council_scrapers import clock, conformance, dates  # noqa: E402
+from aus_council_scrapers.conformance import Assessment, assess  # noqa: E402
 
 CASSETTE_GLOB = "tests/test-cases/*-result.json"
 COUNCILS_DOC = "docs/councils.md"
+CACHE_PATH = ".cache/scorecard.json"
+
+
+def rules_version() -> str:
+    """Changes whenever a stored assessment could be wrong for the same
+    fixture: the rules' source, or the year they judge against."""
+    digest = hashlib.sha1(str(clock.current_year()).encode())
+    for module in (conformance, dates):
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def assess_file(path: str) -> Assessment:
+    slug = os.path.basename(path).replace("-result.json", "")
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [data]
+    return assess(slug, data)
 
 
-def load_recorded() -> list[dict]:
-    rows = []
-    for path in sorted(glob.glob(CASSETTE_GLOB)):
-        slug = os.path.basename(path).replace("-result.json", "")
+def _read_cache(path: str, version: str) -> dict:
+    try:
         with open(path) as f:
-            data = json.load(f)
-        if isinstance(data, dict):
-            data = [data]
-        rows.append(assess(slug, data))
-    return rows
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("rules") != version:
+        return {}
+    return cache.get("fixtures", {})
+
+
+def _write_cache(path: str, version: str, fixtures: dict) -> None:
+    # A cache that cannot be written only costs the next run its speed.
+    try:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"rules": version, "fixtures": fixtures}, f)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"scorecard: could not write {path}: {e}", file=sys.stderr)
+
+
+def load_recorded(
+    cache_path: Optional[str] = CACHE_PATH, workers: Optional[int] = None
+) -> list[Assessment]:
+    """Every fixture's assessment, reusing the cached ones that still hold.
+
+    Changed fixtures are assessed in up to `workers` processes (default: one
+    per core; 0 assesses them here). No `cache_path` assesses everything.
+    """
+    paths = sorted(glob.glob(CASSETTE_GLOB))
+    version = rules_version()
+    cached = _read_cache(cache_path, version) if cache_path else {}
+
+    fixtures, rows, stale = {}, {}, []
+    for path in paths:
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        name = os.path.basename(path)
+        hit = cached.get(name)
+        if hit is not None and hit.get("sha1") == digest:
+            rows[path] = Assessment(**hit["assessment"])
+        else:
+            stale.append(path)
+        fixtures[name] = {"sha1": digest}
+
+    if stale:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(stale) > 1:
+            # Imported here: a run with nothing to assess should not pay for it.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(min(workers, len(stale))) as executor:
+                rows.update(zip(stale, executor.map(assess_file, stale)))
+        else:
+            rows.update((path, assess_file(path)) for path in stale)
+
+    if cache_path and (stale or set(cached) != set(fixtures)):
+        for path in paths:
+            fixtures[os.path.basename(path)]["assessment"] = vars(rows[path])
+        _write_cache(cache_path, version, fixtures)
+    return [rows[path] for path in paths]
 
 
 def tracked_slugs() -> set[str]:
@@ -133,9 +222,20 @@ def main() -> int:
         action="store_true",
         help="markdown for docs/status.md (regenerated on main)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="assess every fixture afresh, ignoring and not writing the cache",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="processes for changed fixtures (default: one per core)",
+    )
     args = parser.parse_args()
 
-    rows = load_recorded()
+    cache_path = os.environ.get("SCORECARD_CACHE_PATH", CACHE_PATH)
+    rows = load_recorded(None if args.no_cache else cache_path, args.workers)
     tracked = tracked_slugs()
     recorded = {r.slug for r in rows}
     unstarted = sorted(tracked - recorded)
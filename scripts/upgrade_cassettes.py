@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Convert v1 replay files (one JSON list) to v2 cassettes.
+
+Each ``tests/test-cases/<slug>-replay_data.json`` becomes
+``<slug>-replay.cassette``: a zip with an index of keys and a deflated member
+per distinct body, which playback inflates only when a scraper asks for it.
+A file is removed only after its cassette has been read back and found
+identical. Result files are left alone; they are small and reviewed as text.
+
+Run it on a branch that predates the upgrade, or after merging one that
+still carries v1 fixtures. Re-recording a council writes v2 anyway.
+
+Usage:
+    python scripts/upgrade_cassettes.py              # every v1 file
+    python scripts/upgrade_cassettes.py burwood camden
+"""
+
+import glob
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tests.cassette import (  # noqa: E402
+    CASSETTE_DIR,
+    LEGACY_REPLAY_SUFFIX,
+    upgrade_cassette,
+)
+
+
+def main() -> int:
+    slugs = sys.argv[1:]
+    if slugs:
+        paths = [
+            os.path.join(CASSETTE_DIR, f"{s}{LEGACY_REPLAY_SUFFIX}") for s in slugs
+        ]
+    else:
+        paths = sorted(
+            glob.glob(os.path.join(CASSETTE_DIR, f"*{LEGACY_REPLAY_SUFFIX}"))
+        )
+    if not paths:
+        print("No v1 replay files to upgrade.")
+        return 0
+
+    before = after = 0
+    failed = []
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"✗ {path}: no such file")
+            failed.append(path)
+            continue
+        size = os.path.getsize(path)
+        try:
+            upgraded = upgrade_cassette(path)
+        except ValueError as e:
+            print(f"✗ {e}")
+            failed.append(path)
+            continue
+        before += size
+        after += os.path.getsize(upgraded)
+        print(
+            f"✓ {upgraded}: {size // 1024} KiB -> {os.path.getsize(upgraded) // 1024} KiB"
+        )
+
+    if before:
+        print(
+            f"\n{len(paths) - len(failed)} upgraded, "
+            f"{before / 2**20:.1f} MiB -> {after / 2**20:.1f} MiB"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,18 @@ Keys are small JSON arrays whose first element names the channel:
     ["selenium", url]                          # fetch_with_selenium
     ["driver", n, op, args]                    # nth direct WebDriver call
 
+On disk a cassette is a zip file, ``<slug>-replay.cassette``. Its
+``index.json`` lists the keys in call order, each with either an inline value
+(the recording date, a recorded failure) or the name of a deflated body
+stored under ``bodies/``. Bodies are named by their SHA-1, so a page fetched
+twice is stored once. `load_replay` returns a body as a `Blob` and inflates
+it only when playback asks for it. Most replays use a small fraction of their
+cassette, so startup reads the index and nothing else.
+
+The first format was a single JSON list, ``<slug>-replay_data.json``, and
+is still read. Convert those files with ``scripts/upgrade_cassettes.py``.
+Re-recording a council also replaces its file.
+
 Playback is **strict**: any call that was not recorded raises `CassetteMiss`
 rather than returning a plausible-looking empty page. A scraper that starts
 requesting a URL it did not request when the cassette was cut has changed
@@ -17,8 +29,12 @@ meetings.
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
+import tempfile
+import zipfile
 from typing import Any
 
 import requests
@@ -84,6 +100,27 @@ def is_failure(value: Any) -> bool:
     return isinstance(value, dict) and FAILURE_MARKER in value
 
 
+class Blob:
+    """A recorded body, still compressed inside its cassette."""
+
+    __slots__ = ("_archive", "name")
+
+    def __init__(self, archive: zipfile.ZipFile, name: str):
+        self._archive = archive
+        self.name = name
+
+    def read(self) -> str:
+        return self._archive.read(self.name).decode("utf-8")
+
+    def __repr__(self):
+        return f"Blob({self.name!r})"
+
+
+def resolve(value: Any) -> Any:
+    """The recorded value itself, inflating it first if it is a `Blob`."""
+    return value.read() if isinstance(value, Blob) else value
+
+
 def requests_key(url: str, method: str, kwargs: dict[str, Any] | None) -> list:
     # Omit the kwargs slot entirely when there are none, so keys stay
     # identical to those in cassettes recorded before kwargs were supported.
@@ -140,6 +177,10 @@ class RecordingDriver:
 
 
 class RecordingFetcher(Fetcher):
+    # The delegate may run requests concurrently, but a cassette is a list in
+    # call order: record one request at a time so re-recording is repeatable.
+    concurrency = 1
+
     def __init__(self, delegated_fetcher: Fetcher):
         # Stamp the recording date first, so replay can pin the clock to it
         # and the cassette does not expire on a calendar boundary.
@@ -212,7 +253,7 @@ class PlaybackDriver:
                 self._slug,
             )
         self._n += 1
-        return value
+        return resolve(value)
 
     @property
     def page_source(self) -> str:
@@ -233,7 +274,7 @@ class PlaybackDriver:
 class PlaybackFetcher(Fetcher):
     def __init__(self, replay_data: list, slug: str | None = None):
         self._slug = slug
-        self._responses: dict[tuple, str] = {}
+        self._responses: dict[tuple, Any] = {}
         self.recorded_date: str | None = None
         driver_ops: list[tuple[int, str, str, Any]] = []
 
@@ -242,7 +283,7 @@ class PlaybackFetcher(Fetcher):
                 continue
             if key[0] == "meta":
                 if key[1] == "recorded_date":
-                    self.recorded_date = value
+                    self.recorded_date = resolve(value)
             elif key[0] == "driver":
                 _, index, op, args = key
                 driver_ops.append((index, op, args, value))
@@ -262,6 +303,8 @@ class PlaybackFetcher(Fetcher):
     def _lookup(self, key: tuple, description: str) -> str:
         if key in self._responses:
             value = self._responses[key]
+            if isinstance(value, Blob):
+                value = self._responses[key] = value.read()
             if is_failure(value):
                 # This fetch failed when the cassette was cut; reproduce that
                 # rather than handing back a success.
@@ -278,6 +321,11 @@ class PlaybackFetcher(Fetcher):
         key = tuple(requests_key(url, method, kwargs))
         return self._lookup(key, f"{method} {url}")
 
+    async def afetch_with_requests(self, url, method="GET", **kwargs):
+        # A lookup never blocks, so skip the worker thread the base class
+        # would hand it to.
+        return self.fetch_with_requests(url, method, **kwargs)
+
     def fetch_with_selenium(self, url, wait_time=10, wait_condition=None):
         return self._lookup(("selenium", url), f"selenium GET {url}")
 
@@ -287,14 +335,112 @@ class PlaybackFetcher(Fetcher):
 # --------------------------------------------------------------------------
 
 CASSETTE_DIR = os.path.join("tests", "test-cases")
+CASSETTE_FORMAT = 2
+REPLAY_SUFFIX = "-replay.cassette"
+LEGACY_REPLAY_SUFFIX = "-replay_data.json"
+
+_INDEX = "index.json"
+# A fixed timestamp, so recording the same responses twice writes the same
+# bytes and git sees no change.
+_EPOCH = (1980, 1, 1, 0, 0, 0)
 
 
 def cassette_paths(slug: str) -> tuple[str, str]:
-    """Return (result_path, replay_data_path) for a council slug."""
-    return (
-        os.path.join(CASSETTE_DIR, f"{slug}-result.json"),
-        os.path.join(CASSETTE_DIR, f"{slug}-replay_data.json"),
-    )
+    """Return (result_path, replay_data_path) for a council slug.
+
+    The replay path is the v1 JSON file only when a council has nothing
+    newer, as on a branch cut before the upgrade.
+    """
+    replay_path = os.path.join(CASSETTE_DIR, f"{slug}{REPLAY_SUFFIX}")
+    legacy_path = os.path.join(CASSETTE_DIR, f"{slug}{LEGACY_REPLAY_SUFFIX}")
+    if not os.path.exists(replay_path) and os.path.exists(legacy_path):
+        replay_path = legacy_path
+    return os.path.join(CASSETTE_DIR, f"{slug}-result.json"), replay_path
+
+
+def load_replay(path: str) -> list:
+    """The ``[key, value]`` entries of a replay file, in either format.
+
+    From a v2 cassette every body is a `Blob`; pass the entries straight to
+    `PlaybackFetcher`, or `resolve` a value to read it.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(b"PK"):
+        return json.loads(data)
+
+    # The whole (compressed) file is held in memory, so no handle is left
+    # open for the life of the fetcher, and threads can inflate at once.
+    archive = zipfile.ZipFile(io.BytesIO(data))
+    index = json.loads(archive.read(_INDEX))
+    if index.get("format") != CASSETTE_FORMAT:
+        raise ValueError(
+            f"{path} is cassette format {index.get('format')!r}; this harness "
+            f"reads format {CASSETTE_FORMAT}."
+        )
+    return [
+        [key, Blob(archive, ref["body"]) if "body" in ref else ref["value"]]
+        for key, ref in index["entries"]
+    ]
+
+
+def save_replay(path: str, replay_data: list) -> None:
+    """Write entries as a v2 cassette, atomically."""
+    entries, bodies = [], {}
+    for key, value in replay_data:
+        value = resolve(value)
+        if isinstance(value, str) and key[0] != "meta":
+            body = value.encode("utf-8")
+            name = f"bodies/{hashlib.sha1(body).hexdigest()}"
+            bodies[name] = body
+            entries.append([key, {"body": name}])
+        else:
+            entries.append([key, {"value": value}])
+    index = json.dumps({"format": CASSETTE_FORMAT, "entries": entries}, indent=1)
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w") as archive:
+            for name, data in [
+                (_INDEX, index.encode("utf-8")),
+                *sorted(bodies.items()),
+            ]:
+                info = zipfile.ZipInfo(name, date_time=_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, data, compresslevel=9)
+        # mkstemp creates the file private to its owner.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_cassette(slug: str, replay_data: list) -> str:
+    """Save a recording as the slug's v2 cassette, removing any v1 file."""
+    replay_path = os.path.join(CASSETTE_DIR, f"{slug}{REPLAY_SUFFIX}")
+    save_replay(replay_path, replay_data)
+    legacy_path = os.path.join(CASSETTE_DIR, f"{slug}{LEGACY_REPLAY_SUFFIX}")
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+    return replay_path
+
+
+def upgrade_cassette(legacy_path: str) -> str:
+    """Convert a v1 replay file to v2, check it reads back the same, and
+    remove the v1 file. Returns the new path."""
+    if not legacy_path.endswith(LEGACY_REPLAY_SUFFIX):
+        raise ValueError(f"{legacy_path} is not a v1 replay file")
+    replay_path = legacy_path[: -len(LEGACY_REPLAY_SUFFIX)] + REPLAY_SUFFIX
+    replay_data = load_replay(legacy_path)
+    save_replay(replay_path, replay_data)
+    upgraded = [[key, resolve(value)] for key, value in load_replay(replay_path)]
+    if upgraded != replay_data:
+        os.remove(replay_path)
+        raise ValueError(f"{legacy_path} did not survive the upgrade intact")
+    os.remove(legacy_path)
+    return replay_path
 
 
 def should_record(slug: str) -> bool:
@@ -14,7 +14,9 @@ from tests.cassette import (
     PlaybackFetcher,
     RecordingFetcher,
     cassette_paths,
+    load_replay,
     should_record,
+    write_cassette,
 )
 from tests.known_broken import REPLAY_BROKEN
 
@@ -54,10 +56,7 @@ def _assert_matches(
 
 def _replay(scraper: BaseScraper, slug: str, result_path: str, replay_path: str):
     expected = _load_expected(result_path)
-    with open(replay_path, "r") as f:
-        replay_data = json.load(f)
-
-    fetcher = PlaybackFetcher(replay_data, slug)
+    fetcher = PlaybackFetcher(load_replay(replay_path), slug)
     scraper.fetcher = fetcher
 
     if fetcher.recorded_date:
@@ -82,8 +81,7 @@ def _record(scraper: BaseScraper, slug: str, result_path: str, replay_path: str)
     finally:
         recorder.close()
 
-    with open(replay_path, "w") as f:
-        json.dump(recorder.replay_data, f)
+    write_cassette(slug, recorder.replay_data)
     with open(result_path, "w") as f:
         json.dump([r.to_dict() for r in result], f, indent=2)
 
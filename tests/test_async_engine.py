@@ -0,0 +1,190 @@
+"""Tests for the asyncio fetch engine.
+
+The async path has to honour the same contract as `DefaultFetcher` — spacing
+per host, backoff on transient failures, stopping dead on a WAF block — and a
+ported scraper has to produce exactly what its synchronous self does, or the
+recorded cassettes stop meaning anything for the async engine.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aus_council_scrapers import clock, main
+from aus_council_scrapers.async_fetch import AsyncFetcher
+from aus_council_scrapers.base import BaseScraper, BlockedByWAF, ScraperReturn
+from aus_council_scrapers.http_cache import HttpCache
+from aus_council_scrapers.main import run_scraper, run_scraper_async, run_scrapers_async
+from aus_council_scrapers.scrapers.nsw.burwood import BurwoodNSWScraper
+from aus_council_scrapers.scrapers.nsw.innerwest import InnerWestScraper
+from tests.cassette import PlaybackFetcher, cassette_paths, load_replay
+
+
+async def _serve(handlers: dict):
+    app = web.Application()
+    for path, handler in handlers.items():
+        app.router.add_get(path, handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+def test_ported_scraper_matches_its_synchronous_self():
+    result_path, replay_path = cassette_paths("inner_west")
+    replay_data = load_replay(replay_path)
+    with open(result_path) as f:
+        expected = [ScraperReturn.from_dict(r) for r in json.load(f)]
+
+    scraper = InnerWestScraper()
+    scraper.fetcher = PlaybackFetcher(replay_data, "inner_west")
+    with clock.frozen(scraper.fetcher.recorded_date):
+        result = asyncio.run(scraper.ascraper())
+
+    assert result == expected
+
+
+def test_both_engines_report_the_same_legacy_meeting(monkeypatch):
+    _, replay_path = cassette_paths("burwood")
+    replay_data = load_replay(replay_path)
+    reported = []
+    monkeypatch.setattr(
+        main, "handle_results", lambda scraper, results, *args: reported.append(results)
+    )
+
+    def burwood():
+        scraper = BurwoodNSWScraper()
+        scraper.fetcher = PlaybackFetcher(replay_data, "burwood")
+        return scraper
+
+    with clock.frozen(burwood().fetcher.recorded_date):
+        run_scraper(burwood(), skip_pdf=True)
+        asyncio.run(run_scraper_async(burwood(), skip_pdf=True))
+
+    threaded, in_async = reported
+    assert len(threaded) == 1
+    assert in_async == threaded
+
+
+async def _ok(request):
+    return web.Response(text="ok")
+
+
+def test_requests_to_one_host_are_spaced():
+    async def run():
+        server = await _serve({"/": _ok})
+        fetcher = AsyncFetcher(fetch_delay=0.2)
+        try:
+            started = time.monotonic()
+            await asyncio.gather(
+                *(
+                    fetcher.afetch_with_requests(str(server.make_url("/")))
+                    for _ in range(3)
+                )
+            )
+            return time.monotonic() - started
+        finally:
+            await fetcher.aclose()
+            await server.close()
+
+    # Three requests need two gaps of at least 0.75 × the delay.
+    assert asyncio.run(run()) >= 2 * 0.75 * 0.2
+
+
+def test_transient_failures_are_retried():
+    hits = []
+
+    async def flaky(request):
+        hits.append(request.path)
+        if len(hits) < 3:
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        return web.Response(text="recovered")
+
+    async def run():
+        server = await _serve({"/": flaky})
+        fetcher = AsyncFetcher(fetch_delay=0)
+        try:
+            return await fetcher.afetch_with_requests(str(server.make_url("/")))
+        finally:
+            await fetcher.aclose()
+            await server.close()
+
+    assert asyncio.run(run()) == "recovered"
+    assert len(hits) == 3
+
+
+def test_waf_block_is_not_retried():
+    hits = []
+
+    async def blocked(request):
+        hits.append(request.path)
+        return web.Response(status=403)
+
+    async def run():
+        server = await _serve({"/": blocked})
+        fetcher = AsyncFetcher(fetch_delay=0)
+        try:
+            await fetcher.afetch_with_requests(str(server.make_url("/")))
+        finally:
+            await fetcher.aclose()
+            await server.close()
+
+    with pytest.raises(BlockedByWAF):
+        asyncio.run(run())
+    assert len(hits) == 1
+
+
+def test_unchanged_pages_are_revalidated_through_the_http_cache(tmp_path):
+    seen = []
+
+    async def agenda(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text="Meeting agenda ✓", headers={"ETag": '"v1"'})
+
+    async def run():
+        server = await _serve({"/": agenda})
+        fetcher = AsyncFetcher(fetch_delay=0, cache=cache)
+        try:
+            url = str(server.make_url("/"))
+            return [await fetcher.afetch_with_requests(url) for _ in range(2)]
+        finally:
+            await fetcher.aclose()
+            await server.close()
+
+    cache = HttpCache(str(tmp_path / "http"))
+    assert asyncio.run(run()) == ["Meeting agenda ✓"] * 2
+    assert seen == [None, '"v1"']
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+class _Unported(BaseScraper):
+    def __init__(self):
+        super().__init__("unported", "VIC", "https://unported.example")
+
+    def scraper(self):
+        return [
+            ScraperReturn(
+                name="Council Meeting",
+                date="2024-05-01",
+                time=None,
+                webpage_url="https://unported.example/meetings",
+                agenda_url="https://unported.example/agenda.pdf",
+            )
+        ]
+
+
+def test_unported_scrapers_run_on_the_sync_path():
+    scraper = _Unported()
+    assert not scraper.supports_async
+    assert InnerWestScraper().supports_async
+
+    results = asyncio.run(run_scrapers_async([scraper], workers=1, adapter_mode=True))
+
+    assert [r["council"] for r in results] == ["unported"]
+    assert results[0]["ok"]
+    assert len(results[0]["meetings"]) == 1
@@ -0,0 +1,42 @@
+"""Tests for the replay benchmark in `scripts/bench.py`."""
+
+import pytest
+
+from scripts.bench import MIN_DELTA_S, bench, cassettes, compare
+
+
+def test_a_replay_is_timed_and_split_into_parse_and_the_rest():
+    (slug, cls), *_ = cassettes(["burwood"])
+    result = bench(slug, cls, runs=1)
+
+    assert result["meetings"] > 0
+    assert result["parse_cpu_s"] > 0 and result["normalise_cpu_s"] > 0
+    assert result["parse_cpu_s"] + result["normalise_cpu_s"] == pytest.approx(
+        result["cpu_s"], abs=0.01
+    )
+    assert result["peak_kib"] > 0
+
+
+def _result(cpu_s, peak_kib=1000):
+    return {"cpu_s": cpu_s, "peak_kib": peak_kib}
+
+
+def test_only_growth_past_the_threshold_and_the_noise_floor_regresses():
+    baseline = {
+        "results": {
+            "slow": _result(1.0),
+            "tiny": _result(MIN_DELTA_S / 2),
+            "fat": _result(1.0, peak_kib=1000),
+            "gone": _result(1.0),
+        }
+    }
+    results = {
+        "slow": _result(1.3),
+        "tiny": _result(MIN_DELTA_S),
+        "fat": _result(1.0, peak_kib=1500),
+        "new": _result(9.0),
+    }
+
+    regressions = compare(results, baseline, threshold=0.2)
+    assert [line.split(":")[0] for line in regressions] == ["slow", "fat"]
+    assert compare(results, baseline, threshold=0.6) == []
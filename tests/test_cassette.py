@@ -236,3 +236,62 @@ def test_a_403_is_raised_as_a_deferral_pointing_at_the_tracking_issue():
     import requests
 
     assert isinstance(error, requests.HTTPError)
+
+
+def _entries():
+    return [
+        [["meta", "recorded_date"], "2026-08-19"],
+        [["requests", "https://x.test/a", "GET"], "<html>same</html>"],
+        [["requests", "https://x.test/b", "GET"], "<html>same</html>"],
+        [["requests", "https://x.test/c", "GET"], {"__failed__": "HTTPError"}],
+        [["driver", 0, "get", "https://x.test/"], None],
+    ]
+
+
+def test_a_v2_cassette_reads_back_every_entry_in_order(tmp_path):
+    from tests.cassette import load_replay, resolve, save_replay
+
+    path = str(tmp_path / "x-replay.cassette")
+    save_replay(path, _entries())
+    assert [[k, resolve(v)] for k, v in load_replay(path)] == _entries()
+
+
+def test_identical_bodies_are_stored_once_and_inflated_only_on_request(tmp_path):
+    import zipfile
+
+    from tests.cassette import Blob, load_replay, save_replay
+
+    path = str(tmp_path / "x-replay.cassette")
+    save_replay(path, _entries())
+    with zipfile.ZipFile(path) as archive:
+        assert len(archive.namelist()) == 2  # the index and one body
+
+    entries = load_replay(path)
+    assert isinstance(entries[1][1], Blob)
+    fetcher = PlaybackFetcher(entries)
+    assert fetcher.recorded_date == "2026-08-19"
+    assert fetcher.fetch_with_requests("https://x.test/b") == "<html>same</html>"
+
+
+def test_saving_the_same_recording_twice_writes_the_same_bytes(tmp_path):
+    from tests.cassette import save_replay
+
+    first, second = tmp_path / "1.cassette", tmp_path / "2.cassette"
+    save_replay(str(first), _entries())
+    save_replay(str(second), _entries())
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_v1_files_are_still_read_and_upgrade_in_place(tmp_path):
+    import json
+
+    from tests.cassette import load_replay, resolve, upgrade_cassette
+
+    legacy = tmp_path / "x-replay_data.json"
+    legacy.write_text(json.dumps(_entries()))
+    assert load_replay(str(legacy)) == _entries()
+
+    upgraded = upgrade_cassette(str(legacy))
+    assert upgraded == str(tmp_path / "x-replay.cassette")
+    assert not legacy.exists()
+    assert [[k, resolve(v)] for k, v in load_replay(upgraded)] == _entries()
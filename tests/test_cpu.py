@@ -0,0 +1,82 @@
+"""Tests for the process pool that runs the PDF stage off the scraper threads."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz
+import pytest
+
+from aus_council_scrapers.constants import COUNCIL_HOUSING_REGEX
+from aus_council_scrapers.cpu import CpuPool, default_cpu_workers
+from aus_council_scrapers.utils import PdfDownload, extract_keywords
+
+PAGES = [
+    "Item 4.1 Planning application for a residential development",
+    "Dwellings: 12 apartments, three storeys. Heritage overlay applies.",
+]
+
+
+def _make_pdf() -> bytes:
+    doc = fitz.open()
+    for text in PAGES:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = CpuPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_a_pdf_is_parsed_in_a_worker_with_the_inline_result(pool, tmp_path):
+    data = _make_pdf()
+    spooled = tmp_path / "agenda.pdf"
+    spooled.write_bytes(data)
+
+    inline = CpuPool(workers=0).pdf_keywords(
+        PdfDownload("https://x.test/a.pdf", {}, "sha", data=data),
+        COUNCIL_HOUSING_REGEX,
+    )
+    assert "residential" in inline[0]
+    for download in (
+        PdfDownload("https://x.test/a.pdf", {}, "sha", data=data),
+        PdfDownload("https://x.test/a.pdf", {}, "sha", path=str(spooled)),
+    ):
+        assert pool.pdf_keywords(download, COUNCIL_HOUSING_REGEX) == inline
+    assert pool.run(os.getpid) != os.getpid()
+
+
+def test_counts_alone_match_the_counts_of_the_joined_text(pool):
+    download = PdfDownload("https://x.test/a.pdf", {}, "sha", data=_make_pdf())
+    _, *counted = pool.pdf_keywords(download, COUNCIL_HOUSING_REGEX)
+    assert list(pool.pdf_keyword_counts(download, COUNCIL_HOUSING_REGEX)) == counted
+
+
+def test_text_is_counted_in_a_worker(pool):
+    text = " ".join(PAGES)
+    assert pool.keywords(COUNCIL_HOUSING_REGEX, text) == extract_keywords(
+        COUNCIL_HOUSING_REGEX, text
+    )
+
+
+def test_a_dead_worker_fails_its_call_and_the_pool_recovers(pool):
+    with pytest.raises(BrokenProcessPool):
+        pool.run(os._exit, 1)
+    assert pool.run(len, "abc") == 3
+
+
+def test_no_workers_runs_on_the_calling_thread():
+    assert CpuPool(workers=0).run(os.getpid) == os.getpid()
+
+
+def test_workers_come_from_the_environment(monkeypatch):
+    monkeypatch.delenv("CPU_WORKERS", raising=False)
+    assert default_cpu_workers() == 0
+    monkeypatch.setenv("CPU_WORKERS", "3")
+    assert default_cpu_workers() == 3
+    monkeypatch.setenv("CPU_WORKERS", "auto")
+    assert default_cpu_workers() == (os.cpu_count() or 1)
@@ -0,0 +1,115 @@
+"""Tests for the scheduler daemon's polling cadence and persisted schedule."""
+
+import datetime
+
+import pytest
+
+from aus_council_scrapers import clock, daemon
+from aus_council_scrapers.base import BaseScraper
+from aus_council_scrapers.daemon import (
+    DEFAULT_INTERVAL,
+    FAR_INTERVAL,
+    MAX_SLEEP,
+    NEAR_INTERVAL,
+    RETRY_INTERVAL,
+    Daemon,
+    ScheduleStore,
+    next_poll,
+    predict_next_meeting,
+)
+
+TODAY = datetime.date(2026, 10, 1)
+# Third Tuesday-ish of each month, four weeks apart.
+MONTHLY = [TODAY - datetime.timedelta(days=28 * n + 20) for n in range(6)]
+
+
+def test_the_next_meeting_is_predicted_from_the_usual_gap():
+    assert predict_next_meeting(MONTHLY, MONTHLY, TODAY) == MONTHLY[0] + (
+        datetime.timedelta(days=28)
+    )
+
+
+def test_a_stored_meeting_without_an_agenda_is_the_one_awaited():
+    upcoming = TODAY + datetime.timedelta(days=5)
+    dates = MONTHLY + [upcoming]
+    assert predict_next_meeting(dates, MONTHLY, TODAY) == upcoming
+    # Once its agenda is stored, the one after it is.
+    assert predict_next_meeting(dates, dates, TODAY) == upcoming + (
+        datetime.timedelta(days=28)
+    )
+
+
+def test_polling_is_frequent_only_near_a_meeting():
+    near, reason = next_poll(MONTHLY, MONTHLY, TODAY)
+    assert near == NEAR_INTERVAL and "agenda due" in reason
+
+    # Just after a meeting, the next is four weeks out.
+    after = [d + datetime.timedelta(days=19) for d in MONTHLY]
+    assert next_poll(after, after, TODAY)[0] == FAR_INTERVAL
+
+    # A day before the window opens, wait exactly until it does.
+    window = [d + datetime.timedelta(days=17) for d in MONTHLY]
+    assert next_poll(window, window, TODAY)[0] == datetime.timedelta(days=1)
+
+
+def test_unknown_and_failing_councils():
+    assert next_poll([], [], TODAY)[0] == DEFAULT_INTERVAL
+    assert next_poll(MONTHLY, MONTHLY, TODAY, failures=1)[0] == RETRY_INTERVAL
+    assert next_poll(MONTHLY, MONTHLY, TODAY, failures=3)[0] == 4 * RETRY_INTERVAL
+    assert next_poll(MONTHLY, MONTHLY, TODAY, failures=10)[0] == FAR_INTERVAL
+
+
+class _Scraper(BaseScraper):
+    def __init__(self, name):
+        super().__init__(name, "VIC", f"https://{name}.example")
+
+
+@pytest.fixture
+def schedule(tmp_path, monkeypatch):
+    now = [datetime.datetime(2026, 10, 1, 9, tzinfo=datetime.timezone.utc)]
+    runs = []
+
+    def run_scraper(scraper, **kwargs):
+        runs.append(scraper.council_name)
+        if scraper.council_name == "broken":
+            return {"ok": False, "council": "broken"}
+        return None
+
+    monkeypatch.setattr(daemon, "run_scraper", run_scraper)
+    histories = {"monthly": (MONTHLY, MONTHLY), "broken": ([], [])}
+
+    def build():
+        return Daemon(
+            [_Scraper("monthly"), _Scraper("broken")],
+            ScheduleStore(str(tmp_path / "schedule.sqlite")),
+            workers=2,
+            now=lambda: now[0],
+            meetings=histories.__getitem__,
+        )
+
+    with clock.frozen(TODAY):
+        yield build, now, runs
+
+
+def test_councils_run_when_due_and_the_schedule_survives_a_restart(schedule):
+    build, now, runs = schedule
+    started = now[0]
+    first = build()
+    assert first.run_once() == 2
+    assert sorted(runs) == ["broken", "monthly"]
+    assert first.run_once() == 0
+
+    restarted = build()
+    assert restarted.run_once() == 0
+    assert restarted.next_wakeup() == now[0] + MAX_SLEEP
+
+    now[0] += RETRY_INTERVAL
+    assert [s.council_name for s in restarted.due()] == ["broken"]
+    restarted.run_once()
+    entry = restarted.store.get("broken")
+    assert entry.failures == 2
+    assert entry.next_run == now[0] + 2 * RETRY_INTERVAL
+
+    monthly = restarted.store.get("monthly")
+    assert monthly.next_run == started + NEAR_INTERVAL
+    assert "agenda due" in monthly.reason
@@ -0,0 +1,129 @@
+"""Tests for the pooled, WAL-mode access layer in `database.py`."""
+
+import random
+import sqlite3
+import threading
+
+import pytest
+
+from aus_council_scrapers import database
+from aus_council_scrapers.base import ScraperReturn
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "agendas.db")
+    monkeypatch.setattr(database, "DB_PATH", path)
+    database.init(path)
+    yield path
+    database.close()
+
+
+def _result(n: int) -> ScraperReturn:
+    return ScraperReturn(
+        name="Council Meeting",
+        date="2026-01-15",
+        time="18:30",
+        webpage_url="https://council.example/meetings",
+        download_url=None,
+        agenda_url=f"https://council.example/agenda-{n}.pdf",
+    )
+
+
+def test_writes_from_many_threads_are_all_committed(db_path):
+    def insert(n):
+        database.insert_result("Test", "vic", _result(n), {"housing": n})
+
+    threads = [threading.Thread(target=insert, args=(n,)) for n in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    database.get_database(db_path).flush()
+
+    assert database.check_url("https://council.example/agenda-49.pdf")
+    assert database.check_meeting_fully_scraped(
+        "https://council.example/agenda-7.pdf", None, db_path=db_path
+    )
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM agendas").fetchone() == (50,)
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_skip_checks_use_the_url_indexes(db_path):
+    with sqlite3.connect(db_path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT agenda_url, minutes_url FROM agendas "
+            "WHERE agenda_url=? OR download_url=?",
+            ("a", "a"),
+        ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "agendas_agenda_url" in details
+    assert "agendas_download_url" in details
+
+
+def test_a_failed_write_is_raised_by_flush_without_losing_the_batch(db_path):
+    db = database.get_database(db_path)
+    db.write("INSERT INTO no_such_table VALUES (1)")
+    database.insert_error("Test", "vic", ValueError("boom"))
+
+    with pytest.raises(sqlite3.OperationalError):
+        db.flush()
+    assert db.read("SELECT error_message FROM agendas") == [("boom",)]
+
+
+def _insert_pairs(db_path, rows):
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO agendas (agenda_url, download_url, minutes_url)"
+            " VALUES (?, ?, ?)",
+            rows,
+        )
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_seen_index_agrees_with_the_database_query(db_path, compact):
+    rng = random.Random(11)
+    urls = [f"https://council.example/{n}.pdf" for n in range(30)]
+    optional = urls[:10] + [None, ""]
+    _insert_pairs(
+        db_path,
+        [
+            (rng.choice(optional), rng.choice(optional), rng.choice(optional))
+            for _ in range(200)
+        ],
+    )
+
+    index = database.seen_index(db_path, compact=compact)
+    for agenda in urls[:15] + [None]:
+        for minutes in urls[:15] + [None, ""]:
+            assert index.is_seen(agenda, minutes) == (
+                database.check_meeting_fully_scraped(agenda, minutes, db_path)
+            ), (agenda, minutes)
+
+
+def test_inserts_are_seen_without_a_reload(db_path):
+    index = database.seen_index(db_path)
+    meetings = [_result(n) for n in range(3)]
+    database.insert_result("Test", "vic", meetings[1], {})
+
+    assert index.filter_unseen(meetings) == [meetings[0], meetings[2]]
+    assert database.seen_index(db_path) is index
+    assert index.fallbacks == 0
+
+
+def test_a_compact_index_only_queries_for_likely_matches(db_path):
+    _insert_pairs(
+        db_path,
+        [(f"https://council.example/{n}.pdf", None, None) for n in range(1000)],
+    )
+    index = database.seen_index(db_path, compact=True)
+
+    assert all(
+        index.is_seen(f"https://council.example/{n}.pdf", None) for n in range(1000)
+    )
+    seen_fallbacks = index.fallbacks
+    assert not any(
+        index.is_seen(f"https://council.example/new-{n}.pdf", None) for n in range(1000)
+    )
+    assert index.fallbacks - seen_fallbacks < 50
@@ -0,0 +1,133 @@
+"""Tests for the memoised date and time parsing."""
+
+import datetime
+
+import pytest
+import pytz
+from dateutil.parser import parse
+
+from aus_council_scrapers import dates
+from aus_council_scrapers.base import ScraperReturn
+
+DATES = [
+    "14 May 2024",
+    "Tuesday 14 May 2024",
+    "Tues 14 May 2024",
+    "Mon, 25 Dec 2024",
+    "25th of December 2024",
+    "23 Sept 2021",
+    "05 Mar 2024",
+    "2024-05-14",
+    "05-06-2024",
+    "13-05-2024",
+    "05-13-2024",
+    "1/2/2024",
+    "25-12-23",
+    "31 June 2024",
+    "2024-02-30",
+    "23 Febr 2021",
+    "Council Meeting 14 May 2024 7pm",
+    "​28/05/2024",
+    "TBA",
+    "",
+]
+TIMES = [
+    "7:00 PM",
+    "7:00pm",
+    "6:30PM",
+    "7pm",
+    "7 p.m.",
+    "12:00 AM",
+    "12:00 PM",
+    "12:30",
+    "19:00",
+    "0:30",
+    "13:00pm",
+    "7.30pm",
+    "8.10",
+    "24:00",
+    "7:5pm",
+    "TBA",
+]
+
+
+def _dateutil(text, part):
+    try:
+        return part(parse(text, fuzzy=True))
+    except Exception:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    dates.clear_caches()
+    yield
+    dates.clear_caches()
+
+
+@pytest.mark.parametrize("text", DATES)
+def test_dates_are_read_as_dateutil_reads_them(text):
+    assert dates.parse_date(text) == _dateutil(text, lambda d: d.date())
+
+
+@pytest.mark.parametrize("text", TIMES)
+def test_times_are_read_as_dateutil_reads_them(text):
+    assert dates.parse_time(text) == _dateutil(text, lambda d: d.time())
+
+
+def test_common_shapes_skip_dateutil(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("dateutil was called")
+
+    monkeypatch.setattr(dates, "_dateutil_parse", fail)
+    assert dates.parse_date("Tuesday 14th of May 2024") == datetime.date(2024, 5, 14)
+    assert dates.parse_date("14-05-2024") == datetime.date(2024, 5, 14)
+    assert dates.parse_time("6:30 pm") == datetime.time(18, 30)
+    assert dates.year_of("2024-05-14") == 2024
+
+
+def test_fallback_answers_are_memoised_failures_included(monkeypatch):
+    calls = []
+
+    def counting(text, **kwargs):
+        calls.append(text)
+        return parse(text, **kwargs)
+
+    monkeypatch.setattr(dates, "_dateutil_parse", counting)
+    for _ in range(3):
+        assert dates.parse_time("7.30pm") == datetime.time(19, 0)
+        assert dates.parse_date("TBA") is None
+    assert calls == ["7.30pm", "TBA"]
+
+
+def test_today_is_kept_until_midnight_in_the_state(monkeypatch):
+    melbourne = pytz.timezone("Australia/Melbourne")
+    evening = melbourne.localize(datetime.datetime(2026, 10, 17, 23, 59)).timestamp()
+    now = [evening]
+    monkeypatch.setattr(dates.time, "time", lambda: now[0])
+
+    assert dates.today_in("vic") == datetime.date(2026, 10, 17)
+    now[0] += 59
+    assert dates.today_in("VIC") == datetime.date(2026, 10, 17)
+    now[0] += 1
+    assert dates.today_in("VIC") == datetime.date(2026, 10, 18)
+    # Perth is still on the 17th.
+    assert dates.today_in("WA") == datetime.date(2026, 10, 17)
+
+
+def test_scraper_return_uses_the_shared_parser():
+    meeting = ScraperReturn(
+        name="Council Meeting",
+        date="Tuesday 14 May 2024",
+        time="7.00pm",
+        webpage_url="https://council.example",
+        download_url="https://council.example/agenda.pdf",
+    )
+    assert meeting.cleaned_date == datetime.date(2024, 5, 14)
+    assert meeting.cleaned_time == datetime.time(19, 0)
+    assert meeting.is_date_in_past("VIC")
+
+    meeting.date = "TBA"
+    meeting._cleaned_date = None
+    with pytest.raises(ValueError, match="Could not parse date TBA"):
+        meeting.cleaned_date
@@ -0,0 +1,88 @@
+"""Tests for the background Discord notifier, against its stub transport."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aus_council_scrapers import discord_bot
+from aus_council_scrapers.discord_bot import (
+    DiscordNotifier,
+    StubTransport,
+    batch_posts,
+)
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(discord_bot, "RETRY_DELAY", 0.01)
+
+
+def test_messages_from_many_threads_are_batched_per_channel():
+    transport = StubTransport()
+    notifier = DiscordNotifier(transport=transport, batch_delay=0.2, min_interval=0)
+    threads = [
+        threading.Thread(target=notifier.send_message, args=(1, f"council {n}"))
+        for n in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    notifier.send_message("2", "other channel")
+
+    assert notifier.flush(5)
+    posts = {channel: content for channel, content, _ in transport.sent}
+    assert len(transport.sent) == 2
+    assert sorted(posts[1].split("\n\n")) == [f"council {n}" for n in range(5)]
+    assert posts[2] == "other channel"
+    assert transport.started and not transport.closed
+
+    notifier.close()
+    assert transport.closed
+
+
+def test_queueing_does_not_wait_for_delivery():
+    class _Slow(StubTransport):
+        async def send(self, channel_id, content):
+            await asyncio.sleep(0.5)
+            await super().send(channel_id, content)
+
+    transport = _Slow()
+    notifier = DiscordNotifier(transport=transport, batch_delay=0, min_interval=0)
+    notifier.send_message(1, "warm up")
+    started = time.monotonic()
+    notifier.send_message(1, "first")
+    notifier.send_message(1, "second")
+    assert time.monotonic() - started < 0.1
+
+    notifier.close()
+    assert "second" in transport.sent[-1][1]
+
+
+def test_posts_to_a_channel_are_spaced_and_rate_limits_are_waited_out():
+    transport = StubTransport(failures=1, rate_limited_for=0.05)
+    notifier = DiscordNotifier(transport=transport, batch_delay=0, min_interval=0.1)
+    notifier.send_message(1, "a")
+    assert notifier.flush(5)
+    notifier.send_message(1, "b")
+    notifier.close()
+
+    assert [content for _, content, _ in transport.sent] == ["a", "b"]
+    assert transport.sent[1][2] - transport.sent[0][2] >= 0.1
+    assert (notifier.sent, notifier.dropped) == (2, 0)
+
+
+def test_a_message_that_keeps_failing_is_dropped_not_retried_forever():
+    transport = StubTransport(failures=discord_bot.MAX_ATTEMPTS)
+    notifier = DiscordNotifier(transport=transport, batch_delay=0, min_interval=0)
+    notifier.send_message(1, "lost")
+    notifier.send_message(1, "next")
+    notifier.close()
+    assert (notifier.sent, notifier.dropped) == (1, 1)
+
+
+def test_batches_respect_the_message_length_limit():
+    posts = batch_posts(["a" * 10, "b" * 10, "c" * 30], limit=25)
+    assert posts == ["a" * 10 + "\n\n" + "b" * 10, "c" * 25]
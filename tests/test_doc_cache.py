@@ -0,0 +1,136 @@
+"""Tests for the document cache behind `process_single_pdf`.
+
+A cached PDF must give exactly the counts a fresh parse does, an unchanged
+one must cost a 304 rather than a download, and new keyword patterns must be
+counted from the stored text.
+"""
+
+import http.server
+import logging
+import threading
+import zlib
+
+import fitz
+import pytest
+
+from aus_council_scrapers import main
+from aus_council_scrapers.constants import COUNCIL_HOUSING_REGEX
+from aus_council_scrapers.doc_cache import DocCache
+from aus_council_scrapers.utils import extract_keywords
+
+
+def _make_pdf(*pages: str) -> bytes:
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+AGENDA = _make_pdf("Planning application: 12 dwellings", "Housing strategy")
+DOCUMENTS = {
+    "/agenda.pdf": (AGENDA, '"a1"'),
+    "/copy-of-agenda.pdf": (AGENDA, None),
+}
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    requests_seen: list = []
+
+    def do_GET(self):
+        data, etag = DOCUMENTS[self.path]
+        conditional = self.headers.get("If-None-Match")
+        self.requests_seen.append((self.path, conditional))
+        if etag and conditional == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(data)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class _Scraper:
+    council_name = "Test"
+    logger = logging.getLogger("test")
+    keyword_regexes = COUNCIL_HOUSING_REGEX
+
+
+def _expected(regexes):
+    with fitz.open(stream=AGENDA, filetype="pdf") as doc:
+        text = "".join(page.get_text() for page in doc)
+    return extract_keywords(regexes, text)
+
+
+def test_unchanged_pdfs_are_revalidated_not_parsed(server, tmp_path, monkeypatch):
+    cache = DocCache(str(tmp_path / "docs.sqlite"))
+    url = server + "/agenda.pdf"
+
+    first = main.process_cached_pdf(_Scraper(), cache, url, "agenda")
+
+    def no_parse(self):
+        raise AssertionError("parsed a cached PDF")
+
+    monkeypatch.setattr("aus_council_scrapers.utils.PdfDownload.open", no_parse)
+    second = main.process_cached_pdf(_Scraper(), cache, url, "agenda")
+
+    assert first == second == _expected(COUNCIL_HOUSING_REGEX)
+    assert _Handler.requests_seen == [("/agenda.pdf", None), ("/agenda.pdf", '"a1"')]
+    # The same bytes under another URL are downloaded but not parsed.
+    copy = main.process_cached_pdf(
+        _Scraper(), cache, server + "/copy-of-agenda.pdf", "agenda"
+    )
+    assert copy == first
+    assert cache.stats()["documents"] == 1
+
+
+def test_new_patterns_are_counted_from_the_stored_text(server, tmp_path):
+    cache = DocCache(str(tmp_path / "docs.sqlite"))
+    url = server + "/agenda.pdf"
+    main.process_cached_pdf(_Scraper(), cache, url, "agenda")
+
+    scraper = _Scraper()
+    scraper.keyword_regexes = COUNCIL_HOUSING_REGEX + ["strateg"]
+    assert main.process_cached_pdf(scraper, cache, url, "agenda") == _expected(
+        scraper.keyword_regexes
+    )
+
+
+def test_least_recently_used_documents_are_evicted(tmp_path):
+    now = [0.0]
+    size = len(zlib.compress(b"a" * 1000))
+    cache = DocCache(
+        str(tmp_path / "docs.sqlite"), max_bytes=3 * size, clock=lambda: now[0]
+    )
+    for name in "abc":
+        now[0] += 1
+        cache.store(name, name * 1000, 1, {"x": 1})
+        cache.remember(f"https://council.example/{name}.pdf", name, {"ETag": name})
+    # Touch "a", so "b" is the least recently used.
+    now[0] += 1
+    cache.counts("a", ["x"])
+    now[0] += 1
+    cache.store("d", "d" * 1000, 1, {"x": 1})
+
+    assert cache.text("b") is None
+    assert cache.lookup("https://council.example/b.pdf") is None
+    assert cache.text("a") == "a" * 1000
+    assert cache.counts("a", ["x", "y"]) == ({"x": 1}, 1)
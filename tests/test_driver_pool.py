@@ -0,0 +1,133 @@
+"""Tests for the shared Selenium driver pool.
+
+Uses a fake driver, so Chrome is never started: what matters is that drivers
+are reused warm, reset between councils, replaced when worn out or crashed,
+and that the pool never holds more browsers than it was sized for.
+"""
+
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from aus_council_scrapers.base import DefaultFetcher
+from aus_council_scrapers.driver_pool import DriverPool
+
+
+class _FakeDriver:
+    started = 0
+
+    def __init__(self):
+        _FakeDriver.started += 1
+        self.cookies = {}
+        self.page_source = ""
+        self.quit_called = False
+        self.crash = False
+
+    def get(self, url):
+        if self.crash:
+            raise WebDriverException("chrome not reachable")
+        self.page_source = f"<html>{url}</html>"
+        if url != "about:blank":
+            self.cookies["session"] = url
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def execute_script(self, script, *args):
+        return None
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _pool(**kwargs):
+    return DriverPool(factory=_FakeDriver, **kwargs)
+
+
+def test_released_drivers_are_reused_and_reset():
+    pool = _pool(size=1)
+    lease = pool.acquire()
+    lease.driver.get("https://council.example/meetings")
+    pool.release(lease)
+
+    again = pool.acquire()
+    assert again.driver is lease.driver
+    assert again.driver.cookies == {}
+    assert pool.stats().started == 1
+
+
+def test_drivers_are_replaced_after_max_pages():
+    pool = _pool(size=1, max_pages=2)
+    fetcher = DefaultFetcher(fetch_delay=0, driver_pool=pool)
+
+    first = fetcher.get_selenium_driver()
+    fetcher.fetch_with_selenium("https://council.example/1")
+    fetcher.fetch_with_selenium("https://council.example/2")
+    fetcher.close()
+
+    assert first.quit_called
+    assert fetcher.get_selenium_driver() is not first
+    assert pool.stats().recycled == 1
+
+
+def test_a_crashed_driver_is_discarded():
+    pool = _pool(size=1)
+    fetcher = DefaultFetcher(fetch_delay=0, driver_pool=pool)
+    driver = fetcher.get_selenium_driver()
+    driver.crash = True
+
+    with pytest.raises(WebDriverException):
+        fetcher.fetch_with_selenium("https://council.example/")
+
+    assert driver.quit_called
+    assert fetcher.get_selenium_driver() is not driver
+    assert pool.stats().crashed == 1
+
+
+def test_a_driver_released_after_shutdown_is_quit():
+    pool = _pool(size=2)
+    idle, leased = pool.acquire(), pool.acquire()
+    pool.release(idle)
+
+    pool.shutdown()
+    assert idle.driver.quit_called
+    assert not leased.driver.quit_called
+
+    pool.release(leased)
+    assert leased.driver.quit_called
+
+
+def test_a_fetcher_keeps_one_driver_until_closed():
+    pool = _pool(size=2)
+    fetcher = DefaultFetcher(fetch_delay=0, driver_pool=pool)
+
+    driver = fetcher.get_selenium_driver()
+    fetcher.fetch_with_selenium("https://council.example/")
+    assert fetcher.get_selenium_driver() is driver
+
+    fetcher.close()
+    fetcher.close()  # closing twice is harmless
+    assert pool.acquire().driver is driver
+
+
+def test_the_pool_is_bounded_and_records_waits():
+    pool = _pool(size=1)
+    held = pool.acquire()
+
+    def release_later():
+        time.sleep(0.1)
+        pool.release(held)
+
+    threading.Thread(target=release_later).start()
+    waited_for = pool.acquire(timeout=5)
+
+    assert waited_for.driver is held.driver
+    stats = pool.stats()
+    assert stats.started == 1
+    assert stats.waited == 1
+    assert stats.max_wait >= 0.05
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
@@ -0,0 +1,102 @@
+"""Tests for `BaseScraper.fetch_many`, the multi-page fan-out.
+
+Pages can land in any order, but callers index the results against the URLs
+they asked for, so order must be kept — and a fetcher that asks for one
+request at a time (recording, playback) must get exactly that.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from aus_council_scrapers.base import BaseScraper, Fetcher
+
+
+class _SlowFetcher(Fetcher):
+    def __init__(self, concurrency, fail=()):
+        self.concurrency = concurrency
+        self.fail = set(fail)
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_selenium_driver(self):
+        raise NotImplementedError
+
+    def fetch_with_selenium(self, url, wait_time=10, wait_condition=None):
+        raise NotImplementedError
+
+    def fetch_with_requests(self, url, method="GET", **kwargs):
+        with self.lock:
+            self.calls.append(url)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(random.uniform(0, 0.02))
+        with self.lock:
+            self.in_flight -= 1
+        if url in self.fail:
+            raise ValueError(f"failed {url}")
+        return f"body of {url}"
+
+
+class _Scraper(BaseScraper):
+    def __init__(self, fetcher):
+        super().__init__("fan_out", "VIC", "https://fan-out.example")
+        self.fetcher = fetcher
+
+    def scraper(self):
+        return []
+
+
+URLS = [f"https://fan-out.example/{i}" for i in range(12)]
+
+
+def test_results_keep_input_order():
+    fetcher = _SlowFetcher(concurrency=4)
+    pages = _Scraper(fetcher).fetch_many(URLS)
+
+    assert pages == [f"body of {url}" for url in URLS]
+    assert 1 < fetcher.peak <= 4
+
+
+def test_serial_fetchers_are_called_in_order():
+    fetcher = _SlowFetcher(concurrency=1)
+    _Scraper(fetcher).fetch_many(URLS)
+
+    assert fetcher.calls == URLS
+    assert fetcher.peak == 1
+
+
+def test_parse_replaces_each_page():
+    pages = _Scraper(_SlowFetcher(concurrency=3)).fetch_many(
+        URLS, parse=lambda url, body: (url, len(body))
+    )
+
+    assert pages == [(url, len(f"body of {url}")) for url in URLS]
+
+
+def test_failures_raise_unless_returned():
+    fetcher = _SlowFetcher(concurrency=3, fail={URLS[5]})
+
+    with pytest.raises(ValueError):
+        _Scraper(fetcher).fetch_many(URLS)
+
+    pages = _Scraper(fetcher).fetch_many(URLS, return_exceptions=True)
+    assert isinstance(pages[5], ValueError)
+    assert pages[4] == f"body of {URLS[4]}"
+
+
+def test_async_fan_out_matches():
+    fetcher = _SlowFetcher(concurrency=4, fail={URLS[0]})
+    pages = asyncio.run(
+        _Scraper(fetcher).afetch_many(
+            URLS, parse=lambda url, body: body.upper(), return_exceptions=True
+        )
+    )
+
+    assert isinstance(pages[0], ValueError)
+    assert pages[1:] == [f"body of {url}".upper() for url in URLS[1:]]
@@ -0,0 +1,107 @@
+"""Tests for the store of closed listing periods.
+
+A closed period must come back exactly as it was parsed, only complete and
+settled periods may close, and `--full` must fetch everything again.
+"""
+
+import datetime
+
+import pytest
+
+from aus_council_scrapers import clock
+from aus_council_scrapers.base import ScraperReturn
+from aus_council_scrapers.history import PeriodHistory
+from aus_council_scrapers.scrapers.nsw.burwood import BurwoodNSWScraper
+from tests.cassette import PlaybackFetcher, cassette_paths, load_replay
+
+TODAY = datetime.date(2026, 10, 1)
+
+
+def _meeting(date="2024-05-01", minutes=True):
+    return ScraperReturn(
+        name="Council Meeting",
+        date=date,
+        time=None,
+        webpage_url="https://council.example/meetings",
+        agenda_url="https://council.example/agenda.pdf",
+        minutes_url="https://council.example/minutes.pdf" if minutes else None,
+    )
+
+
+def _history(tmp_path, **kwargs):
+    return PeriodHistory(
+        str(tmp_path / "history.sqlite"), today=lambda: TODAY, **kwargs
+    )
+
+
+def test_a_period_closes_once_complete_old_and_unchanged(tmp_path):
+    history = _history(tmp_path)
+    ended = datetime.date(2024, 12, 31)
+
+    assert not history.record("test", "2024", [_meeting()], ended)
+    assert history.closed("test", "2024") is None
+    assert history.record("test", "2024", [_meeting()], ended)
+    assert history.closed("test", "2024") == [_meeting()]
+
+
+def test_old_meetings_without_minutes_do_not_hold_a_period_open(tmp_path):
+    history = _history(tmp_path)
+    meetings = [_meeting(), _meeting(date="2024-06-01", minutes=False)]
+    for _ in range(2):
+        history.record("test", "2024", meetings, datetime.date(2024, 12, 31))
+    assert history.closed("test", "2024") == meetings
+
+
+@pytest.mark.parametrize(
+    "meetings, ended",
+    [
+        ([_meeting(date="2026-09-01", minutes=False)], datetime.date(2024, 12, 31)),
+        ([_meeting(date="not a date", minutes=False)], datetime.date(2024, 12, 31)),
+        ([_meeting()], TODAY - datetime.timedelta(days=30)),
+        ([], datetime.date(2024, 12, 31)),
+    ],
+    ids=["minutes-pending", "undated", "too-recent", "empty"],
+)
+def test_incomplete_or_recent_periods_stay_open(tmp_path, meetings, ended):
+    history = _history(tmp_path)
+    for _ in range(3):
+        assert not history.record("test", "p", meetings, ended)
+    assert history.closed("test", "p") is None
+
+
+def test_full_refetches_closed_periods(tmp_path):
+    history = _history(tmp_path)
+    for _ in range(2):
+        history.record("test", "2024", [_meeting()], datetime.date(2024, 12, 31))
+
+    full = _history(tmp_path, refetch_all=True)
+    assert full.closed("test", "2024") is None
+
+
+class _CountingFetcher(PlaybackFetcher):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.urls = []
+
+    def fetch_with_requests(self, url, method="GET", **kwargs):
+        self.urls.append(url)
+        return super().fetch_with_requests(url, method, **kwargs)
+
+
+def test_infocouncil_serves_closed_years_from_the_store(tmp_path):
+    _, replay_path = cassette_paths("burwood")
+    replay = load_replay(replay_path)
+    history = PeriodHistory(str(tmp_path / "history.sqlite"))
+
+    runs = []
+    for _ in range(3):
+        scraper = BurwoodNSWScraper()
+        scraper.fetcher = _CountingFetcher(replay, "burwood")
+        scraper.history = history.for_council("burwood")
+        with clock.frozen(scraper.fetcher.recorded_date):
+            meetings = scraper.scraper()
+        runs.append((meetings, scraper.fetcher.urls))
+
+    (first, first_urls), _, (third, third_urls) = runs
+    assert [m.to_dict() for m in third] == [m.to_dict() for m in first]
+    assert 0 < len(third_urls) < len(first_urls)
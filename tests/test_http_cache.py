@@ -0,0 +1,149 @@
+"""Tests for the on-disk conditional-request cache under `DefaultFetcher`.
+
+A cached page must come back byte-for-byte as the live one did, whether it
+was revalidated with a 304 or still fresh, and the cache must never keep
+what the server said not to.
+"""
+
+import hashlib
+import http.server
+import os
+import threading
+
+import pytest
+
+from aus_council_scrapers.base import DefaultFetcher
+from aus_council_scrapers.http_cache import HttpCache
+
+PAGES = {
+    "/etag": ({"ETag": '"v1"'}, "Meeting agenda ✓"),
+    "/modified": ({"Last-Modified": "Wed, 01 May 2024 00:00:00 GMT"}, "minutes"),
+    "/fresh": ({"Cache-Control": "max-age=3600", "ETag": '"f"'}, "fresh page"),
+    "/no-store": ({"Cache-Control": "no-store", "ETag": '"n"'}, "secret"),
+}
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    requests_seen: list = []
+
+    def do_GET(self):
+        headers, body = PAGES[self.path]
+        self.requests_seen.append((self.path, dict(self.headers)))
+        etag = headers.get("ETag")
+        modified = headers.get("Last-Modified")
+        if (etag and self.headers.get("If-None-Match") == etag) or (
+            modified and self.headers.get("If-Modified-Since") == modified
+        ):
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _fetcher(tmp_path, **kwargs):
+    cache = HttpCache(str(tmp_path / "http"), **kwargs)
+    return DefaultFetcher(fetch_delay=0, cache=cache), cache
+
+
+@pytest.mark.parametrize("path", ["/etag", "/modified"])
+def test_unchanged_pages_are_revalidated_and_served_from_disk(server, tmp_path, path):
+    fetcher, cache = _fetcher(tmp_path)
+
+    first = fetcher.fetch_with_requests(server + path)
+    second = fetcher.fetch_with_requests(server + path)
+
+    assert first == second == PAGES[path][1]
+    assert (cache.hits, cache.misses) == (1, 1)
+    conditional = _Handler.requests_seen[1][1]
+    assert "If-None-Match" in conditional or "If-Modified-Since" in conditional
+
+
+def test_fresh_pages_skip_the_network(server, tmp_path):
+    fetcher, cache = _fetcher(tmp_path)
+
+    for _ in range(3):
+        assert fetcher.fetch_with_requests(server + "/fresh") == "fresh page"
+
+    assert len(_Handler.requests_seen) == 1
+    assert cache.hits == 2
+
+
+def test_no_store_is_never_written(server, tmp_path):
+    fetcher, cache = _fetcher(tmp_path)
+
+    fetcher.fetch_with_requests(server + "/no-store")
+    fetcher.fetch_with_requests(server + "/no-store")
+
+    assert cache.stats()["entries"] == 0
+    assert "If-None-Match" not in _Handler.requests_seen[1][1]
+
+
+def test_entries_persist_across_processes(server, tmp_path):
+    fetcher, _ = _fetcher(tmp_path)
+    fetcher.fetch_with_requests(server + "/etag")
+
+    fetcher, cache = _fetcher(tmp_path)
+    assert fetcher.fetch_with_requests(server + "/etag") == PAGES["/etag"][1]
+    assert cache.hits == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(str(tmp_path / "http"), max_bytes=600)
+
+    # Each entry is roughly 185 bytes, so three fit and a fourth does not.
+    for key in ["a", "b", "c"]:
+        cache.store(key, key, "x" * 100, {"ETag": '"x"'})
+    cache.lookup("a")  # now the most recently used
+
+    cache.store("d", "d", "x" * 100, {"ETag": '"x"'})
+
+    # Evicted down to 90% of the limit, which takes two entries.
+    assert cache.lookup("b") is None
+    assert cache.lookup("c") is None
+    assert cache.lookup("a") is not None
+    assert cache.lookup("d") is not None
+
+    # So the next write fits without evicting anything.
+    cache.store("e", "e", "x" * 100, {"ETag": '"x"'})
+    assert all(cache.lookup(key) for key in ["a", "d", "e"])
+    assert cache.stats()["entries"] == 3
+
+
+def test_last_use_survives_a_restart(tmp_path):
+    cache = HttpCache(str(tmp_path / "http"), max_bytes=600)
+
+    def touch(key, when):
+        name = hashlib.sha256(key.encode()).hexdigest() + ".json"
+        os.utime(os.path.join(cache.directory, name), (when, when))
+
+    for when, key in enumerate(["a", "b", "c"]):
+        cache.store(key, key, "x" * 100, {"ETag": '"x"'})
+        touch(key, 1_000_000 + when)
+
+    reopened = HttpCache(cache.directory, max_bytes=600)
+    reopened.store("d", "d", "x" * 100, {"ETag": '"x"'})
+    assert reopened.lookup("a") is None
+    assert reopened.lookup("b") is None
+    assert reopened.lookup("c") is not None
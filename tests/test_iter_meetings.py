@@ -0,0 +1,87 @@
+"""Tests for `iter_meetings`, the newest-first streaming scraper contract.
+
+Streaming must find the same meetings `scraper()` lists, newest first, and
+the first one must cost only the pages it sits on.
+"""
+
+import json
+
+import pytest
+
+from aus_council_scrapers import clock
+from aus_council_scrapers.base import BaseScraper, ScraperReturn
+from aus_council_scrapers.main import get_newest_meeting
+from aus_council_scrapers.scrapers.nsw.burwood import BurwoodNSWScraper
+from tests.cassette import PlaybackFetcher, cassette_paths, load_replay
+
+
+class _CountingFetcher(PlaybackFetcher):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.urls = []
+
+    def fetch_with_requests(self, url, method="GET", **kwargs):
+        self.urls.append(url)
+        return super().fetch_with_requests(url, method, **kwargs)
+
+
+@pytest.fixture
+def burwood():
+    _, replay_path = cassette_paths("burwood")
+    fetcher = _CountingFetcher(load_replay(replay_path), "burwood")
+    scraper = BurwoodNSWScraper()
+    scraper.fetcher = fetcher
+    with clock.frozen(fetcher.recorded_date):
+        yield scraper
+
+
+def _dates(meetings):
+    return [meeting.cleaned_date for meeting in meetings]
+
+
+def test_infocouncil_streams_the_same_meetings_newest_first(burwood):
+    listed = burwood.scraper()
+    streamed = list(burwood.iter_meetings())
+
+    assert len(streamed) == len(listed) > 0
+    assert sorted(json.dumps(m.to_dict()) for m in streamed) == sorted(
+        json.dumps(m.to_dict()) for m in listed
+    )
+    assert _dates(streamed) == sorted(_dates(streamed), reverse=True)
+
+
+def test_the_newest_meeting_reads_only_the_newest_year_pages(burwood):
+    years = list(burwood._years_to_try())
+    newest = get_newest_meeting(burwood)
+
+    assert _dates(newest) == [max(_dates(burwood.scraper()))]
+    assert len(burwood.fetcher.urls) - len(years) < len(years) / 2
+
+
+class _ListScraper(BaseScraper):
+    def __init__(self, dates):
+        super().__init__("listing", "VIC", "https://listing.example")
+        self.dates = dates
+
+    def scraper(self):
+        return [
+            ScraperReturn(
+                name=None,
+                date=date,
+                time=None,
+                webpage_url=self.base_url,
+                agenda_url=f"{self.base_url}/{date}.pdf",
+            )
+            for date in self.dates
+        ]
+
+
+def test_unported_scrapers_are_sorted_newest_first():
+    scraper = _ListScraper(["3 March 2025", "not a date", "9 June 2025", "1 May 2024"])
+    assert [m.date for m in scraper.iter_meetings()] == [
+        "9 June 2025",
+        "3 March 2025",
+        "1 May 2024",
+        "not a date",
+    ]
+    assert [m.date for m in get_newest_meeting(scraper, years=[2024])] == ["1 May 2024"]
@@ -0,0 +1,67 @@
+"""Tests for keyword counting.
+
+Counts and word counts must be exactly what the old normalise-then-findall
+implementation produced, whether the text arrives whole or as pages.
+"""
+
+import random
+import re
+
+import pytest
+
+from aus_council_scrapers.constants import COUNCIL_HOUSING_REGEX
+from aus_council_scrapers.keywords import KeywordMatcher, matcher_for, normalise
+from aus_council_scrapers.utils import extract_keywords
+
+
+def _old_extract_keywords(regexes, text):
+    cleaned = re.sub(r"\s+", " ", text)
+    cleaned = re.sub(r"\t", " ", cleaned)
+    cleaned = re.sub(r"[^\w\s]", "", cleaned)
+    cleaned = cleaned.lower()
+    keywords = {regex: len(re.findall(regex, cleaned)) for regex in regexes}
+    wordcount = len(cleaned.split(" "))
+    return keywords, wordcount
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   ",
+        " Housing ",
+        "Item 4.1 - Planning application:\n\t12 dwellings, 3 storeys.",
+        "\x0b\x1cHERITAGE\r\noverlay;  affordable-housing strategy\n",
+    ],
+)
+def test_normalise_matches_the_regex_passes(text):
+    expected = re.sub(r"[^\w\s]", "", re.sub(r"\s+", " ", text)).lower()
+    assert normalise(text) == expected
+
+
+def test_pages_count_the_same_as_the_joined_text():
+    rng = random.Random(8)
+    alphabet = list("ab housing dwelling- \t\n\r .,Heritage")
+    for _ in range(2000):
+        pages = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            for _ in range(rng.randint(1, 4))
+        ]
+        assert extract_keywords(COUNCIL_HOUSING_REGEX, pages) == (
+            _old_extract_keywords(COUNCIL_HOUSING_REGEX, "".join(pages))
+        )
+
+
+def test_counts_are_keyed_by_the_patterns_as_given():
+    compiled = re.compile("hous")
+    counts, wordcount = KeywordMatcher(["dwell", compiled]).extract(
+        ["Housing: houses, ", " dwellings."]
+    )
+    assert counts == {"dwell": 1, compiled: 2}
+    assert wordcount == 3
+
+
+def test_matchers_are_built_once_per_pattern_set():
+    assert matcher_for(COUNCIL_HOUSING_REGEX) is matcher_for(
+        list(COUNCIL_HOUSING_REGEX)
+    )
@@ -0,0 +1,234 @@
+"""Tests for the background mailer, against a local SMTP stand-in."""
+
+import base64
+import email
+import socketserver
+import threading
+import time
+
+import pytest
+
+from aus_council_scrapers import mailer as mailer_module
+from aus_council_scrapers.base import ScraperReturn
+from aus_council_scrapers.mailer import Mailer
+from aus_council_scrapers.utils import write_email, write_email_section
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO, AUTH PLAIN, MAIL, RCPT, DATA."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 stand-in ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb, _, rest = line.decode().strip().partition(" ")
+            verb = verb.upper()
+            if verb == "EHLO":
+                self.reply("250-stand-in")
+                self.reply("250 AUTH PLAIN")
+            elif verb == "AUTH":
+                credentials = base64.b64decode(rest.split()[1]).split(b"\0")
+                if credentials[2].decode() != server.password:
+                    self.reply("535 bad credentials")
+                    continue
+                with server.lock:
+                    server.logins += 1
+                self.reply("235 ok")
+            elif verb == "DATA":
+                self.reply("354 go ahead")
+                lines = []
+                while (line := self.rfile.readline()) not in (b".\r\n", b""):
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+                with server.lock:
+                    server.messages.append(email.message_from_bytes(b"".join(lines)))
+                self.reply("250 queued")
+                if server.hang_up_after_message:
+                    return
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+
+class _SmtpStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.lock = threading.Lock()
+        self.password = "secret"
+        self.hang_up_after_message = False
+        self.connections = 0
+        self.logins = 0
+        self.messages: list[email.message.Message] = []
+
+
+@pytest.fixture
+def smtp_server():
+    server = _SmtpStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(mailer_module, "RETRY_DELAY", 0.01)
+
+
+def _mailer(server, password="secret", **kwargs) -> Mailer:
+    host, port = server.server_address
+    return Mailer(
+        "scraper@example.com",
+        password,
+        "team@example.com",
+        host=host,
+        port=port,
+        starttls=False,
+        **kwargs,
+    )
+
+
+def _body(message) -> str:
+    payload = message.get_payload()[0].get_payload(decode=True).decode()
+    # Lines travel as CRLF.
+    return payload.replace("\r\n", "\n")
+
+
+def _meeting(n: int) -> ScraperReturn:
+    return ScraperReturn(
+        name="Council Meeting",
+        date=f"{n} October 2026",
+        time="7:00pm",
+        webpage_url="https://council.example/meetings",
+        download_url=None,
+        agenda_url=f"https://council.example/agenda-{n}.pdf",
+    )
+
+
+def test_messages_from_many_threads_share_one_logged_in_connection(smtp_server):
+    mailer = _mailer(smtp_server)
+    threads = [
+        threading.Thread(target=mailer.send, args=(f"council {n}", f"body {n}"))
+        for n in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mailer.flush(5)
+    assert sorted(m["Subject"] for m in smtp_server.messages) == [
+        f"council {n}" for n in range(5)
+    ]
+    assert (smtp_server.connections, smtp_server.logins) == (1, 1)
+    assert smtp_server.messages[0]["To"] == "team@example.com"
+
+    mailer.close()
+    assert (mailer.sent, mailer.dropped) == (5, 0)
+
+
+def test_queueing_does_not_wait_for_the_server(smtp_server, monkeypatch):
+    slow = Mailer._Mailer__connection
+
+    def slow_connection(self):
+        time.sleep(0.5)
+        return slow(self)
+
+    monkeypatch.setattr(Mailer, "_Mailer__connection", slow_connection)
+    mailer = _mailer(smtp_server)
+    started = time.monotonic()
+    mailer.notify("first", "section one")
+    mailer.notify("second", "section two")
+    assert time.monotonic() - started < 0.1
+
+    mailer.close()
+    assert [m["Subject"] for m in smtp_server.messages] == ["first", "second"]
+
+
+def test_digest_mode_sends_one_message_for_the_whole_run(smtp_server):
+    mailer = _mailer(smtp_server, digest=True)
+    sections = [
+        write_email_section("Yarra", _meeting(n), {"housing": n}) for n in (1, 2, 3)
+    ]
+    for n, section in enumerate(sections, 1):
+        mailer.notify(f"New agenda: Yarra {n}", section)
+    assert mailer.flush(5)
+    assert smtp_server.messages == []
+
+    mailer.close()
+    (message,) = smtp_server.messages
+    assert message["Subject"] == "New agendas: 3 meetings"
+    body = _body(message)
+    assert body.startswith("Hello,\n\n") and body.count("Thank you") == 1
+    for section in sections:
+        assert section in body
+
+
+def test_a_dropped_connection_is_reopened(smtp_server):
+    smtp_server.hang_up_after_message = True
+    mailer = _mailer(smtp_server)
+    for n in range(3):
+        mailer.send(f"council {n}", "body")
+    mailer.close()
+
+    assert [m["Subject"] for m in smtp_server.messages] == [
+        f"council {n}" for n in range(3)
+    ]
+    assert smtp_server.connections == 3
+    assert (mailer.sent, mailer.dropped) == (3, 0)
+
+
+def test_a_rejected_login_is_not_retried(smtp_server):
+    mailer = _mailer(smtp_server, password="wrong")
+    mailer.send("lost", "body")
+    mailer.close()
+    assert (mailer.sent, mailer.dropped) == (0, 1)
+    assert smtp_server.connections == 1
+
+
+def test_a_single_meeting_email_is_unchanged():
+    meeting = _meeting(7)
+    section = write_email_section("Yarra", meeting, {"housing": 2})
+    body = write_email("Yarra", meeting, {"housing": 2})
+    assert body == (
+        "Hello,\n\n" + section + "\n\nThank you,\nYour friendly neighborhood "
+        "agenda scraper"
+    )
+    assert "Agenda: https://council.example/agenda-7.pdf\n" in section
+    assert "- housing: 2 matches\n" in section
+
+
+def test_email_is_configured_from_the_env_file(monkeypatch):
+    monkeypatch.delenv("EMAIL_DIGEST", raising=False)
+    assert Mailer.from_config({"GMAIL_ACCOUNT_RECEIVE": "team@example.com"}) is None
+
+    mailer = Mailer.from_config(
+        {
+            "GMAIL_FUNCTIONALITY": "1",
+            "GMAIL_ACCOUNT_SEND": "scraper@example.com",
+            "GMAIL_ACCOUNT_RECEIVE": "team@example.com",
+            "SMTP_HOST": "localhost",
+            "SMTP_PORT": "2525",
+            "SMTP_STARTTLS": "0",
+        }
+    )
+    assert (mailer.host, mailer.port, mailer.starttls) == ("localhost", 2525, False)
+    assert not mailer.digest
+
+    monkeypatch.setenv("EMAIL_DIGEST", "1")
+    assert Mailer.from_config(
+        {"GMAIL_FUNCTIONALITY": "1", "GMAIL_ACCOUNT_RECEIVE": "team@example.com"}
+    ).digest
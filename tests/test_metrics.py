@@ -0,0 +1,128 @@
+"""Tests for the fetch metrics and the run report `main` writes from them."""
+
+import argparse
+import http.server
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from aus_council_scrapers import main
+from aus_council_scrapers.base import DefaultFetcher
+from aus_council_scrapers.metrics import FetchMetrics, Histogram
+
+PAGE = b"<html><body>Council Meeting</body></html>"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    flaky_left = 0
+
+    def do_GET(self):
+        if self.path == "/flaky" and _Handler.flaky_left:
+            _Handler.flaky_left -= 1
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.flaky_left = 1
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_requests_retries_and_bytes_are_counted_per_host_and_council(server):
+    metrics = FetchMetrics()
+    fetcher = DefaultFetcher(fetch_delay=0, metrics=metrics, council="test")
+    fetcher.fetch_with_requests(f"http://{server}/flaky")
+    fetcher.fetch_with_requests(f"http://{server}/page")
+
+    report = metrics.report()
+    assert report["hosts"].keys() == {server}
+    assert report["councils"].keys() == {"test"}
+    council = report["councils"]["test"]
+    assert council["requests"] == 3
+    assert council["statuses"] == {"200": 2, "503": 1}
+    assert council["retries"] == 1
+    assert council["bytes"] == 2 * len(PAGE)
+    assert council["latency_s"]["count"] == 3
+    assert report["total"] == council
+
+
+def test_prometheus_output_has_labelled_counters_and_histograms(server):
+    metrics = FetchMetrics()
+    fetcher = DefaultFetcher(fetch_delay=0, metrics=metrics, council="test")
+    fetcher.fetch_with_requests(f"http://{server}/flaky")
+
+    lines = metrics.prometheus().splitlines()
+    labels = f'host="{server}",council="test"'
+    assert f'council_scraper_requests_total{{{labels},status="503"}} 1' in lines
+    assert f"council_scraper_retries_total{{{labels}}} 1" in lines
+    histogram = "council_scraper_fetch_duration_seconds"
+    assert f'{histogram}_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"{histogram}_count{{{labels}}} 2" in lines
+    assert "# TYPE council_scraper_fetch_duration_seconds histogram" in lines
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.to_dict()["sum"] == pytest.approx(3.65)
+
+
+def test_the_run_report_lists_each_council_and_the_fetches(tmp_path):
+    args = argparse.Namespace(
+        metrics_json=str(tmp_path / "report.json"),
+        metrics_prom=str(tmp_path / "scraper.prom"),
+        engine="threads",
+        workers=3,
+    )
+    results = [
+        {"ok": True, "council": "burwood", "state": "NSW", "meetings": [{}, {}]},
+        {
+            "ok": False,
+            "council": "yarra",
+            "state": "VIC",
+            "error": {"type": "BlockedByWAF", "message": "403"},
+        },
+    ]
+    main.write_metrics(args, results, datetime.now().astimezone())
+
+    with open(args.metrics_json) as f:
+        report = json.load(f)
+    assert report["workers"] == 3
+    assert report["councils"] == [
+        {
+            "council": "burwood",
+            "state": "NSW",
+            "ok": True,
+            "meetings": 2,
+            "error": None,
+        },
+        {
+            "council": "yarra",
+            "state": "VIC",
+            "ok": False,
+            "meetings": 0,
+            "error": "BlockedByWAF",
+        },
+    ]
+    assert {"total", "hosts", "councils", "run_s"} <= report["fetch"].keys()
+    assert (tmp_path / "scraper.prom").read_text().startswith("# HELP")
+    assert (tmp_path / "scraper.prom").stat().st_mode & 0o777 == 0o644
@@ -0,0 +1,111 @@
+"""Tests for `--format ndjson`, which streams each council's result as it finishes."""
+
+import argparse
+import asyncio
+import io
+import json
+import threading
+
+from aus_council_scrapers.base import BaseScraper, ScraperReturn
+from aus_council_scrapers.main import (
+    NdjsonWriter,
+    run_scrapers_async,
+    run_scrapers_threaded,
+)
+
+
+class _Stream(io.StringIO):
+    """Signals once a council's line has been written."""
+
+    def __init__(self):
+        super().__init__()
+        self.fast_written = threading.Event()
+
+    def write(self, text):
+        if '"council": "fast"' in text and '"type": "council"' in text:
+            self.fast_written.set()
+        return super().write(text)
+
+    def records(self):
+        return [json.loads(line) for line in self.getvalue().splitlines()]
+
+
+class _Scraper(BaseScraper):
+    def __init__(self, name, meetings, wait_for=None):
+        super().__init__(name, "VIC", f"https://{name}.example")
+        self.meetings = meetings
+        self.wait_for = wait_for
+
+    def scraper(self):
+        if self.wait_for is not None:
+            assert self.wait_for.wait(5), "the fast council was not streamed first"
+        return [
+            ScraperReturn(
+                name="Council Meeting",
+                date=f"2024-05-{day:02}",
+                time=None,
+                webpage_url=f"https://{self.council_name}.example/meetings",
+                agenda_url=f"https://{self.council_name}.example/{day}.pdf",
+            )
+            for day in range(1, self.meetings + 1)
+        ]
+
+
+def _args():
+    return argparse.Namespace(adapter=True, council=None, state=None, years=None)
+
+
+def test_each_council_is_written_as_soon_as_it_finishes():
+    stream = _Stream()
+    writer = NdjsonWriter(_args(), stream=stream)
+    # "slow" is listed first, but cannot finish until "fast" has been written.
+    scrapers = [_Scraper("slow", 1, wait_for=stream.fast_written), _Scraper("fast", 2)]
+
+    results = run_scrapers_threaded(
+        scrapers, 2, emit=writer.emit, adapter_mode=True, skip_pdf=True
+    )
+    writer.summary(results)
+
+    records = stream.records()
+    assert [(r["type"], r["council"]) for r in records[:-1]] == [
+        ("meeting", "fast"),
+        ("meeting", "fast"),
+        ("council", "fast"),
+        ("meeting", "slow"),
+        ("council", "slow"),
+    ]
+    council = records[2]
+    assert council["ok"] and council["meeting_count"] == 2
+    assert "meetings" not in council
+    assert records[0]["agenda_url"] == "https://fast.example/1.pdf"
+
+    # Only the summaries are kept, in registry order.
+    assert [(r["council"], r["meeting_count"]) for r in results] == [
+        ("slow", 1),
+        ("fast", 2),
+    ]
+    summary = records[-1]
+    assert summary["type"] == "summary"
+    assert (summary["councils"], summary["ok"], summary["meetings"]) == (2, 2, 3)
+
+
+def test_the_async_engine_streams_too():
+    stream = _Stream()
+    writer = NdjsonWriter(_args(), stream=stream)
+
+    results = asyncio.run(
+        run_scrapers_async(
+            [_Scraper("fast", 1)], workers=1, emit=writer.emit, adapter_mode=True
+        )
+    )
+
+    assert [r["type"] for r in stream.records()] == ["meeting", "council"]
+    assert results == [
+        {
+            "ok": True,
+            "council": "fast",
+            "state": "VIC",
+            "error": None,
+            "meeting_count": 1,
+        }
+    ]
@@ -0,0 +1,101 @@
+"""Tests for the streaming PDF download and text extraction.
+
+The pipeline must find exactly the text the old write-then-reread path did,
+leave nothing on disk, and refuse downloads that are too large.
+"""
+
+import glob
+import http.server
+import os
+import tempfile
+import threading
+
+import fitz
+import pytest
+
+from aus_council_scrapers.constants import COUNCIL_HOUSING_REGEX
+from aus_council_scrapers.utils import (
+    PdfTooLarge,
+    extract_keywords,
+    open_pdf,
+    page_texts,
+)
+
+PAGES = [
+    "Item 4.1 Planning application for a residential development",
+    "Dwellings: 12 apartments, three storeys.\nHeritage overlay applies.",
+    "Item 4.2 Housing strategy update",
+]
+
+
+def _make_pdf() -> bytes:
+    doc = fitz.open()
+    for text in PAGES:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+PDF = _make_pdf()
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        if self.path != "/chunked":
+            self.send_header("Content-Length", str(len(PDF)))
+        self.end_headers()
+        self.wfile.write(PDF)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _old_read(data: bytes) -> str:
+    """What `read_pdf` produced from the file `download_pdf` wrote."""
+    doc = fitz.open(stream=data, filetype="pdf")
+    text = ""
+    for page in doc:
+        text += page.get_text()
+    return text
+
+
+@pytest.mark.parametrize("in_memory_bytes", [len(PDF) * 2, 1024])
+def test_text_matches_the_file_based_pipeline(server, in_memory_bytes):
+    with open_pdf(server + "/doc.pdf", in_memory_bytes=in_memory_bytes) as doc:
+        pages = list(page_texts(doc))
+
+    assert "".join(pages) == _old_read(PDF)
+    assert extract_keywords(COUNCIL_HOUSING_REGEX, pages) == extract_keywords(
+        COUNCIL_HOUSING_REGEX, _old_read(PDF)
+    )
+
+
+def test_large_pdfs_spool_to_a_private_file_that_is_removed(server):
+    pattern = os.path.join(tempfile.gettempdir(), "*.pdf")
+    before = set(glob.glob(pattern))
+
+    with open_pdf(server + "/doc.pdf", in_memory_bytes=1024) as doc:
+        assert doc.name and os.path.exists(doc.name)
+        spooled = doc.name
+
+    assert not os.path.exists(spooled)
+    assert set(glob.glob(pattern)) == before
+
+
+@pytest.mark.parametrize("path", ["/declared.pdf", "/chunked"])
+def test_oversized_downloads_are_refused(server, path):
+    with pytest.raises(PdfTooLarge):
+        with open_pdf(server + path, max_bytes=len(PDF) // 2):
+            pass
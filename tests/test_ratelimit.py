@@ -0,0 +1,109 @@
+"""Tests for the process-wide per-host request budget.
+
+Councils sharing a platform host must share one budget however many fetchers
+and threads are hitting it, and the dispatcher must not start two scrapers
+against the same host while other hosts sit idle.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aus_council_scrapers.async_fetch import AsyncFetcher
+from aus_council_scrapers.base import BaseScraper, DefaultFetcher
+from aus_council_scrapers.main import dispatch_by_host
+from aus_council_scrapers.ratelimit import HostScheduler, shared_scheduler
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_back_to_back_requests_wait_for_the_bucket():
+    clock = _FakeClock()
+    scheduler = HostScheduler(2.0, monotonic=clock)
+
+    assert scheduler.reserve("https://a.example/one") == 0.0
+    second = scheduler.reserve("https://a.example/two")
+    # One token costs between 0.75 and 1.25 intervals.
+    assert 0.75 * 2.0 <= second <= 1.25 * 2.0
+
+
+def test_hosts_have_separate_budgets():
+    scheduler = HostScheduler(2.0, monotonic=_FakeClock())
+
+    scheduler.reserve("https://a.example/")
+    assert scheduler.reserve("https://b.example/") == 0.0
+    assert scheduler.ready_in("b.example") > 0
+    assert scheduler.ready_in("c.example") == 0.0
+
+
+def test_idle_hosts_refill_up_to_burst():
+    clock = _FakeClock()
+    scheduler = HostScheduler(1.0, burst=3, monotonic=clock)
+
+    for _ in range(3):
+        scheduler.reserve("https://a.example/")
+    clock.now = 100.0
+
+    waits = [scheduler.reserve("https://a.example/") for _ in range(2)]
+    assert waits[0] == 0.0
+    # The refill is capped at `burst`, so the idle time is not banked forever.
+    assert scheduler.ready_in("a.example") <= 1.25
+
+
+def test_default_fetchers_share_one_budget():
+    first, second = DefaultFetcher(), DefaultFetcher()
+    scheduler = shared_scheduler()
+
+    assert first.scheduler is scheduler
+    assert second.scheduler is scheduler
+    assert AsyncFetcher().scheduler is scheduler
+    assert DefaultFetcher(fetch_delay=0).scheduler is not scheduler
+
+
+class _HostScraper(BaseScraper):
+    def __init__(self, name, host):
+        super().__init__(name, "VIC", f"https://{host}")
+
+    def scraper(self):
+        return []
+
+
+def test_dispatch_never_runs_two_scrapers_on_one_host():
+    scrapers = [
+        _HostScraper("a1", "shared.example"),
+        _HostScraper("a2", "shared.example"),
+        _HostScraper("b", "other.example"),
+        _HostScraper("c", "third.example"),
+    ]
+    active: dict[str, int] = {}
+    overlaps = []
+    started = []
+    lock = threading.Lock()
+
+    def work(scraper):
+        with lock:
+            started.append(scraper.council_name)
+            active[scraper.host] = active.get(scraper.host, 0) + 1
+            if active[scraper.host] > 1:
+                overlaps.append(scraper.host)
+        time.sleep(0.05)
+        with lock:
+            active[scraper.host] -= 1
+        return scraper.council_name
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        finished = [
+            fut.result() for _, fut in dispatch_by_host(executor, scrapers, 3, work)
+        ]
+
+    assert sorted(finished) == ["a1", "a2", "b", "c"]
+    assert overlaps == []
+    # With a1 holding the shared host, the idle hosts go ahead of a2.
+    assert started.index("a2") > started.index("b")
+    assert started.index("a2") > started.index("c")
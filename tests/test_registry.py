@@ -0,0 +1,64 @@
+"""Tests for the lazy scraper registry and its manifest.
+
+Selecting one council must not import or build the others, and the manifest
+that makes that possible must never fall behind the scrapers it describes.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+from aus_council_scrapers.base import MANIFEST_PATH, SCRAPER_REGISTRY
+from scripts.generate_manifest import build_manifest, render
+
+
+def test_manifest_is_up_to_date():
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        committed = f.read()
+    assert committed == render(build_manifest()), (
+        "aus_council_scrapers/scrapers/manifest.json is stale. "
+        "Regenerate it with: python scripts/generate_manifest.py"
+    )
+
+
+def test_select_matches_filtering_the_whole_registry():
+    everything = list(SCRAPER_REGISTRY.values())
+
+    for council, state in [("banyule", None), (None, "nsw"), ("inner_west", "NSW")]:
+        expected = {
+            s.council_name
+            for s in everything
+            if (not state or s.state.lower() == state.lower())
+            and (not council or s.council_name == council)
+        }
+        selected = SCRAPER_REGISTRY.select(council=council, state=state)
+        assert {s.council_name for s in selected} == expected
+
+
+def test_selecting_one_council_builds_only_that_scraper():
+    # A fresh interpreter, since this one has imported every scraper.
+    script = textwrap.dedent(
+        """
+        import sys
+        from aus_council_scrapers.base import SCRAPER_REGISTRY, BaseScraper
+
+        built = []
+        original = BaseScraper.__init__
+        def counting_init(self, *args, **kwargs):
+            built.append(type(self).__name__)
+            original(self, *args, **kwargs)
+        BaseScraper.__init__ = counting_init
+
+        [scraper] = SCRAPER_REGISTRY.select(council="darebin")
+        loaded = [m for m in sys.modules if m.startswith("aus_council_scrapers.scrapers.")]
+        print(built, sorted(loaded))
+        """
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert out == (
+        "['DarebinScraper'] ['aus_council_scrapers.scrapers.vic', "
+        "'aus_council_scrapers.scrapers.vic.darebin']"
+    )
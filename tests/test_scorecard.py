@@ -0,0 +1,94 @@
+"""Tests for the scorecard's assessment cache."""
+
+import json
+
+import pytest
+
+from aus_council_scrapers import clock
+from scripts import scorecard
+
+ASSESS_FILE = scorecard.assess_file
+
+
+def _meeting(date, **overrides):
+    row = {
+        "name": "Ordinary Council",
+        "date": date,
+        "time": None,
+        "location": None,
+        "webpage_url": "https://example.infocouncil.biz/",
+        "agenda_url": f"https://example.infocouncil.biz/{date}-AGN.PDF",
+        "minutes_url": f"https://example.infocouncil.biz/{date}-MIN.PDF",
+        "agenda_html_url": None,
+        "minutes_html_url": None,
+        "download_url": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def fixtures(tmp_path, monkeypatch):
+    cases = tmp_path / "test-cases"
+    cases.mkdir()
+
+    def write(slug, meetings):
+        (cases / f"{slug}-result.json").write_text(json.dumps(meetings))
+
+    write("alpha", [_meeting(f"01 Mar {y}") for y in (2024, 2025, 2026)])
+    write("beta", [_meeting("01 Mar 2026", agenda_url="/relative.pdf")])
+    write("gamma", _meeting("01 Mar 2026"))
+    monkeypatch.setattr(scorecard, "CASSETTE_GLOB", str(cases / "*-result.json"))
+
+    assessed = []
+    assess_file = scorecard.assess_file
+
+    def counting(path):
+        assessed.append(path.rsplit("/", 1)[-1].replace("-result.json", ""))
+        return assess_file(path)
+
+    monkeypatch.setattr(scorecard, "assess_file", counting)
+    with clock.frozen("2026-08-20"):
+        yield write, str(tmp_path / "cache" / "scorecard.json"), assessed
+
+
+def test_only_changed_fixtures_are_assessed_again(fixtures):
+    write, cache, assessed = fixtures
+    first = scorecard.load_recorded(cache, workers=0)
+    assert sorted(assessed) == ["alpha", "beta", "gamma"]
+    assert [r.status for r in first] == ["complete", "broken", "partial"]
+
+    assessed.clear()
+    again = scorecard.load_recorded(cache, workers=0)
+    assert assessed == []
+    assert [vars(r) for r in again] == [vars(r) for r in first]
+
+    write("beta", [_meeting("01 Mar 2026")])
+    rows = scorecard.load_recorded(cache, workers=0)
+    assert assessed == ["beta"]
+    assert rows[1].invariants == []
+
+
+def test_a_rule_change_or_a_new_year_drops_the_cache(fixtures, monkeypatch):
+    _, cache, assessed = fixtures
+    scorecard.load_recorded(cache, workers=0)
+
+    assessed.clear()
+    with clock.frozen("2027-01-02"):
+        rows = scorecard.load_recorded(cache, workers=0)
+    assert len(assessed) == 3
+    assert "nothing newer than 2026" in rows[0].coverage
+
+    assessed.clear()
+    monkeypatch.setattr(scorecard, "rules_version", lambda: "edited rules")
+    scorecard.load_recorded(cache, workers=0)
+    assert len(assessed) == 3
+
+
+def test_parallel_and_uncached_assessments_agree(fixtures, monkeypatch):
+    _, cache, _ = fixtures
+    # Worker processes look the function up by name.
+    monkeypatch.setattr(scorecard, "assess_file", ASSESS_FILE)
+    parallel = scorecard.load_recorded(cache, workers=2)
+    inline = scorecard.load_recorded(None, workers=0)
+    assert [vars(r) for r in parallel] == [vars(r) for r in inline]
@@ -0,0 +1,70 @@
+"""Tests for ScraperReturn's compact representation."""
+
+import pickle
+
+import pytest
+from bs4 import BeautifulSoup
+
+from aus_council_scrapers.base import ScraperReturn
+
+
+def _meeting(**overrides) -> ScraperReturn:
+    fields = dict(
+        name="Council Meeting",
+        date="15 January 2026",
+        time="6:30 PM",
+        webpage_url="https://example.com/meetings",
+        agenda_url="https://example.com/agenda.pdf",
+        location="Council Chambers",
+    )
+    fields.update(overrides)
+    return ScraperReturn(**fields)
+
+
+def test_results_have_no_instance_dict():
+    result = _meeting()
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.state = "VIC"
+
+
+def test_repeated_strings_are_shared_and_soup_strings_let_go():
+    soup = BeautifulSoup("<td>Council Meeting</td>", "html.parser")
+    from_page = soup.td.string
+    first = _meeting(name=from_page, webpage_url="".join(["https://", "a.example"]))
+    second = _meeting(name="Council " + "Meeting", webpage_url="https://a.example")
+
+    assert type(first.name) is str
+    assert first.name is second.name
+    assert first.webpage_url is second.webpage_url
+    assert first.time is second.time
+
+
+def test_equality_and_hashing_follow_the_wire_fields():
+    first, second = _meeting(), _meeting()
+    # Parsed caches are not part of a result's identity.
+    first.cleaned_date
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second, _meeting(minutes_url="https://example.com/m.pdf")}) == 2
+    assert first != _meeting(time="7:00 PM")
+    assert first != first.to_dict()
+
+
+def test_the_wire_format_is_unchanged():
+    result = _meeting(minutes_url="https://example.com/minutes.pdf")
+    data = result.to_dict()
+    assert list(data) == [
+        "name",
+        "date",
+        "time",
+        "location",
+        "webpage_url",
+        "download_url",
+        "agenda_url",
+        "minutes_url",
+        "agenda_html_url",
+        "minutes_html_url",
+    ]
+    assert ScraperReturn.from_dict(data) == result
+    assert pickle.loads(pickle.dumps(result)) == result